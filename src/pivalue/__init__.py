@@ -3,24 +3,54 @@ PiValue - Mathematical approaches to calculate Pi.
 
 This package provides multiple algorithms for calculating the value of Pi,
 useful for benchmarking computational performance and comparing mathematical approaches.
+
+The algorithm modules and helpers below are imported on first access, which
+keeps short command-line runs fast.
 """
 
 __version__ = "2.0.0"
 __author__ = "Sagar Das"
 
-from pivalue.algorithms import (
-    bailey,
-    euler,
-    leibniz,
-    liu_hui,
-    machin,
-    mandelbrot,
-    ramanujan,
-    relative_prime,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pivalue.algorithms import (
+        agm,
+        bailey,
+        chudnovsky,
+        euler,
+        leibniz,
+        liu_hui,
+        machin,
+        mandelbrot,
+        ramanujan,
+        relative_prime,
+    )
+    from pivalue.dispatch import compute
+    from pivalue.stream import stream_digits
+
+# Module each lazily imported name lives in
+_LAZY = {
+    "agm": "pivalue.algorithms.agm",
+    "bailey": "pivalue.algorithms.bailey",
+    "chudnovsky": "pivalue.algorithms.chudnovsky",
+    "compute": "pivalue.dispatch",
+    "euler": "pivalue.algorithms.euler",
+    "leibniz": "pivalue.algorithms.leibniz",
+    "liu_hui": "pivalue.algorithms.liu_hui",
+    "machin": "pivalue.algorithms.machin",
+    "mandelbrot": "pivalue.algorithms.mandelbrot",
+    "ramanujan": "pivalue.algorithms.ramanujan",
+    "relative_prime": "pivalue.algorithms.relative_prime",
+    "stream_digits": "pivalue.stream",
+}
 
 __all__ = [
+    "agm",
     "bailey",
+    "chudnovsky",
+    "compute",
     "euler",
     "leibniz",
     "liu_hui",
@@ -28,4 +58,24 @@ __all__ = [
     "mandelbrot",
     "ramanujan",
     "relative_prime",
+    "stream_digits",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import an algorithm module or helper on first access.
+
+    Raises:
+        AttributeError: If name is not exported by the package.
+    """
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY[name])
+    value = module if module.__name__.endswith(f".{name}") else getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted([*globals(), *__all__])
@@ -1,18 +1,30 @@
-"""Algorithm implementations for calculating Pi."""
-
-from pivalue.algorithms import (
-    bailey,
-    euler,
-    leibniz,
-    liu_hui,
-    machin,
-    mandelbrot,
-    ramanujan,
-    relative_prime,
-)
+"""Algorithm implementations for calculating Pi.
+
+The modules are imported on first access, so importing the package does not
+pay for all of them (see pivalue.registry).
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pivalue.algorithms import (
+        agm,
+        bailey,
+        chudnovsky,
+        euler,
+        leibniz,
+        liu_hui,
+        machin,
+        mandelbrot,
+        ramanujan,
+        relative_prime,
+    )
 
 __all__ = [
+    "agm",
     "bailey",
+    "chudnovsky",
     "euler",
     "leibniz",
     "liu_hui",
@@ -21,3 +33,19 @@ __all__ = [
     "ramanujan",
     "relative_prime",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import an algorithm module on first access.
+
+    Raises:
+        AttributeError: If name is not an algorithm module.
+    """
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted([*globals(), *__all__])
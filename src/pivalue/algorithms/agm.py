@@ -0,0 +1,160 @@
+"""
+Gauss-Legendre (Salamin-Brent) algorithm for calculating Pi.
+
+The algorithm is built on the arithmetic-geometric mean (AGM) of 1 and 1/√2:
+
+a₀ = 1, b₀ = 1/√2, t₀ = 1/4, p₀ = 1
+aₙ₊₁ = (aₙ + bₙ)/2, bₙ₊₁ = √(aₙbₙ), tₙ₊₁ = tₙ - pₙ(aₙ - aₙ₊₁)², pₙ₊₁ = 2pₙ
+π ≈ (aₙ + bₙ)² / (4tₙ)
+
+Convergence is quadratic: every iteration doubles the number of correct
+digits, so about log2(digits) iterations suffice. Each iteration costs a
+full-precision square root and multiplication, which makes the running time
+a direct measure of big-number multiplication speed.
+
+For more information, visit:
+https://en.wikipedia.org/wiki/Gauss%E2%80%93Legendre_algorithm
+"""
+
+import math
+import time
+from decimal import MAX_EMAX, MIN_EMIN, Decimal, localcontext
+from typing import Dict, Any
+
+from pivalue.hostinfo import platform_name
+from pivalue.newton import inverse_sqrt
+
+# Extra digits carried through the iteration, the reciprocals and the roots
+GUARD_DIGITS = 10
+
+# Run time on one core, seconds ≈ COST_COEFFICIENT × digits^COST_EXPONENT
+COST_COEFFICIENT = 1.3e-7
+COST_EXPONENT = 1.41
+
+
+def reciprocal(x: Decimal, precision: int) -> Decimal:
+    """
+    Calculate 1/x with Newton's iteration, doubling the precision each step.
+
+    Args:
+        x: The (nonzero) value to invert.
+        precision: Number of significant digits required.
+
+    Returns:
+        1/x to the requested precision.
+    """
+    steps = []
+    while precision > 30:
+        steps.append(precision)
+        precision = precision // 2 + GUARD_DIGITS
+
+    with localcontext() as ctx:
+        ctx.Emax = MAX_EMAX
+        ctx.Emin = MIN_EMIN
+        ctx.prec = 40
+        y = 1 / x
+        for step in reversed(steps):
+            ctx.prec = step
+            # Unary plus rounds x to the working precision of this step
+            y += y * (1 - +x * y)
+
+    return y
+
+
+def sqrt(x: Decimal, precision: int) -> Decimal:
+    """
+    Calculate √x as x × (1/√x), with the inverse square root by Newton's iteration.
+
+    Args:
+        x: The (positive) value to take the square root of.
+        precision: Number of significant digits required.
+
+    Returns:
+        √x to the requested precision.
+    """
+    with localcontext() as ctx:
+        ctx.prec = precision
+        return x * inverse_sqrt(x, precision)
+
+
+def plan(digits: int) -> Dict[str, Any]:
+    """
+    Choose the arguments of calculate() for a number of correct decimal places.
+
+    The iteration count doubles the correct digits each time and follows from
+    digits, so only digits is needed.
+
+    Args:
+        digits: Number of correct decimal places required.
+
+    Returns:
+        Dictionary containing:
+            - params: Keyword arguments for calculate()
+            - seconds: Estimated run time on one core
+    """
+    return {
+        "params": {"digits": digits},
+        "seconds": COST_COEFFICIENT * digits**COST_EXPONENT,
+    }
+
+
+def calculate(digits: int = 1000) -> Dict[str, Any]:
+    """
+    Calculate Pi using the Gauss-Legendre algorithm.
+
+    Args:
+        digits: Number of decimal places to calculate (default: 1000).
+
+    Returns:
+        Dictionary containing:
+            - pi: The calculated value of Pi (as string for precision)
+            - iterations: Number of AGM iterations performed
+            - time_seconds: Time taken in seconds
+            - method: Name of the method
+            - platform: Platform information
+            - digits: Number of decimal places calculated
+    """
+    start_time = time.perf_counter()
+
+    precision = digits + GUARD_DIGITS
+    num_iterations = max(math.ceil(math.log2(precision)), 1)
+
+    with localcontext() as ctx:
+        ctx.Emax = MAX_EMAX
+        ctx.Emin = MIN_EMIN
+        ctx.prec = precision
+
+        a = Decimal(1)
+        b = inverse_sqrt(2, precision)
+        t = Decimal("0.25")
+        p = 1
+
+        for _ in range(num_iterations):
+            a_next = (a + b) / 2
+            b = sqrt(a * b, precision)
+            t -= p * (a - a_next) ** 2
+            a = a_next
+            p *= 2
+
+        pi = (a + b) ** 2 / 4 * reciprocal(t, precision)
+
+    elapsed_time = time.perf_counter() - start_time
+
+    return {
+        "pi": str(pi)[: digits + 2],
+        "iterations": num_iterations,
+        "time_seconds": elapsed_time,
+        "method": "Gauss-Legendre (AGM)",
+        "platform": platform_name(),
+        "digits": digits,
+    }
+
+
+if __name__ == "__main__":
+    result = calculate()
+    print(f"Method: {result['method']}")
+    print(f"Platform: {result['platform']}")
+    print(f"Digits: {result['digits']}")
+    print(f"Pi ≈ {result['pi']}")
+    print(f"Iterations: {result['iterations']}")
+    print(f"Time: {result['time_seconds']:.6f} seconds")
@@ -10,18 +10,74 @@ This formula is notable for allowing the calculation of arbitrary hexadecimal
 digits of π without calculating the preceding digits.
 """
 
-import platform
+import math
 import time
-from decimal import Decimal
-from typing import Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from decimal import MAX_EMAX, MIN_EMIN, Decimal, localcontext
+from typing import Dict, Any, Optional
 
+from pivalue.hostinfo import platform_name
+from pivalue.series import RationalSeries, evaluate
 
-def calculate(num_iterations: int = 100) -> Dict[str, Any]:
+# Number of correct digits contributed by each term of the series
+DIGITS_PER_TERM = math.log10(16)
+
+# Σ 1/16^k × (120k² + 151k + 47) / (512k⁴ + 1024k³ + 712k² + 194k + 15),
+# the four BBP fractions over a common denominator
+BBP_SERIES = RationalSeries(p=(1,), q=(16,), a=(47, 151, 120), b=(15, 194, 712, 1024, 512))
+
+# Fractional bits carried by the fixed-point digit extraction
+FRACTION_BITS = 128
+
+# Hexadecimal digits produced by one digit-extraction evaluation
+HEX_DIGITS_PER_BLOCK = 16
+
+# Extra digits of precision planned beyond the requested correct digits
+GUARD_DIGITS = 10
+
+# Run time on one core, seconds ≈ COST_COEFFICIENT × digits^COST_EXPONENT
+COST_COEFFICIENT = 4.6e-7
+COST_EXPONENT = 1.38
+
+
+def plan(digits: int) -> Dict[str, Any]:
+    """
+    Choose the arguments of calculate() for a number of correct decimal places.
+
+    Always plans the exact binary-splitting mode, padded with guard digits;
+    the floating-point mode stops at about 16 digits.
+
+    Args:
+        digits: Number of correct decimal places required.
+
+    Returns:
+        Dictionary containing:
+            - params: Keyword arguments for calculate()
+            - seconds: Estimated run time on one core
+    """
+    return {
+        "params": {"precision": digits + GUARD_DIGITS},
+        "seconds": COST_COEFFICIENT * digits**COST_EXPONENT,
+    }
+
+
+def calculate(
+    num_iterations: Optional[int] = None, precision: Optional[int] = None, workers: int = 1
+) -> Dict[str, Any]:
     """
     Calculate Pi using the Bailey-Borwein-Plouffe formula.
 
+    Without a precision the terms are summed in binary floating point, which
+    saturates at about 16 digits. With a precision the sum is evaluated as an
+    exact fraction by binary splitting, so every requested digit is correct.
+
     Args:
-        num_iterations: Number of iterations to perform.
+        num_iterations: Number of iterations to perform (default: 100, or
+            derived from precision at about 1.2 digits per term).
+        precision: Number of significant digits to calculate (default: None,
+            use floating point).
+        workers: Number of worker processes for the binary splitting in
+            precision mode (default: 1).
 
     Returns:
         Dictionary containing:
@@ -30,16 +86,32 @@ def calculate(num_iterations: int = 100) -> Dict[str, Any]:
             - time_seconds: Time taken in seconds
             - method: Name of the method
             - platform: Platform information
+            - precision: Number of significant digits calculated (None for floating point)
     """
     start_time = time.perf_counter()
 
-    pi = Decimal("0.0")
+    if precision is None:
+        if num_iterations is None:
+            num_iterations = 100
+
+        pi = Decimal("0.0")
+
+        for i in range(num_iterations + 1):
+            term = (1 / 16**i) * (
+                (4 / (8 * i + 1)) - (2 / (8 * i + 4)) - (1 / (8 * i + 5)) - (1 / (8 * i + 6))
+            )
+            pi += Decimal(term)
+    else:
+        if num_iterations is None:
+            num_iterations = int(precision / DIGITS_PER_TERM) + 1
 
-    for i in range(num_iterations + 1):
-        term = (1 / 16**i) * (
-            (4 / (8 * i + 1)) - (2 / (8 * i + 4)) - (1 / (8 * i + 5)) - (1 / (8 * i + 6))
-        )
-        pi += Decimal(term)
+        numerator, denominator = evaluate(BBP_SERIES, num_iterations + 1, workers)
+
+        with localcontext() as ctx:
+            ctx.Emax = MAX_EMAX
+            ctx.Emin = MIN_EMIN
+            ctx.prec = precision
+            pi = numerator / denominator
 
     elapsed_time = time.perf_counter() - start_time
 
@@ -48,10 +120,102 @@ def calculate(num_iterations: int = 100) -> Dict[str, Any]:
         "iterations": num_iterations,
         "time_seconds": elapsed_time,
         "method": "Bailey-Borwein-Plouffe (BBP)",
-        "platform": platform.platform(),
+        "platform": platform_name(),
+        "precision": precision,
     }
 
 
+def _series_fraction(j: int, d: int) -> int:
+    """
+    Calculate frac(16^d × Σ 1/(16^k (8k+j))) as a FRACTION_BITS fixed-point value.
+
+    The terms with k <= d use modular exponentiation so that only the
+    fractional part of each term is kept; the terms with k > d form a short
+    tail that vanishes after about FRACTION_BITS / 4 terms.
+
+    Args:
+        j: Offset in the denominator 8k + j.
+        d: Power of 16 to shift the series by.
+
+    Returns:
+        The fractional part scaled by 2^FRACTION_BITS.
+    """
+    mask = (1 << FRACTION_BITS) - 1
+    total = 0
+
+    for k in range(d + 1):
+        denom = 8 * k + j
+        total += (pow(16, d - k, denom) << FRACTION_BITS) // denom
+
+    k = d + 1
+    shift = FRACTION_BITS - 4
+    while shift > 0:
+        total += (1 << shift) // (8 * k + j)
+        k += 1
+        shift -= 4
+
+    return total & mask
+
+
+def _hex_block(position: int) -> str:
+    """
+    Calculate HEX_DIGITS_PER_BLOCK hexadecimal digits of Pi starting at position.
+
+    Args:
+        position: Position of the first digit after the hexadecimal point (1-based).
+
+    Returns:
+        The digits as an uppercase hexadecimal string.
+    """
+    d = position - 1
+    x = (
+        4 * _series_fraction(1, d)
+        - 2 * _series_fraction(4, d)
+        - _series_fraction(5, d)
+        - _series_fraction(6, d)
+    ) & ((1 << FRACTION_BITS) - 1)
+
+    block = x >> (FRACTION_BITS - 4 * HEX_DIGITS_PER_BLOCK)
+    return f"{block:0{HEX_DIGITS_PER_BLOCK}X}"
+
+
+def hex_digits(position: int, count: int = 8, workers: Optional[int] = None) -> str:
+    """
+    Calculate hexadecimal digits of Pi without calculating the preceding digits.
+
+    Uses the BBP digit-extraction algorithm: the work for a digit at position n
+    grows linearly with n and needs only machine-sized modular arithmetic, so
+    the millionth digit can be checked without the 999,999 digits before it.
+
+    Args:
+        position: Position of the first digit after the hexadecimal point
+            (1-based, so position 1 is the "2" in 3.243F6A88...).
+        count: Number of consecutive digits to return (default: 8).
+        workers: Number of worker processes to spread the digit blocks across
+            (default: compute in the calling process).
+
+    Returns:
+        The digits as an uppercase hexadecimal string.
+
+    Raises:
+        ValueError: If position is less than 1 or count is negative.
+    """
+    if position < 1:
+        raise ValueError("position must be at least 1")
+    if count < 0:
+        raise ValueError("count must not be negative")
+
+    starts = list(range(position, position + count, HEX_DIGITS_PER_BLOCK))
+
+    if workers is not None and workers > 1 and len(starts) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            blocks = list(executor.map(_hex_block, starts))
+    else:
+        blocks = [_hex_block(start) for start in starts]
+
+    return "".join(blocks)[:count]
+
+
 if __name__ == "__main__":
     result = calculate()
     print(f"Method: {result['method']}")
@@ -0,0 +1,118 @@
+"""
+Chudnovsky algorithm for calculating Pi.
+
+In 1988 David and Gregory Chudnovsky published a Ramanujan-type series for π:
+
+1/π = 12 × Σ(k=0 to ∞) [(-1)^k (6k)! (13591409 + 545140134k)] / [(3k)! (k!)^3 640320^(3k+3/2)]
+
+Each term adds about 14 correct digits. The series is evaluated with binary
+splitting: the partial sum is kept as an exact fraction whose numerator and
+denominator are built from balanced products, so the cost is dominated by a
+handful of very large multiplications instead of one division per term. This
+is the method used by y-cruncher for most of the modern Pi world records.
+
+For more information, visit:
+https://en.wikipedia.org/wiki/Chudnovsky_algorithm
+"""
+
+import math
+import time
+from decimal import MAX_EMAX, MIN_EMIN, Decimal, localcontext
+from typing import Dict, Any
+
+from pivalue.hostinfo import platform_name
+from pivalue.newton import inverse_sqrt
+from pivalue.series import RationalSeries, evaluate
+
+# Number of correct digits contributed by each term of the series
+DIGITS_PER_TERM = math.log10(640320**3 / 1728)
+
+# 640320³ / 24, the per-term growth of the denominator
+C3_OVER_24 = 640320**3 // 24
+
+# Extra digits carried through the final division and square root
+GUARD_DIGITS = 10
+
+# Run time on one core, seconds ≈ COST_COEFFICIENT × digits^COST_EXPONENT
+COST_COEFFICIENT = 1.2e-7
+COST_EXPONENT = 1.25
+
+# Term ratio p(k)/q(k) = -(6k-5)(2k-1)(6k-1) / (k³ × 640320³/24)
+CHUDNOVSKY_SERIES = RationalSeries(
+    p=(5, -46, 108, -72),
+    q=(0, 0, 0, C3_OVER_24),
+    a=(13591409, 545140134),
+)
+
+
+def plan(digits: int) -> Dict[str, Any]:
+    """
+    Choose the arguments of calculate() for a number of correct decimal places.
+
+    calculate() already carries guard digits, so digits is passed through.
+
+    Args:
+        digits: Number of correct decimal places required.
+
+    Returns:
+        Dictionary containing:
+            - params: Keyword arguments for calculate()
+            - seconds: Estimated run time on one core
+    """
+    return {
+        "params": {"digits": digits},
+        "seconds": COST_COEFFICIENT * digits**COST_EXPONENT,
+    }
+
+
+def calculate(digits: int = 1000, workers: int = 1) -> Dict[str, Any]:
+    """
+    Calculate Pi using the Chudnovsky algorithm.
+
+    Args:
+        digits: Number of decimal places to calculate (default: 1000).
+        workers: Number of worker processes for the binary splitting (default: 1).
+
+    Returns:
+        Dictionary containing:
+            - pi: The calculated value of Pi (as string for precision)
+            - iterations: Number of series terms summed
+            - time_seconds: Time taken in seconds
+            - method: Name of the method
+            - platform: Platform information
+            - digits: Number of decimal places calculated
+    """
+    start_time = time.perf_counter()
+
+    num_terms = int(digits / DIGITS_PER_TERM) + 2
+    precision = digits + GUARD_DIGITS
+
+    t, q = evaluate(CHUDNOVSKY_SERIES, num_terms, workers)
+
+    with localcontext() as ctx:
+        ctx.Emax = MAX_EMAX
+        ctx.Emin = MIN_EMIN
+        ctx.prec = precision
+        # 426880 × √10005 = 426880 × 10005 / √10005
+        pi = Decimal(426880 * 10005) * inverse_sqrt(10005, precision) * q / t
+
+    elapsed_time = time.perf_counter() - start_time
+
+    return {
+        "pi": str(pi)[: digits + 2],
+        "iterations": num_terms,
+        "time_seconds": elapsed_time,
+        "method": "Chudnovsky Algorithm",
+        "platform": platform_name(),
+        "digits": digits,
+    }
+
+
+if __name__ == "__main__":
+    result = calculate()
+    print(f"Method: {result['method']}")
+    print(f"Platform: {result['platform']}")
+    print(f"Digits: {result['digits']}")
+    print(f"Pi ≈ {result['pi']}")
+    print(f"Iterations: {result['iterations']}")
+    print(f"Time: {result['time_seconds']:.6f} seconds")
@@ -7,38 +7,64 @@ For more information, visit:
 http://mathworld.wolfram.com/ConvergenceImprovement.html
 """
 
-import platform
+import math
 import time
-from decimal import Decimal
-from functools import lru_cache
-from typing import Dict, Any
+from decimal import MAX_EMAX, MIN_EMIN, localcontext
+from typing import Dict, Any, Optional
 
+from pivalue.hostinfo import platform_name
+from pivalue.series import RationalSeries, evaluate
 
-@lru_cache(maxsize=None)
-def get_factorial(n: int) -> int:
+# Number of correct digits contributed by each term (the term ratio tends to 1/2)
+DIGITS_PER_TERM = math.log10(2)
+
+# 2 × Σ 2^i (i!)² / (2i+1)!, with term ratio i / (2i+1)
+EULER_SERIES = RationalSeries(p=(0, 1), q=(1, 2), a=(2,))
+
+# Extra digits of precision planned beyond the requested correct digits
+GUARD_DIGITS = 10
+
+# Run time on one core, seconds ≈ COST_COEFFICIENT × digits^COST_EXPONENT
+COST_COEFFICIENT = 3.0e-6
+COST_EXPONENT = 1.21
+
+
+def plan(digits: int) -> Dict[str, Any]:
     """
-    Calculate factorial of n with memoization.
+    Choose the arguments of calculate() for a number of correct decimal places.
+
+    At about 0.3 digits per term this is the slowest of the series, but it
+    is exact, so only guard digits are added to the precision.
 
     Args:
-        n: The number to calculate factorial for.
+        digits: Number of correct decimal places required.
 
     Returns:
-        The factorial of n.
+        Dictionary containing:
+            - params: Keyword arguments for calculate()
+            - seconds: Estimated run time on one core
     """
-    if n == 0:
-        return 1
-    factorial = 1
-    for i in range(1, n + 1):
-        factorial *= i
-    return factorial
+    return {
+        "params": {"precision": digits + GUARD_DIGITS},
+        "seconds": COST_COEFFICIENT * digits**COST_EXPONENT,
+    }
 
 
-def calculate(num_iterations: int = 2000) -> Dict[str, Any]:
+def calculate(
+    num_iterations: Optional[int] = None, precision: int = 28, workers: int = 1
+) -> Dict[str, Any]:
     """
     Calculate Pi using Euler convergence method.
 
+    The series π = 2 × Σ 2^i (i!)² / (2i+1)! is evaluated as an exact fraction
+    by binary splitting. Each term is derived from the previous one with the
+    ratio i / (2i+1), so no factorials are computed or cached.
+
     Args:
-        num_iterations: Number of iterations to perform.
+        num_iterations: Number of iterations to perform (default: derived from
+            precision at about 0.3 digits per term).
+        precision: Number of significant digits to calculate (default: 28).
+        workers: Number of worker processes for the binary splitting (default: 1).
 
     Returns:
         Dictionary containing:
@@ -47,17 +73,21 @@ def calculate(num_iterations: int = 2000) -> Dict[str, Any]:
             - time_seconds: Time taken in seconds
             - method: Name of the method
             - platform: Platform information
+            - precision: Number of significant digits calculated
     """
     start_time = time.perf_counter()
 
-    val = Decimal("0.0")
+    if num_iterations is None:
+        num_iterations = int(precision / DIGITS_PER_TERM) + 1
+
+    numerator, denominator = evaluate(EULER_SERIES, num_iterations + 1, workers)
 
-    for i in range(0, num_iterations + 1):
-        numerator = pow(2, i) * pow(get_factorial(i), 2)
-        denominator = get_factorial(2 * i + 1)
-        val += Decimal(numerator) / Decimal(denominator)
+    with localcontext() as ctx:
+        ctx.Emax = MAX_EMAX
+        ctx.Emin = MIN_EMIN
+        ctx.prec = precision
+        pi = numerator / denominator
 
-    pi = Decimal(2) * val
     elapsed_time = time.perf_counter() - start_time
 
     return {
@@ -65,7 +95,8 @@ def calculate(num_iterations: int = 2000) -> Dict[str, Any]:
         "iterations": num_iterations,
         "time_seconds": elapsed_time,
         "method": "Euler Convergence",
-        "platform": platform.platform(),
+        "platform": platform_name(),
+        "precision": precision,
     }
 
 
@@ -8,17 +8,210 @@ For more information, visit:
 https://en.wikipedia.org/wiki/Leibniz_formula_for_π
 """
 
-import platform
+import math
 import time
-from typing import Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 
+from pivalue.hostinfo import platform_name
 
-def calculate(num_iterations: int = 400000) -> Dict[str, Any]:
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+# Number of terms summed per chunk; keeps memory flat for any num_iterations
+CHUNK_SIZE = 1 << 16
+
+BACKENDS = ("auto", "numpy", "python")
+
+# Blocks handed to each worker process, for load balancing
+BLOCKS_PER_WORKER = 4
+
+# Measured cost of one term with the NumPy and the pure-Python backends
+SECONDS_PER_TERM = {"numpy": 6.3e-9, "python": 1.5e-7}
+
+# Beyond this the float sum itself limits the accuracy
+MAX_PLAN_DIGITS = 12
+
+
+def _chunk_sum_python(start: int, stop: int) -> float:
+    """
+    Sum the terms start..stop-1 of the series with exact float summation.
+
+    Args:
+        start: Index of the first term.
+        stop: Index one past the last term.
+
+    Returns:
+        The correctly rounded sum of the terms.
+    """
+    return math.fsum((-1.0 if i % 2 else 1.0) / (2 * i + 1) for i in range(start, stop))
+
+
+def _chunk_sum_numpy(start: int, stop: int) -> float:
+    """
+    Sum the terms start..stop-1 of the series with NumPy pairwise summation.
+
+    Args:
+        start: Index of the first term.
+        stop: Index one past the last term.
+
+    Returns:
+        The sum of the terms.
+    """
+    terms = 1.0 / (2.0 * np.arange(start, stop, dtype=np.float64) + 1.0)
+    # Terms with an odd index are negative
+    terms[1 - start % 2 :: 2] *= -1.0
+    return float(np.sum(terms))
+
+
+def _chunk_sums(start: int, stop: int, chunk_size: int, backend: str) -> Iterator[float]:
+    """
+    Sum the terms start..stop-1 of the series in fixed-size chunks.
+
+    Args:
+        start: Index of the first term.
+        stop: Index one past the last term.
+        chunk_size: Number of terms per chunk.
+        backend: Either "numpy" or "python".
+
+    Yields:
+        The partial sum of every chunk, in order.
+    """
+    chunk_sum = _chunk_sum_numpy if backend == "numpy" else _chunk_sum_python
+    for lo in range(start, stop, chunk_size):
+        yield chunk_sum(lo, min(lo + chunk_size, stop))
+
+
+def _block_partials(start: int, stop: int, chunk_size: int, backend: str) -> List[float]:
+    """
+    Sum the chunks of a block exactly, for combining in another process.
+
+    The chunk sums are accumulated into non-overlapping partials (Shewchuk's
+    algorithm, as used by math.fsum), whose exact sum is the exact sum of the
+    chunk sums. A handful of floats crosses the process boundary instead of
+    one per chunk, and the final math.fsum over all partials is the same
+    correctly rounded value as in a single process.
+
+    Args:
+        start: Index of the first term.
+        stop: Index one past the last term.
+        chunk_size: Number of terms per chunk.
+        backend: Either "numpy" or "python".
+
+    Returns:
+        The partials, smallest magnitude first.
+    """
+    partials: List[float] = []
+    for x in _chunk_sums(start, stop, chunk_size, backend):
+        i = 0
+        for y in partials:
+            if abs(x) < abs(y):
+                x, y = y, x
+            hi = x + y
+            lo = y - (hi - x)
+            if lo:
+                partials[i] = lo
+                i += 1
+            x = hi
+        partials[i:] = [x]
+    return partials
+
+
+def _partition(start: int, stop: int, chunk_size: int, parts: int) -> List[Tuple[int, int]]:
+    """
+    Split the index range start..stop-1 into disjoint blocks of whole chunks.
+
+    Block boundaries always fall on the chunk grid, so every chunk sum (and
+    therefore the final result) is the same however the range is split.
+
+    Args:
+        start: Index of the first term.
+        stop: Index one past the last term.
+        chunk_size: Number of terms per chunk.
+        parts: Maximum number of blocks.
+
+    Returns:
+        List of (start, stop) index pairs, in order.
+    """
+    num_chunks = -(-(stop - start) // chunk_size)
+    block_size = -(-num_chunks // parts) * chunk_size
+    return [(lo, min(lo + block_size, stop)) for lo in range(start, stop, block_size)]
+
+
+def _resolve_backend(backend: str) -> str:
+    """
+    Resolve the requested summation backend.
+
+    Args:
+        backend: One of BACKENDS.
+
+    Returns:
+        Either "numpy" or "python".
+
+    Raises:
+        ValueError: If the backend is unknown.
+        ImportError: If the NumPy backend is requested but NumPy is not installed.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}', expected one of {', '.join(BACKENDS)}")
+    if backend == "auto":
+        return "numpy" if np is not None else "python"
+    if backend == "numpy" and np is None:
+        raise ImportError("The numpy backend requires NumPy (pip install pivalue[fast])")
+    return backend
+
+
+def plan(digits: int) -> Optional[Dict[str, Any]]:
+    """
+    Choose the arguments of calculate() for a number of correct decimal places.
+
+    The error after n terms is about 1/n, so 10^(digits + 2) terms are summed:
+    the two extra digits keep a run of nines or zeros in π from costing the
+    last digit.
+
+    Args:
+        digits: Number of correct decimal places required.
+
+    Returns:
+        Dictionary containing:
+            - params: Keyword arguments for calculate()
+            - seconds: Estimated run time on one core
+        or None if digits is beyond MAX_PLAN_DIGITS.
+    """
+    if digits > MAX_PLAN_DIGITS:
+        return None
+    num_iterations = 10 ** (digits + 2)
+    return {
+        "params": {"num_iterations": num_iterations},
+        "seconds": num_iterations * SECONDS_PER_TERM[_resolve_backend("auto")],
+    }
+
+
+def calculate(
+    num_iterations: int = 400000,
+    backend: str = "auto",
+    chunk_size: int = CHUNK_SIZE,
+    workers: int = 1,
+) -> Dict[str, Any]:
     """
     Calculate Pi using the Madhava-Leibniz formula.
 
+    The series is summed in chunks of chunk_size terms, so memory use does not
+    depend on num_iterations. Each chunk is summed with NumPy pairwise summation
+    (or exact summation in pure Python) and the chunk sums are combined with
+    math.fsum, so the float error stays far below the truncation error.
+
+    With workers > 1 the index range is split into disjoint blocks of whole
+    chunks that are summed in a process pool. The result is identical to the
+    single-process result for any number of workers.
+
     Args:
         num_iterations: Number of iterations to perform.
+        backend: "numpy", "python", or "auto" to use NumPy when it is installed.
+        chunk_size: Number of terms summed per chunk.
+        workers: Number of worker processes (default: 1, sum in the calling process).
 
     Returns:
         Dictionary containing:
@@ -27,13 +220,22 @@ def calculate(num_iterations: int = 400000) -> Dict[str, Any]:
             - time_seconds: Time taken in seconds
             - method: Name of the method
             - platform: Platform information
+            - backend: Summation backend used
+            - workers: Number of worker processes used
     """
     start_time = time.perf_counter()
 
-    pi_over_4 = 0.0
-    for i in range(num_iterations + 1):
-        denom = i * 2 + 1
-        pi_over_4 = (pi_over_4 + (1 / denom)) if i % 2 == 0 else (pi_over_4 - (1 / denom))
+    backend = _resolve_backend(backend)
+
+    if workers > 1:
+        blocks = _partition(0, num_iterations + 1, chunk_size, workers * BLOCKS_PER_WORKER)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_block_partials, lo, hi, chunk_size, backend) for lo, hi in blocks
+            ]
+            pi_over_4 = math.fsum(x for future in futures for x in future.result())
+    else:
+        pi_over_4 = math.fsum(_chunk_sums(0, num_iterations + 1, chunk_size, backend))
 
     pi = pi_over_4 * 4
     elapsed_time = time.perf_counter() - start_time
@@ -43,7 +245,9 @@ def calculate(num_iterations: int = 400000) -> Dict[str, Any]:
         "iterations": num_iterations,
         "time_seconds": elapsed_time,
         "method": "Madhava-Leibniz Formula",
-        "platform": platform.platform(),
+        "platform": platform_name(),
+        "backend": backend,
+        "workers": workers,
     }
 
 
@@ -53,4 +257,5 @@ if __name__ == "__main__":
     print(f"Platform: {result['platform']}")
     print(f"Pi ≈ {result['pi']}")
     print(f"Iterations: {result['iterations']}")
+    print(f"Backend: {result['backend']}")
     print(f"Time: {result['time_seconds']:.6f} seconds")
@@ -9,34 +9,135 @@ https://en.wikipedia.org/wiki/Liu_Hui%27s_π_algorithm
 """
 
 import math
-import platform
 import time
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Union
 
+from pivalue.hostinfo import platform_name
+from pivalue.radix import format_fixed_point
 
-def calculate(iterations: int = 7) -> Dict[str, Any]:
+# Extra digits of accuracy targeted beyond the requested digits
+GUARD_DIGITS = 5
+
+# Run time on one core, seconds ≈ COST_COEFFICIENT × digits^COST_EXPONENT
+COST_COEFFICIENT = 3.5e-9
+COST_EXPONENT = 2.46
+
+
+def iterations_for_digits(digits: int) -> int:
+    """
+    Calculate the number of polygon doublings needed for the given digits.
+
+    A regular n-gon inscribed in the unit circle has half-perimeter
+    n × sin(π/n) ≈ π - π³/(6n²), so the error falls by a factor of 4 per doubling.
+
+    Args:
+        digits: Number of decimal places required.
+
+    Returns:
+        The number of iterations (the polygon has 12 × 2^iterations sides).
+    """
+    log2_sides = (math.log2(math.pi**3 / 6) + (digits + GUARD_DIGITS) * math.log2(10)) / 2
+    return max(math.ceil(log2_sides - math.log2(12)), 0)
+
+
+def _calculate_fixed(iterations: int, digits: int) -> str:
+    """
+    Calculate Pi with Liu Hui's polygon doubling in fixed-point integer arithmetic.
+
+    Uses the cancellation-free half-angle recurrence c ← √(2 + c), s ← s / c,
+    where c = 2cos(θ) and s = 2sin(θ) is the side of the inscribed polygon,
+    starting from the hexagon (c = √3, s = 1). The divisions are deferred into
+    a running product of the c values, so each iteration costs one square root
+    and one multiplication. Square roots use math.isqrt, a Newton iteration
+    that doubles its working precision at every step.
+
+    Args:
+        iterations: Number of iterations to perform.
+        digits: Number of decimal places to return.
+
+    Returns:
+        Pi truncated to the given number of decimal places.
+    """
+    halvings = iterations + 1
+    # Every step loses up to one bit to truncation
+    bits = math.ceil((digits + GUARD_DIGITS) * math.log2(10)) + halvings.bit_length() + 2
+
+    c = math.isqrt(3 << (2 * bits))
+    product = 1 << bits
+    for _ in range(halvings):
+        c = math.isqrt(((2 << bits) + c) << bits)
+        product = (product * c) >> bits
+
+    # Half-perimeter of the 6 × 2^halvings-gon: 3 × 2^halvings × s = 3 × 2^halvings / Π c
+    pi = ((3 * 10**digits) << (halvings + bits)) // product
+    return format_fixed_point(pi, digits)
+
+
+def plan(digits: int) -> Dict[str, Any]:
+    """
+    Choose the arguments of calculate() for a number of correct decimal places.
+
+    The fixed-point mode derives the polygon doublings from digits (see
+    iterations_for_digits); each doubling needs a square root at full
+    precision, which makes this the most expensive model.
+
+    Args:
+        digits: Number of correct decimal places required.
+
+    Returns:
+        Dictionary containing:
+            - params: Keyword arguments for calculate()
+            - seconds: Estimated run time on one core
+    """
+    return {
+        "params": {"digits": digits},
+        "seconds": COST_COEFFICIENT * digits**COST_EXPONENT,
+    }
+
+
+def calculate(iterations: Optional[int] = None, digits: Optional[int] = None) -> Dict[str, Any]:
     """
     Calculate Pi using Liu Hui's algorithm.
 
+    Without digits the polygon is refined in floating point, where the
+    2 - √(2 + ...) cancellation limits the result to about 12 iterations.
+    With digits the cancellation-free recurrence runs in fixed-point integer
+    arithmetic and the number of iterations is derived from digits.
+
     Args:
-        iterations: Number of iterations to perform (default: 7).
+        iterations: Number of iterations to perform (default: 7, or derived
+            from digits).
+        digits: Number of decimal places to calculate (default: None, use
+            floating point).
 
     Returns:
         Dictionary containing:
-            - pi: The calculated value of Pi
+            - pi: The calculated value of Pi (as string when digits is given)
             - iterations: Number of iterations performed
             - time_seconds: Time taken in seconds
             - method: Name of the method
             - platform: Platform information
+            - digits: Number of decimal places calculated (None in floating point)
     """
     start_time = time.perf_counter()
 
-    init = math.sqrt(2 + 1)
+    pi: Union[float, str]
+    if digits is None:
+        if iterations is None:
+            iterations = 7
+
+        init = math.sqrt(2 + 1)
+
+        for _ in range(1, iterations + 1):
+            init = math.sqrt(2 + init)
 
-    for _ in range(1, iterations + 1):
-        init = math.sqrt(2 + init)
+        # Half-perimeter of the 12 × 2^iterations-gon
+        pi = 6 * 2**iterations * math.sqrt(2 - init)
+    else:
+        if iterations is None:
+            iterations = iterations_for_digits(digits)
+        pi = _calculate_fixed(iterations, digits)
 
-    pi = 768 * math.sqrt(2 - init)
     elapsed_time = time.perf_counter() - start_time
 
     return {
@@ -44,7 +145,8 @@ def calculate(iterations: int = 7) -> Dict[str, Any]:
         "iterations": iterations,
         "time_seconds": elapsed_time,
         "method": "Liu Hui's Algorithm",
-        "platform": platform.platform(),
+        "platform": platform_name(),
+        "digits": digits,
     }
 
 
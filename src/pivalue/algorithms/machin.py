@@ -12,39 +12,303 @@ https://en.wikipedia.org/wiki/Machin-like_formula
 """
 
 import math
-import platform
+import os
 import time
-from typing import Dict, Any, List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple, Union
 
+from pivalue.hostinfo import platform_name
+from pivalue.radix import format_fixed_point
 
-def calculate() -> Dict[str, Any]:
+# Built-in Machin-like formulas: π/4 = Σ coefficient × arctan(numerator / denominator)
+FORMULAS: Dict[str, List[Tuple[int, int, int]]] = {
+    "machin": [(4, 1, 5), (-1, 1, 239)],
+    "takano": [(12, 1, 49), (32, 1, 57), (-5, 1, 239), (12, 1, 110443)],
+    "stormer": [(44, 1, 57), (7, 1, 239), (-12, 1, 682), (24, 1, 12943)],
+}
+
+# Measured cost of one arctan series term per digit of precision (CPython, x86-64)
+SECONDS_PER_TERM_DIGIT = 1.2e-9
+
+# Measured cost of starting one worker process and collecting its result
+SECONDS_PER_WORKER = 0.01
+
+
+def lehmer_measure(formula: List[Tuple[int, int, int]]) -> float:
+    """
+    Calculate the Lehmer measure Σ 1/log10(b/a) of a Machin-like formula.
+
+    The measure is proportional to the total number of series terms needed
+    for a given number of digits, so smaller is cheaper on a single core.
+
+    Args:
+        formula: List of (coefficient, numerator, denominator) terms.
+
+    Returns:
+        The Lehmer measure of the formula.
+    """
+    return sum(1 / math.log10(b / a) for _, a, b in formula)
+
+
+def series_terms(numerator: int, denominator: int, digits: int) -> int:
+    """
+    Estimate the number of series terms arctan_fixed needs for the given digits.
+
+    Args:
+        numerator: Numerator of the argument.
+        denominator: Denominator of the argument.
+        digits: Number of decimal places required.
+
+    Returns:
+        The estimated number of terms.
+    """
+    return math.ceil(digits / (2 * math.log10(denominator / numerator))) + 1
+
+
+def estimate_cost(formula: List[Tuple[int, int, int]], digits: int, workers: int = 1) -> float:
+    """
+    Estimate the wall-clock time of evaluating a formula to the given digits.
+
+    Each arctan term costs its series length times the number of digits. The
+    terms are assigned to workers longest first, and the estimate is the
+    busiest worker's load plus the cost of starting the worker processes.
+
+    Args:
+        formula: List of (coefficient, numerator, denominator) terms.
+        digits: Number of decimal places required.
+        workers: Number of worker cores available (default: 1).
+
+    Returns:
+        The estimated time in seconds.
+    """
+    costs = sorted(
+        (series_terms(a, b, digits) * digits * SECONDS_PER_TERM_DIGIT for _, a, b in formula),
+        reverse=True,
+    )
+    used = min(workers, len(costs))
+    if used <= 1:
+        return sum(costs)
+
+    loads = [0.0] * used
+    for cost in costs:
+        loads[loads.index(min(loads))] += cost
+    return max(loads) + used * SECONDS_PER_WORKER
+
+
+def rank_formulas(
+    digits: int,
+    workers: Optional[int] = None,
+    formulas: Optional[Dict[str, List[Tuple[int, int, int]]]] = None,
+) -> List[Tuple[str, float]]:
+    """
+    Rank Machin-like formulas by estimated cost, cheapest first.
+
+    Args:
+        digits: Number of decimal places required.
+        workers: Number of worker cores available (default: all CPUs).
+        formulas: Candidate formulas by name (default: FORMULAS).
+
+    Returns:
+        List of (formula name, estimated seconds), cheapest first.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if formulas is None:
+        formulas = FORMULAS
+
+    costs = [(name, estimate_cost(formula, digits, workers)) for name, formula in formulas.items()]
+    return sorted(costs, key=lambda item: item[1])
+
+
+def select_formula(
+    digits: int,
+    workers: Optional[int] = None,
+    formulas: Optional[Dict[str, List[Tuple[int, int, int]]]] = None,
+) -> str:
+    """
+    Select the cheapest Machin-like formula for the given digits and workers.
+
+    Args:
+        digits: Number of decimal places required.
+        workers: Number of worker cores available (default: all CPUs).
+        formulas: Candidate formulas by name (default: FORMULAS).
+
+    Returns:
+        Name of the cheapest formula.
+    """
+    return rank_formulas(digits, workers, formulas)[0][0]
+
+
+def arctan_fixed(numerator: int, denominator: int, scale: int) -> Tuple[int, int]:
+    """
+    Calculate arctan(numerator / denominator) in fixed-point integer arithmetic.
+
+    Sums the Taylor series x - x³/3 + x⁵/5 - ... with every power of x kept as
+    an integer scaled by 10^scale, so the cost per term is one division of a
+    big integer by a small one.
+
+    Args:
+        numerator: Numerator of the argument.
+        denominator: Denominator of the argument (larger than the numerator).
+        scale: Number of decimal digits after the fixed point.
+
+    Returns:
+        Tuple of (arctan scaled by 10^scale, number of series terms summed).
+    """
+    num_sq = numerator * numerator
+    den_sq = denominator * denominator
+
+    power = 10**scale * numerator // denominator
+    total = power
+    n = 1
+    terms = 1
+    while power:
+        power = power * num_sq // den_sq
+        n += 2
+        terms += 1
+        if terms % 2:
+            total += power // n
+        else:
+            total -= power // n
+
+    return total, terms
+
+
+def _arctan_task(args: Tuple[int, int, int]) -> Tuple[int, int]:
+    """
+    Unpack one arctan evaluation for a worker process.
+
+    Args:
+        args: Tuple of (numerator, denominator, scale).
+
+    Returns:
+        Result of arctan_fixed.
+    """
+    return arctan_fixed(*args)
+
+
+def plan(digits: int) -> Dict[str, Any]:
+    """
+    Choose the arguments of calculate() for a number of correct decimal places.
+
+    The fixed-point engine truncates its guard digits itself; the formula is
+    the one with the lowest estimate_cost on one core.
+
+    Args:
+        digits: Number of correct decimal places required.
+
+    Returns:
+        Dictionary containing:
+            - params: Keyword arguments for calculate()
+            - seconds: Estimated run time on one core
+    """
+    formula = select_formula(digits, workers=1)
+    return {
+        "params": {"digits": digits, "formula": formula},
+        "seconds": estimate_cost(FORMULAS[formula], digits),
+    }
+
+
+def calculate(
+    digits: Optional[int] = None, formula: str = "machin", workers: int = 1
+) -> Dict[str, Any]:
     """
     Calculate Pi using Machin's formula.
 
+    Without digits the formula is evaluated with floating-point arctan calls.
+    With digits it is evaluated by the fixed-point arctan engine.
+
+    Args:
+        digits: Number of decimal places to calculate (default: None, use floating point).
+        formula: Name of a formula in FORMULAS, or "auto" to run the formula with
+            the lowest estimated cost for digits and workers (default: "machin").
+        workers: Number of worker processes for the arctan terms (default: 1).
+
     Returns:
         Dictionary containing:
             - pi: The calculated value of Pi
-            - iterations: Number of iterations (N/A for this method)
+            - iterations: Number of series terms summed (N/A in floating point)
             - time_seconds: Time taken in seconds
             - method: Name of the method
             - platform: Platform information
+            - formula: Name of the formula used
+            - digits: Number of decimal places calculated (None in floating point)
+
+    Raises:
+        ValueError: If the formula is unknown.
     """
+    if formula == "auto":
+        formula = select_formula(digits, workers) if digits is not None else "machin"
+    if formula not in FORMULAS:
+        raise ValueError(f"Unknown formula '{formula}', expected one of {', '.join(FORMULAS)}")
+
     start_time = time.perf_counter()
 
-    pi = 4 * ((4 * math.atan(1 / 5)) - math.atan(1 / 239))
+    coefficients, numerators, denominators = (list(column) for column in zip(*FORMULAS[formula]))
+
+    pi: Union[float, str]
+    iterations: Union[int, str]
+    if digits is None:
+        pi = machin_like_formula(numerators, denominators, coefficients)
+        iterations = "N/A"
+    else:
+        pi, iterations = _machin_like_fixed(numerators, denominators, coefficients, digits, workers)
 
     elapsed_time = time.perf_counter() - start_time
 
     return {
         "pi": pi,
-        "iterations": "N/A",
+        "iterations": iterations,
         "time_seconds": elapsed_time,
         "method": "Machin's Formula",
-        "platform": platform.platform(),
+        "platform": platform_name(),
+        "formula": formula,
+        "digits": digits,
     }
 
 
-def machin_like_formula(a_list: List[int], b_list: List[int], c_list: List[int]) -> float:
+def _machin_like_fixed(
+    a_list: List[int], b_list: List[int], c_list: List[int], digits: int, workers: int
+) -> Tuple[str, int]:
+    """
+    Evaluate π = 4 × Σ(c[i] × arctan(a[i] / b[i])) to the given number of digits.
+
+    Each arctan term is evaluated in fixed point, concurrently when workers > 1,
+    and the terms are combined exactly as integers before rounding.
+
+    Args:
+        a_list: List of numerators for arctan arguments.
+        b_list: List of denominators for arctan arguments.
+        c_list: List of coefficients for each term.
+        digits: Number of decimal places to calculate.
+        workers: Number of worker processes.
+
+    Returns:
+        Tuple of (Pi as a string with digits decimal places, total series terms summed).
+    """
+    # Every truncating division loses at most one unit in the last place
+    scale = digits + len(str(digits)) + 5
+    tasks = [(a, b, scale) for a, b in zip(a_list, b_list)]
+
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            results = list(executor.map(_arctan_task, tasks))
+    else:
+        results = [_arctan_task(task) for task in tasks]
+
+    total = 4 * sum(c * value for c, (value, _) in zip(c_list, results))
+    terms = sum(count for _, count in results)
+
+    return format_fixed_point(total, scale, digits), terms
+
+
+def machin_like_formula(
+    a_list: List[int],
+    b_list: List[int],
+    c_list: List[int],
+    digits: Optional[int] = None,
+    workers: int = 1,
+) -> Union[float, str]:
     """
     Calculate Pi using a generalized Machin-like formula.
 
@@ -54,17 +318,23 @@ def machin_like_formula(a_list: List[int], b_list: List[int], c_list: List[int])
         a_list: List of numerators for arctan arguments.
         b_list: List of denominators for arctan arguments.
         c_list: List of coefficients for each term.
+        digits: Number of decimal places to calculate with the fixed-point arctan
+            engine (default: None, use floating point).
+        workers: Number of worker processes for the fixed-point engine (default: 1).
 
     Returns:
-        The calculated value of Pi.
+        The calculated value of Pi, as a float, or as a string when digits is given.
 
     Raises:
         AssertionError: If the lists have different lengths.
     """
-    assert (
-        len(a_list) == len(b_list) and len(b_list) == len(c_list)
+    assert len(a_list) == len(b_list) and len(b_list) == len(
+        c_list
     ), "Length of all three lists should match"
 
+    if digits is not None:
+        return _machin_like_fixed(a_list, b_list, c_list, digits, workers)[0]
+
     total = 0.0
     for i in range(len(a_list)):
         total += c_list[i] * math.atan(a_list[i] / b_list[i])
@@ -14,18 +14,121 @@ The number of iterations required for f(z) to exceed the value of 2 will give us
 the value of Pi (provided we place the decimal point at the correct place).
 """
 
-import platform
+import json
+import math
+import os
 import time
-from decimal import Decimal
-from typing import Dict, Any
+from typing import Dict, Any, Callable, Optional
 
+from pivalue.hostinfo import platform_name
+from pivalue.radix import format_fixed_point
 
-def calculate(digits: int = 5) -> Dict[str, Any]:
+# Extra decimal digits of fixed-point precision beyond 3 × digits
+GUARD_DIGITS = 10
+
+# Default number of iterations between progress callbacks and checkpoints
+PROGRESS_INTERVAL = 1_000_000
+CHECKPOINT_INTERVAL = 10_000_000
+
+# Measured cost of one iteration at the precision of a dozen digits
+SECONDS_PER_ITERATION = 2.4e-7
+
+# Iterations grow as 10^digits; beyond this a run would take weeks
+MAX_PLAN_DIGITS = 12
+
+
+def _load_checkpoint(path: str, digits: int, bits: int) -> Optional[Dict[str, int]]:
+    """
+    Load a saved (z, iteration) state if one exists for this run.
+
+    Args:
+        path: Checkpoint file path.
+        digits: Number of digits of the run being resumed.
+        bits: Fixed-point precision of the run being resumed.
+
+    Returns:
+        Dictionary with the saved z and iteration, or None if there is no checkpoint.
+
+    Raises:
+        ValueError: If the checkpoint belongs to a run with different parameters.
+    """
+    if not os.path.exists(path):
+        return None
+
+    with open(path) as f:
+        state: Dict[str, int] = json.load(f)
+
+    if state["digits"] != digits or state["bits"] != bits:
+        raise ValueError(
+            f"Checkpoint {path} was written for digits={state['digits']}, not digits={digits}"
+        )
+    return state
+
+
+def _save_checkpoint(path: str, digits: int, bits: int, z: int, iteration: int) -> None:
+    """
+    Atomically save the (z, iteration) state of a run.
+
+    Args:
+        path: Checkpoint file path.
+        digits: Number of digits of the run.
+        bits: Fixed-point precision of the run.
+        z: Current fixed-point value of z.
+        iteration: Number of iterations performed so far.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"digits": digits, "bits": bits, "z": z, "iteration": iteration}, f)
+    os.replace(tmp_path, path)
+
+
+def plan(digits: int) -> Optional[Dict[str, Any]]:
+    """
+    Choose the arguments of calculate() for a number of correct decimal places.
+
+    The last digit or two of a run are unreliable, so two more digits are
+    requested than needed. A run takes about π × 10^digits iterations.
+
+    Args:
+        digits: Number of correct decimal places required.
+
+    Returns:
+        Dictionary containing:
+            - params: Keyword arguments for calculate()
+            - seconds: Estimated run time on one core
+        or None if digits is beyond MAX_PLAN_DIGITS.
+    """
+    if digits > MAX_PLAN_DIGITS:
+        return None
+    return {
+        "params": {"digits": digits + 2},
+        "seconds": math.pi * 10 ** (digits + 2) * SECONDS_PER_ITERATION,
+    }
+
+
+def calculate(
+    digits: int = 5,
+    progress: Optional[Callable[[int], None]] = None,
+    progress_interval: int = PROGRESS_INTERVAL,
+    checkpoint: Optional[str] = None,
+    checkpoint_interval: int = CHECKPOINT_INTERVAL,
+) -> Dict[str, Any]:
     """
     Calculate Pi using the Mandelbrot set approach.
 
+    The iteration z ← z² + c runs in scaled-integer fixed-point arithmetic with
+    about 3 × digits decimal digits of precision, well below the 10^(-2 × digits)
+    offset of c from the cusp. The number of iterations grows as 10^digits, so
+    long runs can report progress and save their state to a checkpoint file
+    from which an interrupted run resumes.
+
     Args:
         digits: Number of digits of precision to calculate.
+        progress: Callback receiving the iteration count every progress_interval iterations.
+        progress_interval: Number of iterations between progress callbacks.
+        checkpoint: Path of a checkpoint file to resume from and save to. It is
+            removed once the run completes.
+        checkpoint_interval: Number of iterations between checkpoints.
 
     Returns:
         Dictionary containing:
@@ -34,28 +137,60 @@ def calculate(digits: int = 5) -> Dict[str, Any]:
             - time_seconds: Time taken in seconds
             - method: Name of the method
             - platform: Platform information
+            - digits: Number of digits of precision calculated
+            - resumed_from: Iteration the run resumed from (0 for a fresh run)
+
+    Raises:
+        ValueError: If progress_interval or checkpoint_interval is not positive.
     """
+    if progress_interval < 1 or checkpoint_interval < 1:
+        raise ValueError("progress_interval and checkpoint_interval must be positive")
+
     start_time = time.perf_counter()
 
-    c = Decimal("0.25")
-    e = Decimal(1.0 / (100**digits - 1))
-    c += e
-    z = Decimal("0.0")
+    bits = math.ceil((3 * digits + GUARD_DIGITS) * math.log2(10))
+    one = 1 << bits
+    two = 2 * one
+    # c = 0.25 + e with e = 1 / (100^digits - 1)
+    c = one // 4 + one // (100**digits - 1)
+
+    z = 0
     iterations = 0
+    state = _load_checkpoint(checkpoint, digits, bits) if checkpoint else None
+    if state is not None:
+        z = state["z"]
+        iterations = state["iteration"]
+    resumed_from = iterations
+
+    next_progress = iterations + progress_interval if progress else math.inf
+    next_checkpoint = iterations + checkpoint_interval if checkpoint else math.inf
+
+    while z < two:
+        block_end = min(next_progress, next_checkpoint)
+        while z < two and iterations < block_end:
+            z = (z * z >> bits) + c
+            iterations += 1
+
+        if checkpoint is not None and iterations == next_checkpoint:
+            _save_checkpoint(checkpoint, digits, bits, z, iterations)
+            next_checkpoint += checkpoint_interval
+        if progress is not None and iterations == next_progress:
+            progress(iterations)
+            next_progress += progress_interval
 
-    while z < 2:
-        z = z * z + c
-        iterations += 1
+    if checkpoint and os.path.exists(checkpoint):
+        os.remove(checkpoint)
 
     elapsed_time = time.perf_counter() - start_time
 
     return {
-        "pi": str(iterations / (10**digits)),
+        "pi": format_fixed_point(iterations, digits),
         "iterations": iterations,
         "time_seconds": elapsed_time,
         "method": "Mandelbrot Set",
-        "platform": platform.platform(),
+        "platform": platform_name(),
         "digits": digits,
+        "resumed_from": resumed_from,
     }
 
 
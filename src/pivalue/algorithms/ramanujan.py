@@ -14,37 +14,70 @@ https://en.wikipedia.org/wiki/Ramanujan%E2%80%93Sato_series
 """
 
 import math
-import platform
 import time
-from decimal import Decimal, getcontext
-from typing import Dict, Any
+from decimal import MAX_EMAX, MIN_EMIN, Decimal, localcontext
+from typing import Dict, Any, Optional
 
+from pivalue.hostinfo import platform_name
+from pivalue.newton import inverse_sqrt
+from pivalue.series import RationalSeries, evaluate
 
-def factorial(n: int) -> int:
+# Number of correct digits contributed by each term of the series
+DIGITS_PER_TERM = math.log10(396**4 / 256)
+
+# 396⁴, the per-term growth of the denominator
+C396_4 = 396**4
+
+# Term ratio p(k)/q(k) = (4k-3)(4k-2)(4k-1)(4k) / (k⁴ × 396⁴), reduced by k
+RAMANUJAN_SERIES = RationalSeries(
+    p=(-24, 176, -384, 256),
+    q=(0, 0, 0, C396_4),
+    a=(1103, 26390),
+)
+
+# Extra digits carried through the final division and square root
+GUARD_DIGITS = 10
+
+# Run time on one core, seconds ≈ COST_COEFFICIENT × digits^COST_EXPONENT
+COST_COEFFICIENT = 1.4e-7
+COST_EXPONENT = 1.25
+
+
+def plan(digits: int) -> Dict[str, Any]:
     """
-    Calculate factorial of n.
+    Choose the arguments of calculate() for a number of correct decimal places.
+
+    precision counts significant digits and the last one is rounded, so it is
+    padded with guard digits; the number of terms follows from it.
 
     Args:
-        n: The number to calculate factorial for.
+        digits: Number of correct decimal places required.
 
     Returns:
-        The factorial of n.
+        Dictionary containing:
+            - params: Keyword arguments for calculate()
+            - seconds: Estimated run time on one core
     """
-    if n == 0:
-        return 1
-    result = 1
-    for i in range(1, n + 1):
-        result *= i
-    return result
+    return {
+        "params": {"precision": digits + GUARD_DIGITS},
+        "seconds": COST_COEFFICIENT * digits**COST_EXPONENT,
+    }
 
 
-def calculate(num_iterations: int = 10, precision: int = 100) -> Dict[str, Any]:
+def calculate(
+    num_iterations: Optional[int] = None, precision: int = 100, workers: int = 1
+) -> Dict[str, Any]:
     """
     Calculate Pi using Ramanujan's formula.
 
+    The series is evaluated by binary splitting: consecutive terms differ by a
+    rational factor, so no factorial or power of 396 is computed from scratch.
+
     Args:
-        num_iterations: Number of iterations to perform (default: 10).
+        num_iterations: Number of iterations to perform (default: derived from
+            precision at about 8 digits per term).
         precision: Decimal precision to use (default: 100).
+        workers: Number of worker processes for the binary splitting (default: 1).
 
     Returns:
         Dictionary containing:
@@ -56,23 +89,19 @@ def calculate(num_iterations: int = 10, precision: int = 100) -> Dict[str, Any]:
     """
     start_time = time.perf_counter()
 
-    # Set decimal precision
-    getcontext().prec = precision
-
-    # Constants
-    sqrt2 = Decimal(2).sqrt()
-    constant = (Decimal(2) * sqrt2) / Decimal(9801)
+    if num_iterations is None:
+        num_iterations = int(precision / DIGITS_PER_TERM) + 1
 
-    # Calculate the sum
-    total = Decimal(0)
-    for k in range(num_iterations):
-        numerator = Decimal(factorial(4 * k)) * Decimal(1103 + 26390 * k)
-        denominator = Decimal(factorial(k) ** 4) * Decimal(396 ** (4 * k))
-        total += numerator / denominator
+    t, q = evaluate(RAMANUJAN_SERIES, max(num_iterations, 1), workers)
 
-    # Calculate 1/π and then π
-    one_over_pi = constant * total
-    pi = Decimal(1) / one_over_pi
+    with localcontext() as ctx:
+        ctx.Emax = MAX_EMAX
+        ctx.Emin = MIN_EMIN
+        ctx.prec = precision + GUARD_DIGITS
+        # π = 9801 / (2√2 × Σ) = 9801 × (1/√2) × Q / (2T)
+        pi = Decimal(9801) * inverse_sqrt(2, ctx.prec) * q / (2 * t)
+        ctx.prec = precision
+        pi = +pi
 
     elapsed_time = time.perf_counter() - start_time
 
@@ -81,7 +110,7 @@ def calculate(num_iterations: int = 10, precision: int = 100) -> Dict[str, Any]:
         "iterations": num_iterations,
         "time_seconds": elapsed_time,
         "method": "Ramanujan's Formula",
-        "platform": platform.platform(),
+        "platform": platform_name(),
         "precision": precision,
     }
 
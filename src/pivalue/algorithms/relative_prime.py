@@ -10,32 +10,29 @@ For more information, visit:
 https://mathworld.wolfram.com/RelativelyPrime.html
 """
 
-import platform
+import random
 import time
-from functools import reduce
-from math import sqrt
-from random import randint
-from typing import Dict, Any, Set
+from concurrent.futures import ProcessPoolExecutor
+from math import gcd, sqrt
+from typing import Dict, Any, Optional
 
+from pivalue.hostinfo import platform_name
 
-def get_factors(num: int) -> Set[int]:
-    """
-    Get all factors of a number (excluding 1).
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
 
-    Args:
-        num: The number to find factors for.
+# Number of pairs drawn and checked per batch
+BATCH_SIZE = 1 << 16
 
-    Returns:
-        Set of factors (excluding 1).
-    """
-    factors_set = set(
-        reduce(
-            list.__add__,
-            ([i, int(num / i)] for i in range(1, int(num**0.5) + 1) if num % i == 0),
-        )
-    )
-    factors_set.discard(1)
-    return factors_set
+# Largest value the NumPy sampler can draw (int64)
+NUMPY_MAX_RANGE = 2**63 - 1
+
+BACKENDS = ("auto", "numpy", "python")
+
+# Two-sided 95% quantile of the normal distribution
+Z_95 = 1.959963984540054
 
 
 def has_common_factors(num1: int, num2: int) -> bool:
@@ -49,19 +46,173 @@ def has_common_factors(num1: int, num2: int) -> bool:
     Returns:
         True if numbers have common factors, False otherwise.
     """
-    return len(get_factors(num1).intersection(get_factors(num2))) > 0
+    return gcd(num1, num2) > 1
+
+
+def _count_coprime_python(rng: random.Random, min_range: int, max_range: int, size: int) -> int:
+    """
+    Draw a batch of random pairs and count the coprime ones with math.gcd.
+
+    Args:
+        rng: Random number generator to draw from.
+        min_range: Minimum value for random numbers.
+        max_range: Maximum value for random numbers.
+        size: Number of pairs to draw.
+
+    Returns:
+        Number of coprime pairs in the batch.
+    """
+    randint = rng.randint
+    return sum(
+        1
+        for _ in range(size)
+        if gcd(randint(min_range, max_range), randint(min_range, max_range)) == 1
+    )
+
+
+def _count_coprime_numpy(rng: Any, min_range: int, max_range: int, size: int) -> int:
+    """
+    Draw a batch of random pairs and count the coprime ones with numpy.gcd.
+
+    Args:
+        rng: NumPy Generator to draw from.
+        min_range: Minimum value for random numbers.
+        max_range: Maximum value for random numbers (at most NUMPY_MAX_RANGE).
+        size: Number of pairs to draw.
+
+    Returns:
+        Number of coprime pairs in the batch.
+    """
+    pairs = rng.integers(min_range, max_range, size=(2, size), dtype=np.int64, endpoint=True)
+    return int(np.count_nonzero(np.gcd(pairs[0], pairs[1]) == 1))
+
+
+def _resolve_backend(backend: str, max_range: int) -> str:
+    """
+    Resolve the requested sampling backend.
+
+    Args:
+        backend: One of BACKENDS.
+        max_range: Maximum value for random numbers.
+
+    Returns:
+        Either "numpy" or "python".
+
+    Raises:
+        ValueError: If the backend is unknown, or NumPy cannot represent max_range.
+        ImportError: If the NumPy backend is requested but NumPy is not installed.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}', expected one of {', '.join(BACKENDS)}")
+    if backend == "auto":
+        return "numpy" if np is not None and max_range <= NUMPY_MAX_RANGE else "python"
+    if backend == "numpy":
+        if np is None:
+            raise ImportError("The numpy backend requires NumPy (pip install pivalue[fast])")
+        if max_range > NUMPY_MAX_RANGE:
+            raise ValueError(f"The numpy backend supports max_range up to {NUMPY_MAX_RANGE}")
+    return backend
+
+
+def _count_batch(
+    backend: str, seed: int, batch_index: int, min_range: int, max_range: int, size: int
+) -> int:
+    """
+    Count the coprime pairs in one batch drawn from its own random stream.
+
+    Every batch gets an independent stream derived from the master seed and
+    the batch index, so a run is reproducible whichever process draws it.
+
+    Args:
+        backend: Either "numpy" or "python".
+        seed: Master seed of the run.
+        batch_index: Index of the batch within the run.
+        min_range: Minimum value for random numbers.
+        max_range: Maximum value for random numbers.
+        size: Number of pairs to draw.
+
+    Returns:
+        Number of coprime pairs in the batch.
+    """
+    if backend == "numpy":
+        rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(batch_index,)))
+        return _count_coprime_numpy(rng, min_range, max_range, size)
+    return _count_coprime_python(random.Random(f"{seed}:{batch_index}"), min_range, max_range, size)
+
+
+def standard_error(coprime_count: int, num_pairs: int) -> float:
+    """
+    Estimate the standard error of Pi from the sampled coprime rate.
+
+    Each pair is a Bernoulli trial, so the running sample variance of the
+    coprime rate follows from the counts alone. The error is carried over to
+    π = √(6/p) with the delta method: SE(π) = π / (2p) × SE(p).
+
+    Args:
+        coprime_count: Number of coprime pairs seen so far.
+        num_pairs: Number of pairs tested so far.
+
+    Returns:
+        The standard error of the Pi estimate (infinite with fewer than two pairs
+        or no coprime pairs).
+    """
+    if num_pairs < 2 or coprime_count == 0:
+        return float("inf")
+    probability = coprime_count / num_pairs
+    variance = coprime_count * (num_pairs - coprime_count) / (num_pairs * (num_pairs - 1))
+    return sqrt(6 / probability) / (2 * probability) * sqrt(variance / num_pairs)
+
+
+def plan(digits: int) -> None:
+    """
+    Choose the arguments of calculate() for a number of correct decimal places.
+
+    The estimate is random, so no number of pairs guarantees any digit; use
+    target_stderr to bound the error statistically instead.
+
+    Args:
+        digits: Number of correct decimal places required.
+
+    Returns:
+        None, as no plan can guarantee the digits.
+    """
+    return None
 
 
 def calculate(
-    num_pairs: int = 100000, min_range: int = 10, max_range: int = 1000
+    num_pairs: int = 100000,
+    min_range: int = 10,
+    max_range: int = 1000,
+    seed: Optional[int] = None,
+    backend: str = "auto",
+    batch_size: int = BATCH_SIZE,
+    workers: int = 1,
+    target_stderr: Optional[float] = None,
+    time_budget: Optional[float] = None,
 ) -> Dict[str, Any]:
     """
     Calculate Pi using the relative prime probability approach.
 
+    Pairs are drawn in batches and checked with a single gcd per pair, using
+    numpy.gcd on whole batches when NumPy is installed. The cost per pair does
+    not depend on the size of the numbers, so max_range may go up to 10^18.
+
+    Batches are drawn in rounds of one batch per worker. After each round the
+    standard error is updated, and sampling stops early once it reaches
+    target_stderr or the elapsed time exceeds time_budget; num_pairs is then
+    the upper limit on the pairs tested.
+
     Args:
         num_pairs: Number of random pairs to test.
         min_range: Minimum value for random numbers.
         max_range: Maximum value for random numbers.
+        seed: Master seed for the random streams (default: drawn from the OS),
+            for reproducible runs.
+        backend: "numpy", "python", or "auto" to use NumPy when it is installed.
+        batch_size: Number of pairs drawn per batch.
+        workers: Number of worker processes (default: 1, sample in the calling process).
+        target_stderr: Stop once the standard error of Pi is at most this value.
+        time_budget: Stop once this many seconds have elapsed.
 
     Returns:
         Dictionary containing:
@@ -71,26 +222,65 @@ def calculate(
             - method: Name of the method
             - platform: Platform information
             - probability: Calculated probability of relative primality
+            - stderr: Standard error of the Pi estimate
+            - confidence_interval: 95% confidence interval for Pi
+            - seed: Master seed used for the random streams
+            - backend: Sampling backend used
+            - workers: Number of worker processes used
     """
     start_time = time.perf_counter()
 
-    common_count = 0
+    backend = _resolve_backend(backend, max_range)
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(63)
+
+    batch_sizes = [
+        min(batch_size, num_pairs - offset) for offset in range(0, num_pairs, batch_size)
+    ]
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+
+    tested = 0
+    coprime_count = 0
+    try:
+        for first in range(0, len(batch_sizes), workers):
+            indices = range(first, min(first + workers, len(batch_sizes)))
+            args = [
+                (backend, seed, index, min_range, max_range, batch_sizes[index])
+                for index in indices
+            ]
+            if executor is not None:
+                counts = list(executor.map(_count_batch, *zip(*args)))
+            else:
+                counts = [_count_batch(*batch_args) for batch_args in args]
+
+            coprime_count += sum(counts)
+            tested += sum(batch_sizes[index] for index in indices)
 
-    for _ in range(num_pairs):
-        if has_common_factors(randint(min_range, max_range), randint(min_range, max_range)):
-            common_count += 1
+            if target_stderr is not None and standard_error(coprime_count, tested) <= target_stderr:
+                break
+            if time_budget is not None and time.perf_counter() - start_time >= time_budget:
+                break
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
-    probability = 1 - common_count / num_pairs
+    probability = coprime_count / tested
     pi = sqrt(6 / probability)
+    stderr = standard_error(coprime_count, tested)
     elapsed_time = time.perf_counter() - start_time
 
     return {
         "pi": pi,
-        "iterations": num_pairs,
+        "iterations": tested,
         "time_seconds": elapsed_time,
         "method": "Relative Prime Probability",
-        "platform": platform.platform(),
+        "platform": platform_name(),
         "probability": probability,
+        "stderr": stderr,
+        "confidence_interval": [pi - Z_95 * stderr, pi + Z_95 * stderr],
+        "seed": seed,
+        "backend": backend,
+        "workers": workers,
     }
 
 
@@ -101,4 +291,5 @@ if __name__ == "__main__":
     print(f"Pi ≈ {result['pi']}")
     print(f"Pairs tested: {result['iterations']}")
     print(f"Probability: {result['probability']:.6f}")
+    print(f"Standard error: {result['stderr']:.2e}")
     print(f"Time: {result['time_seconds']:.6f} seconds")
@@ -2,76 +2,367 @@
 Benchmarking utilities for comparing Pi calculation algorithms.
 """
 
+import gc
 import json
 import math
-from typing import Dict, List, Any, Optional
-from pivalue.algorithms import (
-    mandelbrot,
-    leibniz,
-    liu_hui,
-    euler,
-    bailey,
-    relative_prime,
-    machin,
-    ramanujan,
+import multiprocessing
+import os
+import statistics
+import time
+from multiprocessing.connection import Connection, wait
+from multiprocessing.process import BaseProcess
+from typing import Dict, Iterable, List, Any, Optional, Tuple
+from pivalue.reference import ReferenceStore
+from pivalue.registry import (  # noqa: F401 - run_single_algorithm is re-exported
+    ALGORITHMS,
+    AlgorithmInfo,
+    run_single_algorithm,
 )
 
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore[assignment]
 
-# Map of algorithm names to their modules
-ALGORITHMS = {
-    "mandelbrot": mandelbrot,
-    "leibniz": leibniz,
-    "liu_hui": liu_hui,
-    "euler": euler,
-    "bailey": bailey,
-    "relative_prime": relative_prime,
-    "machin": machin,
-    "ramanujan": ramanujan,
-}
 
+# Upper limit on the measured runs of one algorithm when min_time is set
+MAX_REPEATS = 10000
 
-def run_all_algorithms() -> List[Dict[str, Any]]:
+# Samples beyond this many interquartile ranges outside the quartiles are outliers
+OUTLIER_IQR_FACTOR = 1.5
+
+# Default wall-clock limit per algorithm for the command line, in seconds
+DEFAULT_TIMEOUT = 600.0
+
+# Seconds a terminated worker gets to exit before it is killed
+KILL_GRACE_SECONDS = 1.0
+
+
+def pin_cpus(cpus: Iterable[int]) -> bool:
     """
-    Run all available Pi calculation algorithms.
+    Pin the current process to the given CPUs to reduce timing noise.
+
+    Args:
+        cpus: CPU numbers to run on.
 
     Returns:
-        List of result dictionaries from each algorithm.
+        True if the affinity was set, False if the platform does not support it.
     """
-    results = []
+    if not hasattr(os, "sched_setaffinity"):
+        return False
+    os.sched_setaffinity(0, set(cpus))
+    return True
 
-    print("Running all algorithms...\n")
 
-    # Mandelbrot
-    print("1/8 Running Mandelbrot Set...")
-    results.append(mandelbrot.calculate())
+def summarize(times: List[float]) -> Dict[str, Any]:
+    """
+    Summarize timing samples, rejecting outliers with Tukey's fences.
+
+    Samples more than OUTLIER_IQR_FACTOR interquartile ranges below the first
+    or above the third quartile are dropped before the statistics are taken
+    (only with at least four samples).
 
-    # Leibniz
-    print("2/8 Running Leibniz Formula...")
-    results.append(leibniz.calculate())
+    Args:
+        times: Measured times in seconds.
 
-    # Liu Hui
-    print("3/8 Running Liu Hui's Algorithm...")
-    results.append(liu_hui.calculate())
+    Returns:
+        Dictionary containing:
+            - samples: The measured times, in run order
+            - outliers: Number of samples rejected as outliers
+            - median, mean, stdev, min, max: Statistics of the kept samples
+            - iqr: Interquartile range of the kept samples
+    """
+    kept = list(times)
+    if len(times) >= 4:
+        q1, _, q3 = statistics.quantiles(times, n=4, method="inclusive")
+        spread = OUTLIER_IQR_FACTOR * (q3 - q1)
+        kept = [t for t in times if q1 - spread <= t <= q3 + spread]
+
+    if len(kept) >= 2:
+        q1, _, q3 = statistics.quantiles(kept, n=4, method="inclusive")
+        iqr, stdev = q3 - q1, statistics.stdev(kept)
+    else:
+        iqr = stdev = 0.0
+
+    return {
+        "samples": list(times),
+        "outliers": len(times) - len(kept),
+        "median": statistics.median(kept),
+        "mean": statistics.fmean(kept),
+        "stdev": stdev,
+        "iqr": iqr,
+        "min": min(kept),
+        "max": max(kept),
+    }
+
+
+def measure(
+    name: str,
+    repeat: int = 1,
+    min_time: float = 0.0,
+    warmup: int = 0,
+    **kwargs: Any,
+) -> Dict[str, Any]:
+    """
+    Run one algorithm repeatedly and attach timing statistics to its result.
 
-    # Euler
-    print("4/8 Running Euler Convergence...")
-    results.append(euler.calculate())
+    The garbage collector is run before and disabled during each measured
+    run, as in timeit. Runs continue until both repeat runs and min_time
+    seconds of measured time are reached (at most MAX_REPEATS runs).
 
-    # Bailey
-    print("5/8 Running Bailey-Borwein-Plouffe...")
-    results.append(bailey.calculate())
+    Args:
+        name: Name of the algorithm to run.
+        repeat: Minimum number of measured runs (default: 1).
+        min_time: Minimum total measured time in seconds (default: 0).
+        warmup: Number of unmeasured runs before the measured ones (default: 0).
+        **kwargs: Additional arguments to pass to the algorithm.
 
-    # Relative Prime
-    print("6/8 Running Relative Prime Probability...")
-    results.append(relative_prime.calculate())
+    Returns:
+        Result dictionary of the last run, with time_seconds set to the median,
+        a timing entry holding the statistics (see summarize), and the
+        algorithm name and arguments under algorithm and params.
+    """
+    algorithm = ALGORITHMS[name]
 
-    # Machin
-    print("7/8 Running Machin's Formula...")
-    results.append(machin.calculate())
+    for _ in range(warmup):
+        algorithm.calculate(**kwargs)
+
+    times: List[float] = []
+    result: Dict[str, Any] = {}
+    while len(times) < MAX_REPEATS and (len(times) < max(repeat, 1) or sum(times) < min_time):
+        gc.collect()
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            result = algorithm.calculate(**kwargs)
+        finally:
+            if gc_enabled:
+                gc.enable()
+        times.append(result["time_seconds"])
+
+    timing = summarize(times)
+    timing["warmup"] = warmup
+    result["time_seconds"] = timing["median"]
+    result["timing"] = timing
+    result["algorithm"] = name
+    result["params"] = kwargs
+    return result
+
+
+def _run_isolated(
+    connection: Connection,
+    info: AlgorithmInfo,
+    memory_limit: Optional[int],
+    options: Dict[str, Any],
+) -> None:
+    """
+    Measure one algorithm in a worker process and send back the outcome.
 
-    # Ramanujan
-    print("8/8 Running Ramanujan's Formula...")
-    results.append(ramanujan.calculate())
+    Args:
+        connection: Write end of the pipe to the parent.
+        info: Registry entry of the algorithm to run. It is registered again
+            in the worker, which does not inherit run-time registrations
+            unless it was forked.
+        memory_limit: Address-space limit in bytes, or None.
+        options: Keyword arguments for measure.
+    """
+    name = info.name
+    try:
+        if info.target:
+            ALGORITHMS.register(name, info.target, info.label)
+        if memory_limit is not None and resource is not None:
+            resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+        connection.send(("ok", measure(name, **options)))
+    except MemoryError:
+        connection.send(("error", "memory limit exceeded"))
+    except Exception as e:
+        connection.send(("error", f"{type(e).__name__}: {e}"))
+    finally:
+        connection.close()
+
+
+def _failure(name: str, status: str, error: str, elapsed: float) -> Dict[str, Any]:
+    """
+    Build the result entry of an algorithm that did not complete.
+
+    Args:
+        name: Name of the algorithm.
+        status: Either "timeout" or "error".
+        error: Description of the failure.
+        elapsed: Wall-clock seconds until the failure.
+
+    Returns:
+        Result dictionary with pi set to None.
+    """
+    return {
+        "method": ALGORITHMS.label(name),
+        "algorithm": name,
+        "params": {},
+        "pi": None,
+        "time_seconds": elapsed,
+        "status": status,
+        "error": error,
+    }
+
+
+def _stop(process: BaseProcess) -> None:
+    """
+    Terminate a worker process, killing it if it does not exit in time.
+
+    Args:
+        process: The worker process.
+    """
+    process.terminate()
+    process.join(KILL_GRACE_SECONDS)
+    if process.is_alive():
+        process.kill()
+        process.join()
+
+
+def _run_in_workers(
+    names: List[str],
+    jobs: int,
+    timeout: Optional[float],
+    memory_limit: Optional[int],
+    options: Dict[str, Any],
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Run algorithms in isolated worker processes, at most jobs at a time.
+
+    Each algorithm gets its own process, so a crash or runaway run cannot
+    take the suite down. Results are collected as they complete; a run that
+    exceeds the timeout is terminated and reported with status "timeout".
+
+    Args:
+        names: Names of the algorithms to run.
+        jobs: Maximum number of concurrent worker processes.
+        timeout: Wall-clock limit per algorithm in seconds, or None.
+        memory_limit: Address-space limit per worker in bytes, or None.
+        options: Keyword arguments for measure.
+
+    Returns:
+        Map of algorithm names to result dictionaries.
+    """
+    context = multiprocessing.get_context()
+    pending = list(names)
+    running: Dict[Connection, Tuple[str, BaseProcess, float]] = {}
+    results: Dict[str, Dict[str, Any]] = {}
+
+    def finish(name: str, result: Dict[str, Any]) -> None:
+        results[name] = result
+        status = result["status"]
+        outcome = f"done in {result['time_seconds']:.6f} s" if status == "ok" else result["error"]
+        print(f"{len(results)}/{len(names)} {ALGORITHMS.label(name)}: {outcome}")
+
+    try:
+        while pending or running:
+            while pending and len(running) < jobs:
+                name = pending.pop(0)
+                receiver, sender = context.Pipe(duplex=False)
+                # Not daemonic, so algorithms can start process pools of their own
+                process = context.Process(
+                    target=_run_isolated,
+                    args=(sender, ALGORITHMS.info(name), memory_limit, options),
+                )
+                process.start()
+                sender.close()
+                running[receiver] = (name, process, time.perf_counter())
+
+            wait_time = None
+            if timeout is not None:
+                deadline = min(started for _, _, started in running.values()) + timeout
+                wait_time = max(deadline - time.perf_counter(), 0.0)
+
+            ready = wait(list(running), wait_time)
+            for receiver in [receiver for receiver in running if receiver in ready]:
+                name, worker, started = running.pop(receiver)
+                try:
+                    status, payload = receiver.recv()
+                except EOFError:
+                    status, payload = "error", "worker exited unexpectedly"
+                receiver.close()
+                worker.join()
+                if status == "ok":
+                    payload["status"] = "ok"
+                    finish(name, payload)
+                else:
+                    finish(name, _failure(name, status, payload, time.perf_counter() - started))
+
+            if timeout is not None:
+                now = time.perf_counter()
+                for receiver, (name, worker, started) in list(running.items()):
+                    if now - started >= timeout:
+                        del running[receiver]
+                        _stop(worker)
+                        receiver.close()
+                        finish(
+                            name,
+                            _failure(
+                                name, "timeout", f"timed out after {timeout} s", now - started
+                            ),
+                        )
+    finally:
+        for receiver, (_, worker, _) in running.items():
+            _stop(worker)
+            receiver.close()
+
+    return results
+
+
+def run_all_algorithms(
+    repeat: int = 1,
+    min_time: float = 0.0,
+    warmup: int = 0,
+    jobs: Optional[int] = None,
+    timeout: Optional[float] = None,
+    memory_limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Run all available Pi calculation algorithms.
+
+    By default the algorithms run one after another in the calling process.
+    With jobs, a timeout or a memory limit, each algorithm runs in its own
+    worker process instead (see _run_in_workers); runs that time out or fail
+    are reported with pi set to None and a status of "timeout" or "error".
+
+    Args:
+        repeat: Minimum number of measured runs per algorithm (default: 1).
+        min_time: Minimum measured time per algorithm in seconds (default: 0).
+        warmup: Number of unmeasured runs per algorithm (default: 0).
+        jobs: Number of concurrent worker processes (default: run in-process,
+            or one worker if a timeout or memory limit is set).
+        timeout: Wall-clock limit per algorithm in seconds (default: none).
+        memory_limit: Address-space limit per worker in bytes (default: none;
+            ignored where the resource module is unavailable).
+
+    Returns:
+        List of result dictionaries from each algorithm, in suite order, with
+        the execution mode ("in-process" or "workers") and the number of
+        concurrent jobs.
+    """
+    options: Dict[str, Any] = {"repeat": repeat, "min_time": min_time, "warmup": warmup}
+    names = list(ALGORITHMS)
+
+    if jobs is None and (timeout is not None or memory_limit is not None):
+        jobs = 1
+
+    if jobs is not None:
+        print(f"Running all algorithms in {jobs} worker process(es)...\n")
+        completed = _run_in_workers(names, jobs, timeout, memory_limit, options)
+        print("\nAll algorithms completed!\n")
+        for result in completed.values():
+            result.update({"mode": "workers", "jobs": jobs})
+        return [completed[name] for name in names]
+
+    results = []
+
+    print("Running all algorithms...\n")
+
+    for index, name in enumerate(names, start=1):
+        print(f"{index}/{len(names)} Running {ALGORITHMS.label(name)}...")
+        result = measure(name, **options)
+        result.update({"status": "ok", "mode": "in-process", "jobs": 1})
+        results.append(result)
 
     print("\nAll algorithms completed!\n")
 
@@ -93,6 +384,61 @@ def calculate_accuracy(pi_value: Any) -> float:
     return abs(true_pi - calculated_pi)
 
 
+def correct_digits(pi_value: Any, store: Optional[ReferenceStore] = None) -> Optional[int]:
+    """
+    Count the decimal places of a Pi approximation that match the true digits.
+
+    The store is only read: results longer than the store are counted as far
+    as it reaches, and if they match all the way the count is unknown. Run
+    pivalue reference (ReferenceStore.extend) to check longer results.
+
+    Args:
+        pi_value: The calculated Pi value (can be string, float, or Decimal).
+        store: Reference digit store (default: the store at the default path).
+
+    Returns:
+        Number of correct decimal places, or None if the result matches every
+        decimal place the store holds and has more.
+    """
+    if store is None:
+        store = ReferenceStore()
+    integer_part, _, fraction = str(pi_value).partition(".")
+    if integer_part != "3":
+        return 0
+    places = len(fraction) - len(fraction.lstrip("0123456789"))
+    held = len(store)
+    matched = store.matching_digits(pi_value)
+    if places > held and matched == held:
+        return None
+    return matched
+
+
+def score_results(
+    results: List[Dict[str, Any]], store: Optional[ReferenceStore] = None
+) -> List[Dict[str, Any]]:
+    """
+    Add accuracy_error and correct_digits to every successful result.
+
+    HistoryStore.record keeps correct_digits, which is what the target-digits
+    mode calibrates from, so score results before recording them.
+
+    Args:
+        results: List of result dictionaries from algorithms.
+        store: Reference digit store (default: the store at the default path).
+
+    Returns:
+        The same list, updated in place.
+    """
+    if store is None:
+        store = ReferenceStore()
+    for result in results:
+        if result["pi"] is None:
+            continue
+        result["accuracy_error"] = calculate_accuracy(result["pi"])
+        result["correct_digits"] = correct_digits(result["pi"], store)
+    return results
+
+
 def print_comparison_table(results: List[Dict[str, Any]]) -> None:
     """
     Print a formatted comparison table of all results.
@@ -100,19 +446,35 @@ def print_comparison_table(results: List[Dict[str, Any]]) -> None:
     Args:
         results: List of result dictionaries from algorithms.
     """
-    print("=" * 100)
-    print(f"{'Method':<35} {'Pi Value':<20} {'Error':<15} {'Time (s)':<15}")
-    print("=" * 100)
+    store = ReferenceStore()
+
+    print("=" * 125)
+    print(
+        f"{'Method':<35} {'Pi Value':<20} {'Error':<15} {'Digits':<10} "
+        f"{'Time (s)':<15} {'IQR (s)':<15}"
+    )
+    print("=" * 125)
 
     for result in results:
         method = result["method"]
+        if result["pi"] is None:
+            status = result.get("status", "error").upper()
+            print(f"{method:<35} {status:<20} {result.get('error', '')}")
+            continue
+
         pi_val = str(result["pi"])[:18]  # Truncate for display
         error = calculate_accuracy(result["pi"])
+        digits = correct_digits(result["pi"], store)
+        digits_text = str(digits) if digits is not None else "unknown"
         time_sec = result["time_seconds"]
+        iqr = result.get("timing", {}).get("iqr", 0.0)
 
-        print(f"{method:<35} {pi_val:<20} {error:<15.2e} {time_sec:<15.6f}")
+        print(
+            f"{method:<35} {pi_val:<20} {error:<15.2e} {digits_text:<10} "
+            f"{time_sec:<15.6f} {iqr:<15.6f}"
+        )
 
-    print("=" * 100)
+    print("=" * 125)
 
 
 def export_results(results: List[Dict[str, Any]], filename: str = "results.json") -> None:
@@ -123,31 +485,9 @@ def export_results(results: List[Dict[str, Any]], filename: str = "results.json"
         results: List of result dictionaries from algorithms.
         filename: Output filename (default: results.json).
     """
-    # Add accuracy to each result
-    for result in results:
-        result["accuracy_error"] = calculate_accuracy(result["pi"])
+    score_results(results)
 
     with open(filename, "w") as f:
         json.dump(results, f, indent=2, default=str)
 
     print(f"\nResults exported to {filename}")
-
-
-def run_single_algorithm(name: str, **kwargs: Any) -> Optional[Dict[str, Any]]:
-    """
-    Run a single algorithm by name.
-
-    Args:
-        name: Name of the algorithm to run.
-        **kwargs: Additional arguments to pass to the algorithm.
-
-    Returns:
-        Result dictionary from the algorithm, or None if algorithm not found.
-    """
-    if name not in ALGORITHMS:
-        print(f"Error: Algorithm '{name}' not found.")
-        print(f"Available algorithms: {', '.join(ALGORITHMS.keys())}")
-        return None
-
-    algorithm = ALGORITHMS[name]
-    return algorithm.calculate(**kwargs)
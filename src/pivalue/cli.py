@@ -3,16 +3,107 @@ Command-line interface for PiValue.
 """
 
 import argparse
+import os
 import sys
-from typing import Optional
+from typing import Any, Dict, Optional
+
 from pivalue import __version__
-from pivalue.benchmark import (
-    run_all_algorithms,
-    run_single_algorithm,
-    print_comparison_table,
-    export_results,
-    ALGORITHMS,
-)
+from pivalue.registry import ALGORITHMS, run_single_algorithm
+from pivalue.stream import STREAM_ALGORITHMS
+
+# Command implementations are imported when their command runs, so a short
+# pivalue run does not pay for the benchmark, history or verification code.
+
+# Default wall-clock limit per algorithm, in seconds
+DEFAULT_TIMEOUT = 600.0
+
+# Options of the run command, by the calculate() parameter they set
+RUN_OPTIONS = {
+    "num_iterations": "--iterations",
+    "digits": "--digits",
+    "workers": "--workers",
+    "checkpoint": "--checkpoint",
+    "formula": "--formula",
+}
+
+
+def add_suite_arguments(parser: argparse.ArgumentParser, parallel: bool) -> None:
+    """
+    Add the options that control how the algorithm suite is executed.
+
+    Args:
+        parser: Parser of a command that runs all algorithms.
+        parallel: Whether the command runs on all CPUs by default; otherwise it
+            runs serially unless --jobs, --timeout or --memory-limit is given.
+    """
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--jobs",
+        type=int,
+        default=(os.cpu_count() or 1) if parallel else None,
+        help="Number of algorithms run concurrently in worker processes "
+        + (
+            "(default: all CPUs)"
+            if parallel
+            else "(default: one at a time; concurrent algorithms compete for cores)"
+        ),
+    )
+    mode.add_argument(
+        "--serial",
+        action="store_true",
+        help="Run the algorithms one after another in this process, for clean timing",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        help=f"Seconds before an algorithm is stopped (default: {DEFAULT_TIMEOUT:g}; "
+        "not with --serial)",
+    )
+    parser.add_argument(
+        "--memory-limit",
+        type=int,
+        help="Memory limit per algorithm in MB (not with --serial)",
+    )
+
+
+def suite_options(args: argparse.Namespace, parser: argparse.ArgumentParser) -> Dict[str, Any]:
+    """
+    Translate the suite options into keyword arguments for run_all_algorithms.
+
+    Args:
+        args: Parsed command-line arguments.
+        parser: Parser of the command, for reporting invalid combinations.
+
+    Returns:
+        Keyword arguments for run_all_algorithms.
+    """
+    if args.serial:
+        if args.timeout is not None or args.memory_limit is not None:
+            parser.error("--timeout and --memory-limit need worker processes, not --serial")
+        return {}
+    if args.jobs is None and args.timeout is None and args.memory_limit is None:
+        return {}
+    timeout = args.timeout if args.timeout is not None else DEFAULT_TIMEOUT
+    memory_limit = args.memory_limit * 2**20 if args.memory_limit is not None else None
+    return {"jobs": args.jobs, "timeout": timeout, "memory_limit": memory_limit}
+
+
+def parse_value(text: str) -> Any:
+    """
+    Convert a command-line value to an int or float where it looks like one.
+
+    Args:
+        text: The value as given.
+
+    Returns:
+        The value as an int, a float, or the original string.
+    """
+    for convert in (int, float):
+        try:
+            return convert(text)
+        except ValueError:
+            pass
+    return text
 
 
 def main() -> int:
@@ -28,9 +119,18 @@ def main() -> int:
         epilog="""
 Examples:
   pivalue run mandelbrot          # Run Mandelbrot algorithm
+  pivalue run chudnovsky --digits 100000  # 100k digits of Pi
   pivalue run-all                 # Run all algorithms
+  pivalue run-all --jobs 4 --timeout 60 --memory-limit 2048
   pivalue benchmark               # Run all and show comparison
   pivalue benchmark --export      # Run all and export to JSON
+  pivalue benchmark --repeat 20 --warmup 2 --affinity 2  # Stable timings
+  pivalue benchmark --compare     # Fail on slowdowns against the history
+  pivalue rank-formulas --digits 1000000 --workers 64
+  pivalue stream --limit 10000 --output pi.txt  # Stream digits to a file
+  pivalue stream --base 16 | head -c 100        # Stream hex digits
+  pivalue reference --digits 10000000           # Extend the reference digits
+  pivalue verify pi.txt --samples 32 --workers 8  # Spot-check a digit file
         """,
     )
 
@@ -42,8 +142,8 @@ Examples:
     run_parser = subparsers.add_parser("run", help="Run a single algorithm")
     run_parser.add_argument(
         "algorithm",
-        choices=list(ALGORITHMS.keys()),
-        help="Algorithm to run",
+        nargs="?",
+        help="Algorithm to run, see pivalue list (omit with --auto)",
     )
     run_parser.add_argument(
         "--iterations",
@@ -53,16 +153,37 @@ Examples:
     run_parser.add_argument(
         "--digits",
         type=int,
-        help="Number of digits (for Mandelbrot)",
+        help="Number of digits (for applicable algorithms)",
+    )
+    run_parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of worker processes (for applicable algorithms)",
+    )
+    run_parser.add_argument(
+        "--checkpoint",
+        type=str,
+        help="Checkpoint file to resume from and save progress to (for Mandelbrot)",
+    )
+    run_parser.add_argument(
+        "--auto",
+        action="store_true",
+        help="Choose the fastest algorithm and its arguments for --digits correct digits",
+    )
+    run_parser.add_argument(
+        "--formula",
+        help="Machin-like formula (see rank-formulas), or auto for the cheapest one (for Machin)",
     )
 
     # Run all algorithms
-    subparsers.add_parser("run-all", help="Run all algorithms")
+    run_all_parser = subparsers.add_parser("run-all", help="Run all algorithms")
+    add_suite_arguments(run_all_parser, parallel=True)
 
     # Benchmark
     benchmark_parser = subparsers.add_parser(
         "benchmark", help="Run all algorithms and compare results"
     )
+    add_suite_arguments(benchmark_parser, parallel=False)
     benchmark_parser.add_argument(
         "--export",
         action="store_true",
@@ -74,10 +195,182 @@ Examples:
         default="results.json",
         help="Output filename for export (default: results.json)",
     )
+    benchmark_parser.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        help="Minimum number of measured runs per algorithm (default: 1)",
+    )
+    benchmark_parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.0,
+        help="Minimum measured time per algorithm in seconds (default: 0)",
+    )
+    benchmark_parser.add_argument(
+        "--warmup",
+        type=int,
+        default=0,
+        help="Number of unmeasured warmup runs per algorithm (default: 0)",
+    )
+    benchmark_parser.add_argument(
+        "--compare",
+        action="store_true",
+        help="Compare with the stored baseline and exit with status 1 on a slowdown",
+    )
+    benchmark_parser.add_argument(
+        "--threshold",
+        type=float,
+        help="Smallest relative slowdown flagged by --compare, e.g. 0.1 for 10%%",
+    )
+    benchmark_parser.add_argument(
+        "--history",
+        type=str,
+        help="History database (default: $PIVALUE_HISTORY or the user cache)",
+    )
+    benchmark_parser.add_argument(
+        "--affinity",
+        type=str,
+        help="Comma-separated CPUs to pin the benchmark to, e.g. 2 or 2,3",
+    )
 
     # List algorithms
     subparsers.add_parser("list", help="List all available algorithms")
 
+    # Rank Machin-like formulas
+    rank_parser = subparsers.add_parser(
+        "rank-formulas", help="Rank Machin-like formulas by estimated cost"
+    )
+    rank_parser.add_argument(
+        "--digits",
+        type=int,
+        default=1000,
+        help="Number of digits to estimate for (default: 1000)",
+    )
+    rank_parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of worker cores available (default: all CPUs)",
+    )
+
+    # Stream digits
+    stream_parser = subparsers.add_parser("stream", help="Stream the digits of Pi")
+    stream_parser.add_argument(
+        "--algorithm",
+        choices=STREAM_ALGORITHMS,
+        default="spigot",
+        help="Digit producer (default: spigot)",
+    )
+    stream_parser.add_argument(
+        "--base",
+        type=int,
+        default=10,
+        help="Base of the digits, 2 to 36 (default: 10)",
+    )
+    stream_parser.add_argument(
+        "--limit",
+        type=int,
+        help="Number of digits after the point (default: unlimited)",
+    )
+    stream_parser.add_argument(
+        "--output",
+        type=str,
+        help="Output file (default: standard output)",
+    )
+
+    # Reference digit store
+    reference_parser = subparsers.add_parser(
+        "reference", help="Create or extend the reference digit store"
+    )
+    reference_parser.add_argument(
+        "--digits",
+        type=int,
+        default=1000000,
+        help="Number of decimal places to store (default: 1000000)",
+    )
+    reference_parser.add_argument(
+        "--path",
+        type=str,
+        help="Store file (default: $PIVALUE_REFERENCE or the user cache)",
+    )
+    reference_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes (default: 1)",
+    )
+
+    # Verify a digit file
+    verify_parser = subparsers.add_parser(
+        "verify", help="Check a digit file at randomly chosen positions"
+    )
+    verify_parser.add_argument("file", help="Digit file starting with '3.'")
+    verify_parser.add_argument(
+        "--base",
+        type=int,
+        choices=[10, 16],
+        help="Base of the digits (default: detected from the file)",
+    )
+    verify_parser.add_argument(
+        "--samples",
+        type=int,
+        help="Number of positions to check, including the last window",
+    )
+    verify_parser.add_argument(
+        "--seed",
+        type=int,
+        help="Seed for choosing the positions",
+    )
+    verify_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes for hexadecimal checks (default: 1)",
+    )
+    verify_parser.add_argument(
+        "--confidence",
+        type=float,
+        help="Confidence level of the reported bound",
+    )
+
+    # Complexity sweep
+    sweep_parser = subparsers.add_parser(
+        "sweep", help="Fit time and accuracy of an algorithm over a parameter range"
+    )
+    sweep_parser.add_argument(
+        "algorithm",
+        help="Algorithm to sweep, see pivalue list",
+    )
+    sweep_parser.add_argument(
+        "--param",
+        required=True,
+        help="Argument of the algorithm to sweep, e.g. num_iterations or digits",
+    )
+    sweep_parser.add_argument(
+        "--range",
+        required=True,
+        dest="value_range",
+        help="Values as start:stop[:log|lin[:points]], e.g. 1e3:1e7:log",
+    )
+    sweep_parser.add_argument(
+        "--set",
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="Fixed argument passed to every run (repeatable)",
+    )
+    sweep_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of grid points run concurrently (default: 1)",
+    )
+    sweep_parser.add_argument(
+        "--export",
+        type=str,
+        help="Export the sweep to a .csv or .json file",
+    )
+
     args = parser.parse_args()
 
     if not args.command:
@@ -86,21 +379,158 @@ Examples:
 
     if args.command == "list":
         print("Available algorithms:")
-        for name in ALGORITHMS.keys():
+        for name in ALGORITHMS:
             print(f"  - {name}")
         return 0
 
-    elif args.command == "run":
-        kwargs = {}
-        if args.iterations is not None:
-            kwargs["num_iterations"] = args.iterations
-        if args.digits is not None:
-            kwargs["digits"] = args.digits
-
-        result = run_single_algorithm(args.algorithm, **kwargs)
-        if result is None:
+    elif args.command == "rank-formulas":
+        from pivalue.algorithms import machin
+
+        ranking = machin.rank_formulas(args.digits, args.workers)
+        print(f"{'Rank':<6} {'Formula':<12} {'Lehmer measure':<16} {'Est. time (s)':<15}")
+        for rank, (name, cost) in enumerate(ranking, start=1):
+            measure = machin.lehmer_measure(machin.FORMULAS[name])
+            print(f"{rank:<6} {name:<12} {measure:<16.4f} {cost:<15.6f}")
+        return 0
+
+    elif args.command == "stream":
+        from pivalue.stream import stream_digits, write_digits
+
+        try:
+            digits = stream_digits(args.algorithm, args.base)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return 1
+
+        try:
+            if args.output is not None:
+                with open(args.output, "w") as f:
+                    write_digits(digits, f, args.limit)
+            else:
+                write_digits(digits, sys.stdout, args.limit)
+                print()
+        except BrokenPipeError:
+            # The reader (e.g. head) has closed the pipe; stop quietly
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        except KeyboardInterrupt:
+            return 130
+        return 0
+
+    elif args.command == "reference":
+        from pivalue.reference import ReferenceStore
+
+        store = ReferenceStore(args.path)
+        try:
+            count = store.extend(args.digits, args.workers)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return 1
+        print(f"{store.path}: {count} decimal places")
+        return 0
+
+    elif args.command == "verify":
+        from pivalue.verify import verify_file
+
+        options: Dict[str, Any] = {"base": args.base, "seed": args.seed, "workers": args.workers}
+        if args.samples is not None:
+            options["samples"] = args.samples
+        if args.confidence is not None:
+            options["confidence"] = args.confidence
+        try:
+            report = verify_file(args.file, **options)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}")
+            return 1
+
+        print(f"File: {report['path']} ({report['digits']} base-{report['base']} digits)")
+        if report["checked_digits"] < report["digits"]:
+            print(f"Checked range: first {report['checked_digits']} digits (reference length)")
+        print(f"Positions checked: {len(report['positions'])} (seed {report['seed']})")
+        if report["passed"]:
+            print(
+                f"PASSED: with {report['confidence']:.0%} confidence fewer than "
+                f"{report['error_bound']:.2%} of the digit windows are wrong"
+            )
+            return 0
+        if report["status"] == "unverified":
+            print(
+                f"UNVERIFIED: the sampled windows match, but digits after "
+                f"{report['checked_digits']} are beyond the reference; extend it with "
+                f"pivalue reference --digits {report['digits']}"
+            )
+            return 1
+        print(f"FAILED: mismatches at positions {', '.join(map(str, report['mismatches']))}")
+        return 1
+
+    elif args.command == "sweep":
+        from pivalue.sweep import export_sweep, parse_range, print_sweep, run_sweep
+
+        if args.algorithm not in ALGORITHMS:
+            print(f"Error: Algorithm '{args.algorithm}' not found.")
+            return 1
+
+        fixed: Dict[str, Any] = {}
+        try:
+            values = parse_range(args.value_range)
+            for assignment in args.set:
+                name, separator, value = assignment.partition("=")
+                if not separator:
+                    raise ValueError(f"Invalid --set '{assignment}', expected NAME=VALUE")
+                fixed[name] = parse_value(value)
+            sweep = run_sweep(args.algorithm, args.param, values, args.workers, fixed)
+        except (TypeError, ValueError) as e:
+            print(f"Error: {e}")
             return 1
 
+        print_sweep(sweep)
+        if args.export:
+            export_sweep(sweep, args.export)
+        return 0
+
+    elif args.command == "run":
+        if args.auto:
+            from pivalue.dispatch import compute
+
+            if args.algorithm is not None or args.digits is None:
+                run_parser.error("--auto needs --digits and no algorithm")
+            try:
+                result = compute(args.digits, args.workers or 1)
+            except ValueError as e:
+                print(f"Error: {e}")
+                return 1
+            print(
+                f"\nSelected {result['algorithm']} with {result['params']} "
+                f"(estimated {result['estimated_seconds']:.6f} seconds)"
+            )
+        else:
+            if args.algorithm is None:
+                run_parser.error("choose an algorithm, or --auto with --digits")
+
+            kwargs = {
+                parameter: getattr(args, option.lstrip("-"))
+                for parameter, option in RUN_OPTIONS.items()
+                if getattr(args, option.lstrip("-")) is not None
+            }
+            if args.algorithm in ALGORITHMS:
+                import inspect
+
+                accepted = inspect.signature(ALGORITHMS[args.algorithm].calculate).parameters
+                unsupported = [
+                    RUN_OPTIONS[parameter] for parameter in kwargs if parameter not in accepted
+                ]
+                if unsupported:
+                    print(f"Error: {args.algorithm} does not support {', '.join(unsupported)}")
+                    return 1
+
+            try:
+                single = run_single_algorithm(args.algorithm, **kwargs)
+            except ValueError as e:
+                print(f"Error: {e}")
+                return 1
+            if single is None:
+                return 1
+            result = single
+
         print(f"\n{'=' * 60}")
         print(f"Method: {result['method']}")
         print(f"{'=' * 60}")
@@ -113,21 +543,78 @@ Examples:
         return 0
 
     elif args.command == "run-all":
-        results = run_all_algorithms()
+        from pivalue.benchmark import run_all_algorithms
+
+        results = run_all_algorithms(**suite_options(args, run_all_parser))
         print("\nResults:")
         print("-" * 60)
         for result in results:
-            print(f"{result['method']}: {result['pi']}")
+            if result["pi"] is None:
+                print(f"{result['method']}: {result['status'].upper()} ({result['error']})")
+            else:
+                print(f"{result['method']}: {result['pi']}")
         print("-" * 60)
         return 0
 
     elif args.command == "benchmark":
-        results = run_all_algorithms()
+        from pivalue.benchmark import (
+            export_results,
+            pin_cpus,
+            print_comparison_table,
+            run_all_algorithms,
+            score_results,
+        )
+        from pivalue.history import MIN_SAMPLES, HistoryStore, print_regression_report
+
+        if args.affinity is not None:
+            if args.jobs is not None and args.jobs > 1:
+                benchmark_parser.error(
+                    "--affinity pins every worker to the same CPUs; use it without --jobs"
+                )
+            try:
+                pinned = pin_cpus(int(cpu) for cpu in args.affinity.split(","))
+            except ValueError:
+                print(f"Error: invalid CPU list '{args.affinity}', expected e.g. 2 or 2,3")
+                return 1
+            except OSError as e:
+                print(f"Error: cannot pin to CPUs {args.affinity}: {e}")
+                return 1
+            if not pinned:
+                print("Warning: CPU affinity is not supported on this platform")
+
+        repeat = args.repeat
+        if args.compare and repeat < MIN_SAMPLES:
+            print(f"Note: --compare needs at least {MIN_SAMPLES} runs per algorithm\n")
+            repeat = MIN_SAMPLES
+
+        results = run_all_algorithms(
+            repeat=repeat,
+            min_time=args.min_time,
+            warmup=args.warmup,
+            **suite_options(args, benchmark_parser),
+        )
+        score_results(results)
         print_comparison_table(results)
 
         if args.export:
             export_results(results, args.output)
 
+        history = HistoryStore(args.history)
+        thresholds = {"threshold": args.threshold} if args.threshold is not None else {}
+        comparison = history.compare(results, **thresholds) if args.compare else None
+        recorded = history.record(results, comparison)
+        print(f"\n{recorded} result(s) recorded in {history.path}")
+
+        if comparison is not None:
+            print()
+            print_regression_report(comparison)
+            regressions = [
+                entry for entry in comparison if entry["status"] in ("regression", "failed")
+            ]
+            if regressions:
+                print(f"\n{len(regressions)} regression(s) against the baseline")
+                return 1
+
         return 0
 
     return 0
@@ -0,0 +1,149 @@
+"""
+Target-digits mode: calculate Pi to a number of correct decimal places with
+whichever algorithm is expected to get there fastest.
+
+Each algorithm module has a convergence model, plan(digits), that maps the
+required digits to the arguments of its calculate() and estimates the run
+time on one core. The power-law cost constants (COST_COEFFICIENT and
+COST_EXPONENT) were fitted with pivalue sweep from 100 to 10,000 digits,
+with CPython 3.11 on an idle x86-64 Linux host. The estimates are refined
+with the benchmark history of this host: a stored run that reached d
+correct digits in t seconds, against a modelled time of plan(d), says how
+much faster or slower the algorithm is here. The geometric mean of these
+ratios scales the estimate of that algorithm.
+"""
+
+import inspect
+import math
+from typing import Dict, Any, List, Optional
+
+from pivalue.history import HistoryStore
+from pivalue.registry import ALGORITHMS
+
+# Runs with fewer correct digits are dominated by fixed overheads the models ignore
+MIN_CALIBRATION_DIGITS = 50
+
+# Most recent runs of each algorithm used for calibration
+CALIBRATION_RUNS = 20
+
+
+def calibration(algorithm: str, history: HistoryStore) -> Optional[float]:
+    """
+    Measure how fast an algorithm runs on this host relative to its model.
+
+    Args:
+        algorithm: Name of the algorithm.
+        history: Benchmark history to calibrate from.
+
+    Returns:
+        Geometric mean of measured over modelled time for recent runs, or
+        None if there are no usable runs.
+    """
+    plan = getattr(ALGORITHMS[algorithm], "plan", None)
+    if plan is None:
+        return None
+
+    ratios = []
+    for digits, seconds in history.digit_timings(algorithm, limit=CALIBRATION_RUNS):
+        if digits < MIN_CALIBRATION_DIGITS:
+            continue
+        model = plan(digits)
+        if model is not None and model["seconds"] > 0:
+            ratios.append(math.log(seconds / model["seconds"]))
+
+    if not ratios:
+        return None
+    return math.exp(sum(ratios) / len(ratios))
+
+
+def candidates(digits: int, history: Optional[HistoryStore] = None) -> List[Dict[str, Any]]:
+    """
+    Rank the algorithms that can deliver the given correct decimal places.
+
+    Args:
+        digits: Number of correct decimal places required.
+        history: Benchmark history for calibration (default: the history at
+            the default path).
+
+    Returns:
+        One entry per capable algorithm, cheapest first, containing:
+            - algorithm: Name of the algorithm
+            - params: Keyword arguments for its calculate()
+            - model_seconds: Run time estimated by its model
+            - calibration: Measured over modelled time on this host, or None
+            - seconds: Estimated run time on this host
+
+    Raises:
+        ValueError: If digits is not positive.
+    """
+    if digits < 1:
+        raise ValueError("digits must be positive")
+    if history is None:
+        history = HistoryStore()
+
+    ranking = []
+    for name, module in ALGORITHMS.items():
+        plan = getattr(module, "plan", None)
+        model = plan(digits) if plan is not None else None
+        if model is None:
+            continue
+        factor = calibration(name, history)
+        ranking.append(
+            {
+                "algorithm": name,
+                "params": model["params"],
+                "model_seconds": model["seconds"],
+                "calibration": factor,
+                "seconds": model["seconds"] * (factor if factor is not None else 1.0),
+            }
+        )
+
+    ranking.sort(key=lambda candidate: candidate["seconds"])
+    return ranking
+
+
+def compute(
+    digits: int, workers: int = 1, history: Optional[HistoryStore] = None
+) -> Dict[str, Any]:
+    """
+    Calculate Pi to the given correct decimal places with the cheapest algorithm.
+
+    Args:
+        digits: Number of correct decimal places required.
+        workers: Number of worker processes, passed to algorithms that take
+            them; the choice itself assumes one core.
+        history: Benchmark history for calibration (default: the history at
+            the default path).
+
+    Returns:
+        The result dictionary of the chosen algorithm, with pi truncated to
+        digits decimal places, and in addition:
+            - algorithm: Name of the chosen algorithm
+            - params: Arguments it was run with
+            - digits: Number of decimal places requested
+            - estimated_seconds: Run time estimated before the run
+
+    Raises:
+        ValueError: If digits is not positive or no algorithm can deliver it.
+    """
+    ranking = candidates(digits, history)
+    if not ranking:
+        raise ValueError(f"No algorithm can calculate {digits} digits")
+
+    best = ranking[0]
+    calculate = ALGORITHMS[best["algorithm"]].calculate
+    params = dict(best["params"])
+    if workers > 1 and "workers" in inspect.signature(calculate).parameters:
+        params["workers"] = workers
+
+    result = dict(calculate(**params))
+    result["pi"] = str(result["pi"])[: digits + 2]
+    result.update(
+        {
+            "algorithm": best["algorithm"],
+            "params": params,
+            "digits": digits,
+            "estimated_seconds": best["seconds"],
+        }
+    )
+    return result
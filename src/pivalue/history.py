@@ -0,0 +1,355 @@
+"""
+Persistent benchmark history with regression detection.
+
+Every benchmark run is appended to a local SQLite database, keyed by
+algorithm, parameters, package version, Python build, host fingerprint and
+execution mode, so timings can be followed across commits, interpreter
+upgrades and machines.
+
+A new run is compared with the latest stored run of the same algorithm and
+parameters on the same host, executed the same way, whatever its package or Python version, which
+is what an upgrade should be gated on. A slowdown is flagged only if it is
+both statistically significant (one-sided Mann-Whitney U test on the timing
+samples) and larger than a minimum relative threshold, so run-to-run noise
+on shared hosts does not fail the gate. Runs flagged as regressions are not
+recorded, or a retry would be compared with the slow run and pass.
+"""
+
+import json
+import math
+import os
+import sqlite3
+from contextlib import closing
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union
+
+from pivalue import __version__
+from pivalue.hostinfo import host_fingerprint, platform_name, python_build
+
+# Environment variable that overrides the default database location
+PATH_VARIABLE = "PIVALUE_HISTORY"
+
+# Significance level of the slowdown test
+DEFAULT_ALPHA = 0.01
+
+# Smallest relative slowdown of the median that counts as a regression
+DEFAULT_THRESHOLD = 0.05
+
+# Fewer samples than this on either side cannot show a significant slowdown
+MIN_SAMPLES = 5
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    recorded_at TEXT NOT NULL,
+    algorithm TEXT NOT NULL,
+    params TEXT NOT NULL,
+    version TEXT NOT NULL,
+    python TEXT NOT NULL,
+    host TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    status TEXT NOT NULL,
+    median REAL,
+    samples TEXT NOT NULL,
+    correct_digits INTEGER,
+    mode TEXT,
+    jobs INTEGER
+);
+CREATE INDEX IF NOT EXISTS runs_by_key ON runs (algorithm, params, host, id);
+"""
+
+# Columns added to the runs table after it was first created; rows recorded
+# before have NULL there and are never used as baselines
+ADDED_COLUMNS = {"mode": "TEXT", "jobs": "INTEGER"}
+
+
+def default_path() -> Path:
+    """
+    Get the default location of the history database.
+
+    Returns:
+        $PIVALUE_HISTORY if set, otherwise history.sqlite in the pivalue
+        directory of the user cache ($XDG_CACHE_HOME or ~/.cache).
+    """
+    if os.environ.get(PATH_VARIABLE):
+        return Path(os.environ[PATH_VARIABLE])
+    cache = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache) / "pivalue" / "history.sqlite"
+
+
+def mann_whitney_p(current: Sequence[float], baseline: Sequence[float]) -> float:
+    """
+    Test whether current samples tend to be larger than baseline samples.
+
+    Uses the normal approximation of the Mann-Whitney U statistic with tie and
+    continuity corrections; it makes no assumption about the shape of the
+    timing distributions.
+
+    Args:
+        current: Samples of the new run.
+        baseline: Samples of the stored run.
+
+    Returns:
+        One-sided p-value of the hypothesis that current is not slower.
+    """
+    n1, n2 = len(current), len(baseline)
+    if n1 == 0 or n2 == 0:
+        return 1.0
+
+    ordered = sorted([(value, True) for value in current] + [(value, False) for value in baseline])
+    rank_sum = 0.0
+    tie_term = 0
+    i = 0
+    while i < len(ordered):
+        j = i
+        while j + 1 < len(ordered) and ordered[j + 1][0] == ordered[i][0]:
+            j += 1
+        # Tied values share the average of their 1-based ranks
+        rank = (i + j) / 2 + 1
+        rank_sum += rank * sum(1 for _, is_current in ordered[i : j + 1] if is_current)
+        tie_term += (j - i + 1) ** 3 - (j - i + 1)
+        i = j + 1
+
+    n = n1 + n2
+    u = rank_sum - n1 * (n1 + 1) / 2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+class HistoryStore:
+    """
+    Benchmark results in a local SQLite database.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None) -> None:
+        """
+        Open a history store; the database is created on first use.
+
+        Args:
+            path: Location of the database (default: default_path()).
+        """
+        self.path = Path(path) if path is not None else default_path()
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open the database, creating it and its schema if needed.
+
+        Returns:
+            A connection to the database.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path)
+        connection.row_factory = sqlite3.Row
+        connection.executescript(SCHEMA)
+        columns = {row["name"] for row in connection.execute("PRAGMA table_info(runs)")}
+        for name, kind in ADDED_COLUMNS.items():
+            if name not in columns:
+                connection.execute(f"ALTER TABLE runs ADD COLUMN {name} {kind}")
+        return connection
+
+    def record(
+        self, results: List[Dict[str, Any]], comparison: Optional[List[Dict[str, Any]]] = None
+    ) -> int:
+        """
+        Append benchmark results to the history.
+
+        Args:
+            results: Result dictionaries from benchmark.run_all_algorithms.
+            comparison: Report of compare() for the same results; results it
+                flags as regressions are left out, so they do not become the
+                baseline a retry is compared with.
+
+        Returns:
+            Number of results recorded.
+        """
+        regressed = {
+            entry["algorithm"] for entry in comparison or [] if entry["status"] == "regression"
+        }
+        results = [result for result in results if result["algorithm"] not in regressed]
+        recorded_at = datetime.now(timezone.utc).isoformat()
+        python, host = python_build(), host_fingerprint()
+        rows = [
+            (
+                recorded_at,
+                result["algorithm"],
+                json.dumps(result.get("params", {}), sort_keys=True, default=str),
+                __version__,
+                python,
+                host,
+                platform_name(),
+                result.get("status", "ok"),
+                result["time_seconds"] if result.get("pi") is not None else None,
+                json.dumps(result.get("timing", {}).get("samples", [])),
+                result.get("correct_digits"),
+                result.get("mode", "in-process"),
+                result.get("jobs", 1),
+            )
+            for result in results
+        ]
+
+        with closing(self._connect()) as connection, connection:
+            connection.executemany(
+                "INSERT INTO runs (recorded_at, algorithm, params, version, python, host, "
+                "platform, status, median, samples, correct_digits, mode, jobs) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def baseline(
+        self,
+        algorithm: str,
+        params: Dict[str, Any],
+        host: Optional[str] = None,
+        mode: str = "in-process",
+        jobs: int = 1,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the latest successful stored run of an algorithm on a host.
+
+        Only runs executed the same way count: timings of algorithms that
+        competed for cores are not comparable with timings of serial runs.
+
+        Args:
+            algorithm: Name of the algorithm.
+            params: Arguments the algorithm was run with.
+            host: Host fingerprint (default: this host).
+            mode: How the suite ran, "in-process" or "workers".
+            jobs: Number of algorithms that ran concurrently.
+
+        Returns:
+            The stored run, with samples decoded, or None if there is none.
+        """
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                "SELECT * FROM runs WHERE algorithm = ? AND params = ? AND host = ? "
+                "AND mode = ? AND jobs = ? AND status = 'ok' ORDER BY id DESC LIMIT 1",
+                (
+                    algorithm,
+                    json.dumps(params, sort_keys=True, default=str),
+                    host or host_fingerprint(),
+                    mode,
+                    jobs,
+                ),
+            ).fetchone()
+
+        if row is None:
+            return None
+        run = dict(row)
+        run["samples"] = json.loads(run["samples"])
+        return run
+
+    def digit_timings(
+        self, algorithm: str, host: Optional[str] = None, limit: int = 20
+    ) -> List[Tuple[int, float]]:
+        """
+        Get the correct digits and median times of recent successful runs.
+
+        Only runs that had the machine to themselves (one job) are returned.
+
+        Args:
+            algorithm: Name of the algorithm.
+            host: Host fingerprint (default: this host).
+            limit: Maximum number of runs, most recent first.
+
+        Returns:
+            (correct_digits, median) pairs; empty if there is no database yet.
+        """
+        if not self.path.exists():
+            return []
+        with closing(self._connect()) as connection:
+            rows = connection.execute(
+                "SELECT correct_digits, median FROM runs WHERE algorithm = ? AND host = ? "
+                "AND jobs = 1 AND status = 'ok' AND correct_digits > 0 AND median > 0 "
+                "ORDER BY id DESC LIMIT ?",
+                (algorithm, host or host_fingerprint(), limit),
+            ).fetchall()
+        return [(row["correct_digits"], row["median"]) for row in rows]
+
+    def compare(
+        self,
+        results: List[Dict[str, Any]],
+        alpha: float = DEFAULT_ALPHA,
+        threshold: float = DEFAULT_THRESHOLD,
+    ) -> List[Dict[str, Any]]:
+        """
+        Compare benchmark results with their stored baselines.
+
+        Call this before recording the results, or they become their own baseline.
+
+        Args:
+            results: Result dictionaries from benchmark.run_all_algorithms.
+            alpha: Significance level of the slowdown test.
+            threshold: Smallest relative slowdown of the median that counts.
+
+        Returns:
+            One entry per result with algorithm, method, baseline and current
+            medians, ratio, p_value, the baseline version and Python build, and
+            a status: "regression", "failed" (the run did not complete), "ok",
+            "no baseline", or "insufficient samples".
+        """
+        report = []
+        for result in results:
+            baseline = self.baseline(
+                result["algorithm"],
+                result.get("params", {}),
+                mode=result.get("mode", "in-process"),
+                jobs=result.get("jobs", 1),
+            )
+            samples = result.get("timing", {}).get("samples", [])
+            entry: Dict[str, Any] = {
+                "algorithm": result["algorithm"],
+                "method": result["method"],
+                "current_median": result["time_seconds"] if result.get("pi") is not None else None,
+                "baseline_median": baseline["median"] if baseline else None,
+                "baseline_version": baseline["version"] if baseline else None,
+                "baseline_python": baseline["python"] if baseline else None,
+                "ratio": None,
+                "p_value": None,
+            }
+
+            if result.get("pi") is None:
+                entry["status"] = "failed"
+            elif baseline is None:
+                entry["status"] = "no baseline"
+            elif len(samples) < MIN_SAMPLES or len(baseline["samples"]) < MIN_SAMPLES:
+                entry["status"] = "insufficient samples"
+            else:
+                entry["ratio"] = entry["current_median"] / baseline["median"]
+                entry["p_value"] = mann_whitney_p(samples, baseline["samples"])
+                slower = entry["ratio"] > 1 + threshold and entry["p_value"] < alpha
+                entry["status"] = "regression" if slower else "ok"
+
+            report.append(entry)
+        return report
+
+
+def print_regression_report(report: List[Dict[str, Any]]) -> None:
+    """
+    Print a comparison of benchmark results with their baselines.
+
+    Args:
+        report: Entries from HistoryStore.compare.
+    """
+    print("=" * 110)
+    print(
+        f"{'Method':<35} {'Baseline (s)':<15} {'Current (s)':<15} {'Ratio':<10} "
+        f"{'p-value':<10} {'Status':<20}"
+    )
+    print("=" * 110)
+
+    for entry in report:
+        baseline = "-" if entry["baseline_median"] is None else f"{entry['baseline_median']:.6f}"
+        current = "-" if entry["current_median"] is None else f"{entry['current_median']:.6f}"
+        ratio = f"{entry['ratio']:.3f}" if entry["ratio"] is not None else "-"
+        p_value = f"{entry['p_value']:.4f}" if entry["p_value"] is not None else "-"
+        print(
+            f"{entry['method']:<35} {baseline:<15} {current:<15} {ratio:<10} "
+            f"{p_value:<10} {entry['status'].upper():<20}"
+        )
+
+    print("=" * 110)
@@ -0,0 +1,61 @@
+"""
+Platform and host information, collected once per process.
+
+The platform module can be slow: platform() and processor() read system
+files and on some systems start uname or other probes. Every result
+dictionary carries the platform string, so each value here is computed
+on first use and cached for the rest of the process.
+"""
+
+import hashlib
+import os
+import platform
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def platform_name() -> str:
+    """
+    Describe the operating system and architecture.
+
+    Returns:
+        The result of platform.platform().
+    """
+    return platform.platform()
+
+
+@lru_cache(maxsize=None)
+def python_build() -> str:
+    """
+    Describe the running Python build.
+
+    Returns:
+        Implementation, version, build number and date, and compiler.
+    """
+    build, date = platform.python_build()
+    return (
+        f"{platform.python_implementation()} {platform.python_version()} "
+        f"({build}, {date}) [{platform.python_compiler()}]"
+    )
+
+
+@lru_cache(maxsize=None)
+def host_fingerprint() -> str:
+    """
+    Fingerprint the host the benchmarks run on.
+
+    Returns:
+        A short hash of the host name, operating system, architecture,
+        processor and CPU count.
+    """
+    host = "|".join(
+        [
+            platform.node(),
+            platform.system(),
+            platform.release(),
+            platform.machine(),
+            platform.processor(),
+            str(os.cpu_count()),
+        ]
+    )
+    return hashlib.sha256(host.encode()).hexdigest()[:16]
@@ -0,0 +1,52 @@
+"""
+Newton's iteration for arbitrary-precision inverse square roots.
+
+Several Pi formulas end with a square root: Chudnovsky's √10005, Ramanujan's
+√2 and the starting value 1/√2 of the Gauss-Legendre iteration. Newton's
+iteration y ← y + y(1 - xy²)/2 for 1/√x needs no division and doubles the
+correct digits every step, so each step runs at only twice the precision of
+the one before. Only the final step runs at the full precision, and the
+whole root costs a small constant number of full-size multiplications.
+
+For more information, visit:
+https://en.wikipedia.org/wiki/Methods_of_computing_square_roots
+"""
+
+from decimal import MAX_EMAX, MIN_EMIN, Decimal, localcontext
+from typing import Union
+
+# Extra digits carried by each intermediate step
+GUARD_DIGITS = 10
+
+# Precision of the starting value, taken with Decimal.sqrt
+START_DIGITS = 40
+
+
+def inverse_sqrt(n: Union[int, Decimal], precision: int) -> Decimal:
+    """
+    Calculate 1/√n with Newton's iteration, doubling the precision each step.
+
+    Args:
+        n: The (positive) value to take the inverse square root of.
+        precision: Number of significant digits required.
+
+    Returns:
+        1/√n to the requested precision.
+    """
+    steps = []
+    while precision > START_DIGITS - GUARD_DIGITS:
+        steps.append(precision)
+        precision = precision // 2 + GUARD_DIGITS
+
+    with localcontext() as ctx:
+        ctx.Emax = MAX_EMAX
+        ctx.Emin = MIN_EMIN
+        ctx.prec = START_DIGITS
+        x = Decimal(n)
+        y = 1 / x.sqrt()
+        for step in reversed(steps):
+            ctx.prec = step
+            # Unary plus rounds x to the working precision of this step
+            y += y * (1 - +x * y * y) / 2
+
+    return y
@@ -0,0 +1,189 @@
+"""
+Subquadratic conversion of big integers to decimal text.
+
+The fixed-point engines produce Pi as a huge binary integer. Converting it with
+str() or Decimal() takes quadratic time, and CPython refuses int-to-str
+conversions past 4300 digits by default. At a few million digits the
+conversion would cost more than the computation.
+
+The conversion here works in two divide-and-conquer passes:
+
+1. Binary to decimal: the integer is split on its bits, which is a cheap shift,
+   and the halves are recombined in the decimal module as
+   high × 2^k + low. The powers of two are cached for one conversion and
+   freed with it, as the largest is half the size of the result. libmpdec
+   multiplies huge numbers with a number-theoretic transform, so the whole
+   pass costs a few multiplications of the final size.
+2. Decimal to text: the decimal value is split recursively on powers of ten,
+   which is an exact shift of the coefficient, until the pieces are short
+   enough to format directly. The pieces come out in order, so they can be
+   written to a file or buffer without building the whole string.
+"""
+
+from decimal import MAX_EMAX, MAX_PREC, MIN_EMIN, ROUND_FLOOR, Context, Decimal, localcontext
+from typing import IO, Dict, Iterator, Optional
+
+# Exact context for the conversion
+EXACT_CONTEXT = Context(prec=MAX_PREC, Emax=MAX_EMAX, Emin=MIN_EMIN)
+
+# Integers up to this many bits are converted directly
+LEAF_BITS = 4096
+
+# Digits formatted, and written, per piece
+CHUNK_DIGITS = 1 << 16
+
+
+def _power_of_two(bits: int, powers: Dict[int, Decimal]) -> Decimal:
+    """
+    Calculate 2^bits as an exact Decimal.
+
+    Must be called inside an exact decimal context (see EXACT_CONTEXT).
+
+    Args:
+        bits: The exponent.
+        powers: Powers already calculated during this conversion, by exponent;
+            new ones are added.
+
+    Returns:
+        2^bits.
+    """
+    if bits not in powers:
+        if bits <= LEAF_BITS:
+            powers[bits] = Decimal(1 << bits)
+        else:
+            half = bits // 2
+            powers[bits] = _power_of_two(half, powers) * _power_of_two(bits - half, powers)
+    return powers[bits]
+
+
+def _to_decimal(n: int, bits: int, powers: Dict[int, Decimal]) -> Decimal:
+    """
+    Convert a non-negative integer below 2^bits to an exact Decimal.
+
+    Must be called inside an exact decimal context (see EXACT_CONTEXT).
+
+    Args:
+        n: The integer to convert.
+        bits: Upper bound on the bit length of n.
+        powers: Cache of powers of two for this conversion.
+
+    Returns:
+        n as a Decimal.
+    """
+    if bits <= LEAF_BITS:
+        return Decimal(n)
+    half = bits // 2
+    high = _to_decimal(n >> half, bits - half, powers)
+    low = _to_decimal(n & ((1 << half) - 1), half, powers)
+    return high * _power_of_two(half, powers) + low
+
+
+def to_decimal(n: int) -> Decimal:
+    """
+    Convert an integer to an exact Decimal in subquadratic time.
+
+    Args:
+        n: The integer to convert.
+
+    Returns:
+        n as a Decimal.
+    """
+    with localcontext(EXACT_CONTEXT):
+        value = _to_decimal(abs(n), n.bit_length(), {})
+        return -value if n < 0 else value
+
+
+def _digit_chunks(value: Decimal, width: int) -> Iterator[str]:
+    """
+    Yield the digits of an integral Decimal, zero-padded to width, in pieces.
+
+    Must be called inside an exact decimal context (see EXACT_CONTEXT).
+
+    Args:
+        value: Integral value with 0 <= value < 10^width.
+        width: Number of digits to produce.
+
+    Yields:
+        Consecutive pieces of at most CHUNK_DIGITS digits.
+    """
+    if width <= CHUNK_DIGITS:
+        if width > 0:
+            yield format(value, "f").zfill(width)
+        return
+    low_width = width // 2
+    high = value.scaleb(-low_width).to_integral_value(rounding=ROUND_FLOOR)
+    yield from _digit_chunks(high, width - low_width)
+    yield from _digit_chunks(value - high.scaleb(low_width), low_width)
+
+
+def fixed_point_chunks(value: int, scale: int, digits: Optional[int] = None) -> Iterator[str]:
+    """
+    Yield the decimal text of the fixed-point number value / 10^scale in pieces.
+
+    Args:
+        value: Non-negative fixed-point integer.
+        scale: Number of decimal places represented by value.
+        digits: Number of decimal places to produce, truncating the rest
+            (default: scale).
+
+    Yields:
+        The integer part and the point, then the decimal places in pieces of
+        at most CHUNK_DIGITS digits.
+
+    Raises:
+        ValueError: If value is negative or digits is not between 0 and scale.
+    """
+    if value < 0:
+        raise ValueError("value must be non-negative")
+    if digits is None:
+        digits = scale
+    if not 0 <= digits <= scale:
+        raise ValueError("digits must be between 0 and scale")
+
+    with localcontext(EXACT_CONTEXT):
+        number = to_decimal(value)
+        integer_part = number.scaleb(-scale).to_integral_value(rounding=ROUND_FLOOR)
+        fraction = number - integer_part.scaleb(scale)
+        fraction = fraction.scaleb(digits - scale).to_integral_value(rounding=ROUND_FLOOR)
+
+        yield format(integer_part, "f") + ("." if digits else "")
+        yield from _digit_chunks(fraction, digits)
+
+
+def format_fixed_point(value: int, scale: int, digits: Optional[int] = None) -> str:
+    """
+    Format the fixed-point number value / 10^scale as decimal text.
+
+    Args:
+        value: Non-negative fixed-point integer.
+        scale: Number of decimal places represented by value.
+        digits: Number of decimal places to produce, truncating the rest
+            (default: scale).
+
+    Returns:
+        The number as a string, e.g. "3.14159".
+    """
+    return "".join(fixed_point_chunks(value, scale, digits))
+
+
+def write_fixed_point(value: int, output: IO[str], scale: int, digits: Optional[int] = None) -> int:
+    """
+    Write the fixed-point number value / 10^scale to a text stream in pieces.
+
+    Only one piece of text is held in memory at a time.
+
+    Args:
+        value: Non-negative fixed-point integer.
+        output: Text stream to write to.
+        scale: Number of decimal places represented by value.
+        digits: Number of decimal places to produce, truncating the rest
+            (default: scale).
+
+    Returns:
+        Number of characters written.
+    """
+    written = 0
+    for chunk in fixed_point_chunks(value, scale, digits):
+        output.write(chunk)
+        written += len(chunk)
+    return written
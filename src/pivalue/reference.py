@@ -0,0 +1,231 @@
+"""
+On-disk store of reference digits of Pi for accuracy checks.
+
+Comparing a result against the float math.pi only checks its first 16
+digits. The reference store keeps the decimal places of Pi in a file, packed
+two digits per byte (binary-coded decimal), generated once by the Chudnovsky
+algorithm and extended in place when a longer reference is needed.
+
+The file is read through mmap, and results are packed the same way before
+they are compared, so checking a 10M-digit result compares two 5 MB buffers
+block by block instead of two 10M-character strings.
+
+File layout: an 8-byte magic, the digit count as a little-endian uint64, then
+the packed digits, high nibble first. An odd last digit is padded with 0xF.
+"""
+
+import mmap
+import os
+import struct
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Optional, Union
+
+from pivalue.algorithms import chudnovsky
+
+MAGIC = b"PIVREF\x00\x01"
+HEADER = struct.Struct("<8sQ")
+
+# Bytes compared per step when matching a result against the store
+BLOCK_BYTES = 1 << 20
+
+# Environment variable that overrides the default store location
+PATH_VARIABLE = "PIVALUE_REFERENCE"
+
+_TO_VALUES = bytes.maketrans(b"0123456789", bytes(range(10)))
+_TO_ASCII = bytes.maketrans(bytes(range(10)), b"0123456789")
+
+
+def default_path() -> Path:
+    """
+    Get the default location of the reference store.
+
+    Returns:
+        $PIVALUE_REFERENCE if set, otherwise pi_reference.bin in the pivalue
+        directory of the user cache ($XDG_CACHE_HOME or ~/.cache).
+    """
+    if os.environ.get(PATH_VARIABLE):
+        return Path(os.environ[PATH_VARIABLE])
+    cache = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache) / "pivalue" / "pi_reference.bin"
+
+
+def pack_digits(digits: bytes) -> bytes:
+    """
+    Pack ASCII decimal digits two per byte.
+
+    The digit values are laid out in two big integers, one for the even and
+    one for the odd positions, so the packing runs in linear time without a
+    Python-level loop.
+
+    Args:
+        digits: ASCII digits.
+
+    Returns:
+        The packed digits, padded with 0xF if the count is odd.
+
+    Raises:
+        ValueError: If digits contains anything but 0-9.
+    """
+    if digits.translate(None, b"0123456789"):
+        raise ValueError("digits must contain only 0-9")
+    values = digits.translate(_TO_VALUES)
+    if len(values) % 2:
+        values += b"\x0f"
+    high = int.from_bytes(values[0::2], "big")
+    low = int.from_bytes(values[1::2], "big")
+    return ((high << 4) | low).to_bytes(len(values) // 2, "big")
+
+
+def unpack_digits(packed: bytes, count: int) -> bytes:
+    """
+    Unpack digits packed by pack_digits.
+
+    Args:
+        packed: The packed digits.
+        count: Number of digits to unpack (at most 2 × len(packed)).
+
+    Returns:
+        The digits as ASCII.
+    """
+    value = int.from_bytes(packed, "big")
+    mask = int.from_bytes(b"\x0f" * len(packed), "big")
+    values = bytearray(2 * len(packed))
+    values[0::2] = ((value >> 4) & mask).to_bytes(len(packed), "big")
+    values[1::2] = (value & mask).to_bytes(len(packed), "big")
+    return bytes(values[:count]).translate(_TO_ASCII)
+
+
+class ReferenceStore:
+    """
+    Packed reference digits of Pi in a memory-mapped file.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None) -> None:
+        """
+        Open a reference store; the file is created by the first extend().
+
+        Args:
+            path: Location of the store file (default: default_path()).
+        """
+        self.path = Path(path) if path is not None else default_path()
+
+    def __len__(self) -> int:
+        """
+        Get the number of decimal places in the store.
+
+        Raises:
+            ValueError: If the file is not a reference store.
+        """
+        if not self.path.exists():
+            return 0
+        with open(self.path, "rb") as f:
+            magic, count = HEADER.unpack(f.read(HEADER.size).ljust(HEADER.size, b"\x00"))
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a pivalue reference store")
+        return int(count)
+
+    @contextmanager
+    def _map(self) -> Iterator[mmap.mmap]:
+        """
+        Map the store file read-only.
+
+        Yields:
+            The memory map of the whole file.
+        """
+        with open(self.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+    def extend(self, digits: int, workers: int = 1) -> int:
+        """
+        Make sure the store holds at least the given number of decimal places.
+
+        The digits are calculated with the Chudnovsky algorithm. Existing
+        digits are kept and the new ones appended in place; the digit count in
+        the header is updated last, so an interrupted extension leaves a valid
+        store.
+
+        Args:
+            digits: Number of decimal places required.
+            workers: Number of worker processes for the calculation.
+
+        Returns:
+            Number of decimal places in the store.
+        """
+        count = len(self)
+        if digits <= count:
+            return count
+
+        pi = chudnovsky.calculate(digits + chudnovsky.GUARD_DIGITS, workers)["pi"]
+        fraction = pi[2 : digits + 2].encode("ascii")
+        # Rewrite the byte holding an odd last digit together with its padding
+        start = count - count % 2
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "r+b" if self.path.exists() else "w+b") as f:
+            f.seek(HEADER.size + start // 2)
+            f.write(pack_digits(fraction[start:]))
+            f.flush()
+            f.seek(0)
+            f.write(HEADER.pack(MAGIC, digits))
+
+        return digits
+
+    def digits(self, start: int, count: int) -> str:
+        """
+        Read decimal places from the store.
+
+        Args:
+            start: Index of the first decimal place (0 is the first digit after the point).
+            count: Number of digits to read.
+
+        Returns:
+            The digits as a string.
+
+        Raises:
+            ValueError: If the range is not within the store.
+        """
+        if start < 0 or count < 0 or start + count > len(self):
+            raise ValueError(f"digits {start}..{start + count} are not in the reference store")
+        if count == 0:
+            return ""
+        first = start // 2
+        last = (start + count + 1) // 2
+        with self._map() as mm:
+            packed = mm[HEADER.size + first : HEADER.size + last]
+        offset = start - 2 * first
+        return unpack_digits(packed, offset + count)[offset:].decode("ascii")
+
+    def matching_digits(self, pi_value: Any) -> int:
+        """
+        Count the leading decimal places of a Pi approximation that are correct.
+
+        Only the decimal places held by the store are checked; extend the store
+        first to check a longer result.
+
+        Args:
+            pi_value: The calculated Pi value (can be string, float, or Decimal).
+
+        Returns:
+            Number of decimal places that match Pi, or 0 if the integer part is not 3.
+        """
+        integer_part, _, fraction = str(pi_value).partition(".")
+        if integer_part != "3":
+            return 0
+        fraction_digits = len(fraction) - len(fraction.lstrip("0123456789"))
+        available = min(fraction_digits, len(self))
+        if available == 0:
+            return 0
+
+        packed = pack_digits(fraction[:available].encode("ascii"))
+        with self._map() as mm:
+            for block in range(0, len(packed), BLOCK_BYTES):
+                ours = packed[block : block + BLOCK_BYTES]
+                theirs = mm[HEADER.size + block : HEADER.size + block + len(ours)]
+                if ours == theirs:
+                    continue
+                index = next(i for i, (a, b) in enumerate(zip(ours, theirs)) if a != b)
+                matched = 2 * (block + index) + (ours[index] >> 4 == theirs[index] >> 4)
+                return min(matched, available)
+
+        return available
@@ -0,0 +1,223 @@
+"""
+Registry of Pi algorithms with lazily imported modules.
+
+The registry maps algorithm names to the modules implementing them, like a
+dictionary, but holds only their metadata until an algorithm is used: a
+module is imported on first access. A short command like pivalue run
+chudnovsky then imports Chudnovsky's module and what it needs, and not all
+ten algorithms with NumPy behind them.
+
+Other packages can add engines through the "pivalue.algorithms" entry point
+group. Each entry point names an algorithm and points at a module (or
+object) with a calculate() function returning the usual result dictionary,
+and optionally plan(digits) and a LABEL for tables:
+
+    [project.entry-points."pivalue.algorithms"]
+    gpu_chudnovsky = "pivalue_gpu.chudnovsky"
+
+Reading entry points means scanning the installed distributions, so they
+are discovered only when a name is not built in or all names are listed.
+Built-in names take precedence over entry points.
+"""
+
+import importlib
+from typing import Any, Dict, Iterable, Iterator, MutableMapping, NamedTuple, Optional
+
+# Entry point group third-party engines register under
+ENTRY_POINT_GROUP = "pivalue.algorithms"
+
+
+class AlgorithmInfo(NamedTuple):
+    """
+    Metadata of a registered algorithm.
+    """
+
+    name: str
+    label: str
+    target: str  # "package.module" or "package.module:object"
+
+
+# Built-in algorithms, in the order the suite runs them
+BUILTIN_ALGORITHMS = (
+    AlgorithmInfo("mandelbrot", "Mandelbrot Set", "pivalue.algorithms.mandelbrot"),
+    AlgorithmInfo("leibniz", "Leibniz Formula", "pivalue.algorithms.leibniz"),
+    AlgorithmInfo("liu_hui", "Liu Hui's Algorithm", "pivalue.algorithms.liu_hui"),
+    AlgorithmInfo("euler", "Euler Convergence", "pivalue.algorithms.euler"),
+    AlgorithmInfo("bailey", "Bailey-Borwein-Plouffe", "pivalue.algorithms.bailey"),
+    AlgorithmInfo(
+        "relative_prime", "Relative Prime Probability", "pivalue.algorithms.relative_prime"
+    ),
+    AlgorithmInfo("machin", "Machin's Formula", "pivalue.algorithms.machin"),
+    AlgorithmInfo("ramanujan", "Ramanujan's Formula", "pivalue.algorithms.ramanujan"),
+    AlgorithmInfo("chudnovsky", "Chudnovsky Algorithm", "pivalue.algorithms.chudnovsky"),
+    AlgorithmInfo("agm", "Gauss-Legendre (AGM)", "pivalue.algorithms.agm"),
+)
+
+
+def load_target(target: str) -> Any:
+    """
+    Import the module, or the object in it, that a target names.
+
+    Args:
+        target: "package.module" or "package.module:object".
+
+    Returns:
+        The module or object.
+    """
+    module_name, _, attribute = target.partition(":")
+    loaded: Any = importlib.import_module(module_name)
+    for part in filter(None, attribute.split(".")):
+        loaded = getattr(loaded, part)
+    return loaded
+
+
+def entry_point_algorithms(group: str = ENTRY_POINT_GROUP) -> Dict[str, AlgorithmInfo]:
+    """
+    Read the algorithms registered by installed distributions.
+
+    Args:
+        group: Entry point group to read.
+
+    Returns:
+        Metadata by algorithm name; the label is the name until the module
+        is loaded.
+    """
+    from importlib.metadata import entry_points
+
+    try:
+        found: Iterable[Any] = entry_points(group=group)
+    except TypeError:  # pragma: no cover - Python 3.9 has no selection interface
+        found = entry_points().get(group, [])  # type: ignore[attr-defined]
+    return {ep.name: AlgorithmInfo(ep.name, ep.name, ep.value) for ep in found}
+
+
+class AlgorithmRegistry(MutableMapping[str, Any]):
+    """
+    Mapping of algorithm names to their modules, imported on first access.
+    """
+
+    def __init__(self, algorithms: Iterable[AlgorithmInfo] = BUILTIN_ALGORITHMS) -> None:
+        """
+        Create a registry.
+
+        Args:
+            algorithms: Algorithms known without reading entry points
+                (default: the built-in algorithms).
+        """
+        self._infos: Dict[str, AlgorithmInfo] = {info.name: info for info in algorithms}
+        self._loaded: Dict[str, Any] = {}
+        self._discovered = False
+
+    def discover(self) -> None:
+        """
+        Add the algorithms registered through entry points, once.
+        """
+        if self._discovered:
+            return
+        self._discovered = True
+        for name, info in entry_point_algorithms().items():
+            self._infos.setdefault(name, info)
+
+    def register(self, name: str, target: str, label: Optional[str] = None) -> None:
+        """
+        Register an algorithm without importing it.
+
+        Args:
+            name: Name of the algorithm.
+            target: "package.module" or "package.module:object" providing calculate().
+            label: Display label (default: the LABEL of the module, or name).
+        """
+        self._infos[name] = AlgorithmInfo(name, label or name, target)
+        self._loaded.pop(name, None)
+
+    def info(self, name: str) -> AlgorithmInfo:
+        """
+        Get the metadata of an algorithm without importing it.
+
+        Args:
+            name: Name of the algorithm.
+
+        Returns:
+            Its name, label and import target.
+
+        Raises:
+            KeyError: If no algorithm has that name.
+        """
+        if name not in self._infos:
+            self.discover()
+        return self._infos[name]
+
+    def label(self, name: str) -> str:
+        """
+        Get the display label of an algorithm.
+
+        Args:
+            name: Name of the algorithm.
+
+        Returns:
+            The registered label; for algorithms registered without one, the
+            LABEL of their module if it has one, otherwise name. An algorithm
+            that cannot be imported is labelled with its name, so its failure
+            can still be reported.
+        """
+        info = self.info(name)
+        if info.label != name:
+            return info.label
+        try:
+            module = self[name]
+        except Exception:
+            return name
+        return str(getattr(module, "LABEL", name))
+
+    def __getitem__(self, name: str) -> Any:
+        if name not in self._loaded:
+            self._loaded[name] = load_target(self.info(name).target)
+        return self._loaded[name]
+
+    def __setitem__(self, name: str, module: Any) -> None:
+        if name not in self._infos:
+            self._infos[name] = AlgorithmInfo(name, name, "")
+        self._loaded[name] = module
+
+    def __delitem__(self, name: str) -> None:
+        self.info(name)
+        del self._infos[name]
+        self._loaded.pop(name, None)
+
+    def __contains__(self, name: object) -> bool:
+        if name in self._infos:
+            return True
+        self.discover()
+        return name in self._infos
+
+    def __iter__(self) -> Iterator[str]:
+        self.discover()
+        return iter(list(self._infos))
+
+    def __len__(self) -> int:
+        self.discover()
+        return len(self._infos)
+
+
+# The algorithms available to the benchmark, the dispatcher and the CLI
+ALGORITHMS = AlgorithmRegistry()
+
+
+def run_single_algorithm(name: str, **kwargs: Any) -> Optional[Dict[str, Any]]:
+    """
+    Run a single algorithm by name.
+
+    Args:
+        name: Name of the algorithm to run.
+        **kwargs: Additional arguments to pass to the algorithm.
+
+    Returns:
+        Result dictionary from the algorithm, or None if algorithm not found.
+    """
+    if name not in ALGORITHMS:
+        print(f"Error: Algorithm '{name}' not found.")
+        print(f"Available algorithms: {', '.join(ALGORITHMS.keys())}")
+        return None
+
+    result: Dict[str, Any] = ALGORITHMS[name].calculate(**kwargs)
+    return result
@@ -0,0 +1,164 @@
+"""
+Binary splitting for rational (hypergeometric) series.
+
+Many Pi formulas are series whose consecutive terms differ by a rational
+function of k. Such a series is described by four integer polynomials:
+
+S = Σ(k=0 to n-1) [a(k) / b(k)] × Π(j=1 to k) [p(j) / q(j)]
+
+Binary splitting evaluates the partial sum as one exact fraction. The index
+range is halved recursively and the halves are combined with a few big
+multiplications, so the total cost is close to that of multiplying the final
+numbers, instead of one full-precision division per term. The top-level
+subranges are independent, so they can be evaluated in worker processes and
+combined in the parent.
+
+For more information, visit:
+https://en.wikipedia.org/wiki/Binary_splitting
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from decimal import MAX_EMAX, MAX_PREC, MIN_EMIN, Context, Decimal, localcontext
+from typing import List, NamedTuple, Sequence, Tuple
+
+# Exact context for the integer products of the binary splitting
+EXACT_CONTEXT = Context(prec=MAX_PREC, Emax=MAX_EMAX, Emin=MIN_EMIN)
+
+# Subranges handed to each worker process, for load balancing
+SPLITS_PER_WORKER = 2
+
+# (P, Q, B, T) of a subrange, see binary_split
+Split = Tuple[Decimal, Decimal, Decimal, Decimal]
+
+
+class RationalSeries(NamedTuple):
+    """
+    A series Σ a(k)/b(k) × Π(j=1 to k) p(j)/q(j) with integer polynomial coefficients.
+
+    Each polynomial is a tuple of coefficients, lowest degree first.
+    """
+
+    p: Tuple[int, ...]
+    q: Tuple[int, ...]
+    a: Tuple[int, ...]
+    b: Tuple[int, ...] = (1,)
+
+
+def polyval(coefficients: Sequence[int], x: int) -> int:
+    """
+    Evaluate an integer polynomial with Horner's rule.
+
+    Args:
+        coefficients: Polynomial coefficients, lowest degree first.
+        x: The point to evaluate at.
+
+    Returns:
+        The value of the polynomial at x.
+    """
+    value = 0
+    for coefficient in reversed(coefficients):
+        value = value * x + coefficient
+    return value
+
+
+def binary_split(series: RationalSeries, start: int, stop: int) -> Split:
+    """
+    Evaluate the terms start..stop-1 of a series by binary splitting.
+
+    Must be called inside an exact decimal context (see EXACT_CONTEXT).
+
+    Args:
+        series: The series to evaluate.
+        start: Index of the first term.
+        stop: Index one past the last term.
+
+    Returns:
+        Tuple (P, Q, B, T) of exact integers, where P and Q are the products of
+        p(j) and q(j) over the range, B is the product of b(k), and the partial
+        sum of the range equals T / (B × Q) once scaled by the product of the
+        terms before start.
+    """
+    if stop - start == 1:
+        if start == 0:
+            p = q = 1
+        else:
+            p = polyval(series.p, start)
+            q = polyval(series.q, start)
+        b = polyval(series.b, start)
+        return Decimal(p), Decimal(q), Decimal(b), Decimal(polyval(series.a, start) * p)
+
+    middle = (start + stop) // 2
+    return combine(
+        binary_split(series, start, middle),
+        binary_split(series, middle, stop),
+    )
+
+
+def combine(left: Split, right: Split) -> Split:
+    """
+    Combine the splits of two adjacent ranges into the split of their union.
+
+    Must be called inside an exact decimal context (see EXACT_CONTEXT).
+
+    Args:
+        left: Split of the lower range.
+        right: Split of the upper range.
+
+    Returns:
+        Split of the combined range.
+    """
+    p_l, q_l, b_l, t_l = left
+    p_r, q_r, b_r, t_r = right
+    return p_l * p_r, q_l * q_r, b_l * b_r, b_r * q_r * t_l + b_l * p_l * t_r
+
+
+def _split_task(args: Tuple[RationalSeries, int, int]) -> Split:
+    """
+    Evaluate one subrange in a worker process.
+
+    Args:
+        args: Tuple of (series, start, stop).
+
+    Returns:
+        Result of binary_split.
+    """
+    with localcontext(EXACT_CONTEXT):
+        return binary_split(*args)
+
+
+def evaluate(series: RationalSeries, terms: int, workers: int = 1) -> Tuple[Decimal, Decimal]:
+    """
+    Evaluate the first terms of a series as an exact fraction.
+
+    With workers > 1 the index range is cut into contiguous subranges that are
+    split in a process pool; the parent combines the results pairwise, so the
+    final products stay balanced.
+
+    Args:
+        series: The series to evaluate.
+        terms: Number of terms to sum (at least 1).
+        workers: Number of worker processes (default: 1, evaluate in the calling process).
+
+    Returns:
+        Tuple (numerator, denominator) of exact integers whose quotient is the sum.
+    """
+    parts = min(workers * SPLITS_PER_WORKER, terms) if workers > 1 else 1
+
+    if parts > 1:
+        bounds = [terms * i // parts for i in range(parts + 1)]
+        tasks = [(series, bounds[i], bounds[i + 1]) for i in range(parts)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            splits: List[Split] = list(executor.map(_split_task, tasks))
+
+        with localcontext(EXACT_CONTEXT):
+            while len(splits) > 1:
+                paired = [combine(splits[i], splits[i + 1]) for i in range(0, len(splits) - 1, 2)]
+                if len(splits) % 2:
+                    paired.append(splits[-1])
+                splits = paired
+        p, q, b, t = splits[0]
+    else:
+        p, q, b, t = _split_task((series, 0, terms))
+
+    with localcontext(EXACT_CONTEXT):
+        return t, b * q
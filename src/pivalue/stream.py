@@ -0,0 +1,147 @@
+"""
+Streaming digit generators for Pi.
+
+Every calculate() in the package returns a finished value, so a consumer has
+to wait for the whole computation. The generators here yield the digits of Pi
+one by one, as soon as they are certain:
+
+- "spigot": Gibbons' unbounded spigot algorithm. It needs no digit target and
+  works in any base, but its state grows and each digit gets slower.
+- "chudnovsky": a chunked producer that reruns the Chudnovsky algorithm with a
+  doubling digit count and yields the digits it has not yielded before.
+
+For more information, visit:
+https://www.cs.ox.ac.uk/jeremy.gibbons/publications/spigot.pdf
+"""
+
+import itertools
+from typing import IO, Iterator, Optional
+
+from pivalue.registry import ALGORITHMS
+
+STREAM_ALGORITHMS = ("spigot", "chudnovsky")
+
+# Characters used to write digits in bases up to 36
+DIGIT_CHARACTERS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# Digits computed by the first chunk of the chunked producer
+CHUNK_DIGITS = 1000
+
+# Characters written per write() call by write_digits
+WRITE_BLOCK = 4096
+
+
+def spigot_digits(base: int = 10) -> Iterator[int]:
+    """
+    Yield the digits of Pi with Gibbons' unbounded spigot algorithm.
+
+    The state is a linear fractional transformation built from the series
+    π = Σ (k!)² 2^(k+1) / (2k+1)!; a digit is emitted once the next term can
+    no longer change it.
+
+    Args:
+        base: Base of the digits (default: 10).
+
+    Yields:
+        The integer part (3) followed by the digits after the point.
+    """
+    q, r, t, k, n, denominator_step = 1, 0, 1, 1, 3, 3
+    while True:
+        if 4 * q + r - t < n * t:
+            yield n
+            q, r, n = base * q, base * (r - n * t), (base * (3 * q + r)) // t - base * n
+        else:
+            q, r, t, k, n, denominator_step = (
+                q * k,
+                (2 * q + r) * denominator_step,
+                t * denominator_step,
+                k + 1,
+                (q * (7 * k + 2) + r * denominator_step) // (t * denominator_step),
+                denominator_step + 2,
+            )
+
+
+def chunked_digits(chunk_digits: int = CHUNK_DIGITS) -> Iterator[int]:
+    """
+    Yield the decimal digits of Pi from a chunked Chudnovsky producer.
+
+    Each chunk computes twice as many digits as the previous one, so the
+    recomputation costs at most as much as the final chunk.
+
+    Args:
+        chunk_digits: Number of digits computed by the first chunk.
+
+    Yields:
+        The integer part (3) followed by the digits after the point.
+    """
+    yield 3
+    produced = 0
+    digits = chunk_digits
+    chudnovsky = ALGORITHMS["chudnovsky"]
+    while True:
+        fraction = chudnovsky.calculate(digits)["pi"][2:]
+        for character in fraction[produced:]:
+            yield ord(character) - 48
+        produced = digits
+        digits *= 2
+
+
+def stream_digits(
+    algorithm: str = "spigot", base: int = 10, chunk_digits: int = CHUNK_DIGITS
+) -> Iterator[int]:
+    """
+    Stream the digits of Pi as they become certain.
+
+    Args:
+        algorithm: "spigot" or "chudnovsky" (default: "spigot").
+        base: Base of the digits (default: 10; "chudnovsky" supports base 10 only).
+        chunk_digits: Number of digits in the first chunk of the "chudnovsky" producer.
+
+    Returns:
+        Iterator over the integer part (3) followed by the digits after the point.
+
+    Raises:
+        ValueError: If the algorithm is unknown or does not support the base.
+    """
+    if algorithm not in STREAM_ALGORITHMS:
+        raise ValueError(
+            f"Unknown algorithm '{algorithm}', expected one of {', '.join(STREAM_ALGORITHMS)}"
+        )
+    if not 2 <= base <= len(DIGIT_CHARACTERS):
+        raise ValueError(f"base must be between 2 and {len(DIGIT_CHARACTERS)}")
+
+    if algorithm == "chudnovsky":
+        if base != 10:
+            raise ValueError("The chudnovsky producer supports base 10 only")
+        return chunked_digits(chunk_digits)
+    return spigot_digits(base)
+
+
+def write_digits(digits: Iterator[int], output: IO[str], limit: Optional[int] = None) -> int:
+    """
+    Write streamed digits to a text stream in fixed-size blocks.
+
+    Only one block is held in memory at a time, and the stream is flushed after
+    every block so that readers see the digits as they are produced.
+
+    Args:
+        digits: Iterator over the integer part followed by the fractional digits.
+        output: Text stream to write to.
+        limit: Number of digits after the point to write (default: unlimited).
+
+    Returns:
+        Number of digits written after the point.
+    """
+    output.write(f"{next(digits)}.")
+    remaining = itertools.islice(digits, limit)
+
+    written = 0
+    while True:
+        block = "".join(DIGIT_CHARACTERS[d] for d in itertools.islice(remaining, WRITE_BLOCK))
+        if not block:
+            break
+        output.write(block)
+        output.flush()
+        written += len(block)
+
+    return written
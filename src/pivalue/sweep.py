@@ -0,0 +1,251 @@
+"""
+Empirical complexity sweeps over an algorithm parameter.
+
+An algorithm is run over a grid of values of one parameter, and power laws
+are fitted by least squares in log-log space:
+
+time ≈ a × value^k        correct digits ≈ b × value^m
+
+The exponent k shows how the cost grows (1 for linear, 2 for quadratic) and
+m how the accuracy grows (1 when every iteration adds a fixed number of
+digits, close to 0 when digits grow only logarithmically, as for Leibniz).
+Digits per second at each point tells which settings are worth their cost.
+"""
+
+import csv
+import json
+import math
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+from pivalue.benchmark import correct_digits
+from pivalue.reference import ReferenceStore
+from pivalue.registry import run_single_algorithm
+
+SCALES = ("log", "lin")
+
+# Grid points of a linear range when the spec does not give a count
+DEFAULT_LINEAR_POINTS = 5
+
+
+def parse_range(spec: str) -> List[int]:
+    """
+    Parse a range spec of the form start:stop[:scale[:points]].
+
+    With the log scale (the default) the values are spaced geometrically, one
+    per decade unless points is given; with lin they are evenly spaced.
+    Values are rounded to integers and duplicates removed.
+
+    Args:
+        spec: The range, e.g. "1e3:1e7:log" or "100:1000:lin:10".
+
+    Returns:
+        The grid values in increasing order.
+
+    Raises:
+        ValueError: If the spec is malformed.
+    """
+    parts = spec.split(":")
+    if not 2 <= len(parts) <= 4:
+        raise ValueError(f"Invalid range '{spec}', expected start:stop[:scale[:points]]")
+
+    start, stop = float(parts[0]), float(parts[1])
+    scale = parts[2] if len(parts) > 2 else "log"
+    if scale not in SCALES:
+        raise ValueError(f"Unknown scale '{scale}', expected one of {', '.join(SCALES)}")
+    if not 0 < start <= stop:
+        raise ValueError("The range needs 0 < start <= stop")
+
+    if len(parts) > 3:
+        points = int(parts[3])
+    elif scale == "log":
+        points = round(math.log10(stop / start)) + 1
+    else:
+        points = DEFAULT_LINEAR_POINTS
+    if points < 1:
+        raise ValueError("The range needs at least one point")
+    if points == 1:
+        return [round(start)]
+
+    if scale == "log":
+        ratio = (stop / start) ** (1 / (points - 1))
+        values = [start * ratio**i for i in range(points)]
+    else:
+        step = (stop - start) / (points - 1)
+        values = [start + step * i for i in range(points)]
+
+    return sorted({round(value) for value in values})
+
+
+def fit_power_law(xs: Sequence[float], ys: Sequence[float]) -> Optional[Dict[str, float]]:
+    """
+    Fit y = coefficient × x^exponent by least squares on the logarithms.
+
+    Points with a non-positive x or y are left out.
+
+    Args:
+        xs: Parameter values.
+        ys: Measured values.
+
+    Returns:
+        Dictionary with exponent, coefficient and r_squared, or None with
+        fewer than two usable points.
+    """
+    points = [(math.log(x), math.log(y)) for x, y in zip(xs, ys) if x > 0 and y > 0]
+    if len({x for x, _ in points}) < 2:
+        return None
+
+    n = len(points)
+    mean_x = sum(x for x, _ in points) / n
+    mean_y = sum(y for _, y in points) / n
+    sxx = sum((x - mean_x) ** 2 for x, _ in points)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    syy = sum((y - mean_y) ** 2 for _, y in points)
+
+    exponent = sxy / sxx
+    intercept = mean_y - exponent * mean_x
+    r_squared = sxy * sxy / (sxx * syy) if syy > 0 else 1.0
+    return {"exponent": exponent, "coefficient": math.exp(intercept), "r_squared": r_squared}
+
+
+def _sweep_task(args: Tuple[str, str, int, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Run one grid point in a worker process.
+
+    Args:
+        args: Tuple of (algorithm, param, value, fixed arguments).
+
+    Returns:
+        The value, the time taken and the calculated Pi.
+    """
+    algorithm, param, value, fixed = args
+    result = run_single_algorithm(algorithm, **fixed, **{param: value})
+    if result is None:
+        raise ValueError(f"Algorithm '{algorithm}' not found")
+    return {"value": value, "time_seconds": result["time_seconds"], "pi": str(result["pi"])}
+
+
+def run_sweep(
+    algorithm: str,
+    param: str,
+    values: Sequence[int],
+    workers: int = 1,
+    fixed: Optional[Dict[str, Any]] = None,
+    store: Optional[ReferenceStore] = None,
+) -> Dict[str, Any]:
+    """
+    Run an algorithm over a parameter grid and fit its cost and accuracy.
+
+    Grid points run concurrently with workers > 1, which is faster but lets
+    the runs compete for CPU and memory bandwidth; use workers=1 when the
+    timings themselves matter.
+
+    Args:
+        algorithm: Name of the algorithm (see registry.ALGORITHMS).
+        param: Keyword argument of calculate() to sweep.
+        values: Grid values of the parameter.
+        workers: Number of grid points run concurrently (default: 1).
+        fixed: Other keyword arguments passed to every run.
+        store: Reference store for counting correct digits, extended to the
+            longest result (default: the store at the default path).
+
+    Returns:
+        Dictionary containing:
+            - algorithm, param, fixed: What was swept
+            - points: Per value, the time, correct digits and digits per second
+            - time_fit: Power-law fit of time against the parameter
+            - digits_fit: Power-law fit of correct digits against the parameter
+    """
+    fixed = dict(fixed or {})
+    tasks = [(algorithm, param, value, fixed) for value in values]
+
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            runs = list(executor.map(_sweep_task, tasks))
+    else:
+        runs = [_sweep_task(task) for task in tasks]
+
+    if store is None:
+        store = ReferenceStore()
+    # Every point needs an exact count for the fit, so the store is extended here
+    store.extend(max((len(run["pi"].partition(".")[2]) for run in runs), default=0))
+
+    points = []
+    for run in runs:
+        digits = correct_digits(run["pi"], store)
+        time_seconds = run["time_seconds"]
+        points.append(
+            {
+                "value": run["value"],
+                "time_seconds": time_seconds,
+                "correct_digits": digits,
+                "digits_per_second": digits / time_seconds if time_seconds > 0 else math.inf,
+            }
+        )
+
+    return {
+        "algorithm": algorithm,
+        "param": param,
+        "fixed": fixed,
+        "points": points,
+        "time_fit": fit_power_law(
+            [p["value"] for p in points], [p["time_seconds"] for p in points]
+        ),
+        "digits_fit": fit_power_law(
+            [p["value"] for p in points], [p["correct_digits"] for p in points]
+        ),
+    }
+
+
+def print_sweep(report: Dict[str, Any]) -> None:
+    """
+    Print the grid points and fitted exponents of a sweep.
+
+    Args:
+        report: Result of run_sweep.
+    """
+    param = report["param"]
+    print("=" * 80)
+    print(f"{param:<20} {'Time (s)':<15} {'Correct digits':<16} {'Digits/s':<15}")
+    print("=" * 80)
+    for point in report["points"]:
+        print(
+            f"{point['value']:<20} {point['time_seconds']:<15.6f} "
+            f"{point['correct_digits']:<16} {point['digits_per_second']:<15.1f}"
+        )
+    print("=" * 80)
+
+    for label, key in (("time", "time_fit"), ("correct digits", "digits_fit")):
+        fit = report[key]
+        if fit is None:
+            print(f"{label}: not enough positive points to fit")
+        else:
+            print(
+                f"{label} ∝ {param}^{fit['exponent']:.3f}  "
+                f"(coefficient {fit['coefficient']:.3e}, R² = {fit['r_squared']:.3f})"
+            )
+
+
+def export_sweep(report: Dict[str, Any], filename: str) -> None:
+    """
+    Export a sweep for plotting.
+
+    Files ending in .csv get one row per grid point; anything else gets the
+    whole report, including the fits, as JSON.
+
+    Args:
+        report: Result of run_sweep.
+        filename: Output filename.
+    """
+    if filename.lower().endswith(".csv"):
+        with open(filename, "w", newline="") as f:
+            writer = csv.DictWriter(
+                f, fieldnames=["value", "time_seconds", "correct_digits", "digits_per_second"]
+            )
+            writer.writeheader()
+            writer.writerows(report["points"])
+    else:
+        with open(filename, "w") as f:
+            json.dump(report, f, indent=2, default=str)
+
+    print(f"\nSweep exported to {filename}")
@@ -0,0 +1,202 @@
+"""
+Probabilistic verification of Pi digit files.
+
+Comparing a huge result with a full reference is expensive, and there may be
+no reference that long. Instead, windows of digits at randomly chosen
+positions are checked independently:
+
+- hexadecimal files with the BBP digit-extraction algorithm, which computes
+  the digits at a position without the ones before it;
+- decimal files against the reference digit store.
+
+If all n windows match, then with confidence C fewer than a fraction
+1 - (1 - C)^(1/n) of all windows in the file are wrong. A computation that
+goes wrong usually corrupts every digit after some point, so a handful of
+samples already catches most failures; the last window is always checked
+because too little working precision corrupts the final digits first.
+
+A decimal file longer than the reference store can be sampled only as far as
+the store reaches, and its last window cannot be checked at all, so it never
+passes: if the sampled windows match, it is reported as unverified.
+"""
+
+import mmap
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional
+
+from pivalue.algorithms import bailey
+from pivalue.reference import ReferenceStore
+
+# Digits compared at each sampled position (one BBP block)
+SAMPLE_DIGITS = bailey.HEX_DIGITS_PER_BLOCK
+
+DEFAULT_SAMPLES = 16
+DEFAULT_CONFIDENCE = 0.95
+
+# Leading digits inspected to tell hexadecimal from decimal files
+DETECT_DIGITS = 4096
+
+
+def detect_base(digits: bytes) -> int:
+    """
+    Guess the base of a digit string.
+
+    Args:
+        digits: Leading digits after the point.
+
+    Returns:
+        16 if any hexadecimal letter occurs, otherwise 10.
+    """
+    return 16 if digits.translate(None, b"ABCDEFabcdef") != digits else 10
+
+
+def error_bound(samples: int, confidence: float) -> float:
+    """
+    Bound the fraction of wrong windows after samples windows all matched.
+
+    Args:
+        samples: Number of windows checked, all of which matched.
+        confidence: Confidence level, between 0 and 1.
+
+    Returns:
+        Fraction p such that, with the given confidence, fewer than p of the
+        windows in the file are wrong.
+    """
+    if samples == 0:
+        return 1.0
+    return float(1 - (1 - confidence) ** (1 / samples))
+
+
+def _expected_hex(position: int) -> str:
+    """
+    Calculate the reference window at position of a hexadecimal file.
+
+    Args:
+        position: Position of the first digit after the point (1-based).
+
+    Returns:
+        SAMPLE_DIGITS hexadecimal digits.
+    """
+    return bailey.hex_digits(position, SAMPLE_DIGITS)
+
+
+def verify_file(
+    path: str,
+    samples: int = DEFAULT_SAMPLES,
+    base: Optional[int] = None,
+    seed: Optional[int] = None,
+    workers: int = 1,
+    confidence: float = DEFAULT_CONFIDENCE,
+    store: Optional[ReferenceStore] = None,
+) -> Dict[str, Any]:
+    """
+    Check the digits of a Pi digit file at randomly chosen positions.
+
+    The file holds "3." followed by the digits, as written by pivalue stream.
+
+    Args:
+        path: The digit file.
+        samples: Number of positions to check, including the last window.
+        base: 10 or 16 (default: detected from the file).
+        seed: Seed for choosing the positions (default: drawn from the OS).
+        workers: Number of worker processes for the hexadecimal checks.
+        confidence: Confidence level for the reported error bound.
+        store: Reference store for decimal files (default: the store at the
+            default path; it is not extended).
+
+    Returns:
+        Dictionary containing:
+            - path: The digit file
+            - base: Base of the digits
+            - digits: Number of digits after the point in the file
+            - checked_digits: Number of leading digits positions were drawn from
+            - positions: Checked positions (1-based)
+            - mismatches: Positions whose window did not match
+            - status: "passed" if every window matched and the whole file was
+              in range, "unverified" if every window matched but the end of
+              the file is beyond the reference, otherwise "failed"
+            - passed: Whether the status is "passed"
+            - confidence: Confidence level of the error bound
+            - error_bound: Upper bound on the fraction of wrong windows in the
+              checked range, or None if a window did not match
+            - seed: Seed used for choosing the positions
+            - time_seconds: Time taken in seconds
+
+    Raises:
+        ValueError: If the file is not a Pi digit file, the base is unsupported,
+            or no digits can be checked.
+    """
+    start_time = time.perf_counter()
+
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(63)
+    if store is None:
+        store = ReferenceStore()
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if mm[:2] != b"3.":
+            raise ValueError(f"{path} does not start with '3.'")
+        end = len(mm)
+        while end > 2 and mm[end - 1 : end] in (b"\n", b"\r", b" "):
+            end -= 1
+        digits = end - 2
+
+        if base is None:
+            base = detect_base(mm[2 : 2 + DETECT_DIGITS])
+        if base == 16:
+            checked = digits
+        elif base == 10:
+            checked = min(digits, len(store))
+        else:
+            raise ValueError("base must be 10 or 16")
+        if checked == 0:
+            raise ValueError(
+                "No digits can be checked; extend the reference with pivalue reference"
+            )
+
+        window = min(SAMPLE_DIGITS, checked)
+        last = checked - window + 1
+        rng = random.Random(seed)
+        positions = sorted({last, *rng.sample(range(1, last + 1), min(max(samples - 1, 0), last))})
+
+        if base == 16:
+            if workers > 1 and len(positions) > 1:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    expected: List[str] = list(executor.map(_expected_hex, positions))
+            else:
+                expected = [_expected_hex(position) for position in positions]
+        else:
+            expected = [store.digits(position - 1, window) for position in positions]
+
+        mismatches = [
+            position
+            for position, reference in zip(positions, expected)
+            if mm[position + 1 : position + 1 + window].decode("ascii").upper()
+            != reference[:window]
+        ]
+
+    if mismatches:
+        status = "failed"
+    elif checked < digits:
+        status = "unverified"
+    else:
+        status = "passed"
+
+    elapsed_time = time.perf_counter() - start_time
+
+    return {
+        "path": path,
+        "base": base,
+        "digits": digits,
+        "checked_digits": checked,
+        "positions": positions,
+        "mismatches": mismatches,
+        "status": status,
+        "passed": status == "passed",
+        "confidence": confidence,
+        "error_bound": None if mismatches else error_bound(len(positions), confidence),
+        "seed": seed,
+        "time_seconds": elapsed_time,
+    }
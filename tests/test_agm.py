@@ -0,0 +1,53 @@
+"""Tests for the Gauss-Legendre (AGM) algorithm."""
+
+import math
+from decimal import Decimal
+from pivalue.algorithms import agm
+
+PI_100 = (
+    "3.1415926535897932384626433832795028841971693993751"
+    "058209749445923078164062862089986280348253421170679"
+)
+
+
+def test_agm_basic() -> None:
+    """Test basic AGM calculation."""
+    result = agm.calculate(digits=50)
+
+    assert "pi" in result
+    assert "iterations" in result
+    assert "time_seconds" in result
+    assert "method" in result
+    assert "digits" in result
+
+    pi_value = float(result["pi"])
+    assert abs(pi_value - math.pi) < 1e-15
+
+
+def test_agm_exact_digits() -> None:
+    """Test that every requested digit is correct."""
+    result = agm.calculate(digits=100)
+
+    assert result["pi"] == PI_100
+    # Quadratic convergence: about log2(digits) iterations
+    assert result["iterations"] <= 8
+
+
+def test_agm_newton_helpers() -> None:
+    """Test the precision-doubling square root and reciprocal."""
+    root_2 = agm.sqrt(Decimal(2), 60)
+    seventh = agm.reciprocal(Decimal(7), 60)
+
+    assert str(root_2).startswith("1.414213562373095048801688724209698078569671875376948")
+    assert str(seventh).startswith("0.142857142857142857142857142857142857142857142857142")
+
+
+def test_agm_result_structure() -> None:
+    """Test that result has expected structure."""
+    result = agm.calculate()
+
+    assert isinstance(result, dict)
+    assert result["method"] == "Gauss-Legendre (AGM)"
+    assert isinstance(result["iterations"], int)
+    assert isinstance(result["time_seconds"], float)
+    assert len(result["pi"]) == result["digits"] + 2
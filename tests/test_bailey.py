@@ -25,3 +25,25 @@ def test_bailey_result_structure() -> None:
     assert result["method"] == "Bailey-Borwein-Plouffe (BBP)"
     assert isinstance(result["iterations"], int)
     assert isinstance(result["time_seconds"], float)
+
+
+def test_bailey_hex_digits() -> None:
+    """Test hexadecimal digit extraction against the known expansion."""
+    expected = "243F6A8885A308D313198A2E03707344A4093822"
+
+    assert bailey.hex_digits(1, 40) == expected
+    assert bailey.hex_digits(21, 5) == expected[20:25]
+
+
+def test_bailey_hex_digits_workers() -> None:
+    """Test that a process pool returns the same digits."""
+    assert bailey.hex_digits(100, 64, workers=2) == bailey.hex_digits(100, 64)
+
+
+def test_bailey_precision() -> None:
+    """Test that the precision mode goes past double precision."""
+    result = bailey.calculate(precision=50)
+
+    assert result["precision"] == 50
+    assert result["iterations"] == 42
+    assert result["pi"] == "3.1415926535897932384626433832795028841971693993751"
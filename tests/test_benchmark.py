@@ -0,0 +1,114 @@
+"""Tests for the benchmark harness."""
+
+import multiprocessing
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from pivalue import benchmark
+from pivalue.registry import AlgorithmRegistry
+
+
+def test_summarize_rejects_outliers() -> None:
+    """Test that a single slow run does not move the statistics."""
+    times = [1.0, 1.1, 0.9, 1.0, 1.05, 0.95, 10.0]
+    timing = benchmark.summarize(times)
+
+    assert timing["samples"] == times
+    assert timing["outliers"] == 1
+    assert timing["median"] == pytest.approx(1.0)
+    assert timing["max"] == pytest.approx(1.1)
+    assert timing["iqr"] > 0
+    assert timing["stdev"] > 0
+
+
+def test_summarize_single_sample() -> None:
+    """Test that one sample has no spread."""
+    timing = benchmark.summarize([0.5])
+
+    assert timing["median"] == 0.5
+    assert timing["iqr"] == 0.0
+    assert timing["stdev"] == 0.0
+
+
+def test_measure_repeats() -> None:
+    """Test warmup and repeated runs of one algorithm."""
+    result = benchmark.measure("machin", repeat=5, warmup=2)
+
+    assert len(result["timing"]["samples"]) == 5
+    assert result["timing"]["warmup"] == 2
+    assert result["time_seconds"] == result["timing"]["median"]
+    assert result["method"] == "Machin's Formula"
+
+
+def _sleep_forever() -> None:
+    time.sleep(60)
+
+
+def _fail() -> None:
+    raise RuntimeError("broken engine")
+
+
+# Fake engines importable by worker processes under any start method
+SLOW = SimpleNamespace(calculate=_sleep_forever)
+BROKEN = SimpleNamespace(calculate=_fail)
+
+
+@pytest.mark.parametrize(
+    "start_method",
+    [method for method in ("fork", "spawn") if method in multiprocessing.get_all_start_methods()],
+)
+def test_workers_report_timeouts_and_errors(
+    monkeypatch: pytest.MonkeyPatch, start_method: str
+) -> None:
+    """Test that runaway and failing algorithms do not stop the suite."""
+    context = multiprocessing.get_context(start_method)
+    monkeypatch.setattr(multiprocessing, "get_context", lambda method=None: context)
+    algorithms = AlgorithmRegistry()
+    algorithms.register("slow", f"{__name__}:SLOW")
+    algorithms.register("broken", f"{__name__}:BROKEN")
+    monkeypatch.setattr(benchmark, "ALGORITHMS", algorithms)
+
+    start = time.perf_counter()
+    results = benchmark._run_in_workers(
+        ["slow", "broken", "machin"], jobs=3, timeout=2.0, memory_limit=None, options={}
+    )
+
+    assert time.perf_counter() - start < 30
+    assert results["slow"]["status"] == "timeout"
+    assert results["slow"]["pi"] is None
+    assert results["broken"]["status"] == "error"
+    assert "broken engine" in results["broken"]["error"]
+    assert results["machin"]["status"] == "ok"
+    assert results["machin"]["method"] == "Machin's Formula"
+
+
+def test_workers_report_unimportable_plugins(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a plugin that cannot be imported is reported as an error."""
+    algorithms = AlgorithmRegistry()
+    algorithms.register("broken_plugin", "no_such_pkg.engine")
+    monkeypatch.setattr(benchmark, "ALGORITHMS", algorithms)
+
+    results = benchmark._run_in_workers(
+        ["broken_plugin", "machin"], jobs=1, timeout=60.0, memory_limit=None, options={}
+    )
+
+    assert results["broken_plugin"]["status"] == "error"
+    assert results["broken_plugin"]["method"] == "broken_plugin"
+    assert "no_such_pkg" in results["broken_plugin"]["error"]
+    assert results["machin"]["status"] == "ok"
+
+
+def test_workers_can_start_pools() -> None:
+    """Test that an algorithm run in a worker can use worker processes itself."""
+    results = benchmark._run_in_workers(
+        ["leibniz"],
+        jobs=1,
+        timeout=60.0,
+        memory_limit=None,
+        options={"num_iterations": 100000, "workers": 2},
+    )
+
+    assert results["leibniz"]["status"] == "ok"
+    assert results["leibniz"]["workers"] == 2
@@ -0,0 +1,48 @@
+"""Tests for the Chudnovsky algorithm."""
+
+import math
+from pivalue.algorithms import chudnovsky
+
+PI_100 = (
+    "3.1415926535897932384626433832795028841971693993751"
+    "058209749445923078164062862089986280348253421170679"
+)
+
+
+def test_chudnovsky_basic() -> None:
+    """Test basic Chudnovsky calculation."""
+    result = chudnovsky.calculate(digits=50)
+
+    assert "pi" in result
+    assert "iterations" in result
+    assert "time_seconds" in result
+    assert "method" in result
+    assert "digits" in result
+
+    pi_value = float(result["pi"])
+    assert abs(pi_value - math.pi) < 1e-15
+
+
+def test_chudnovsky_exact_digits() -> None:
+    """Test that every requested digit is correct."""
+    result = chudnovsky.calculate(digits=100)
+
+    assert result["pi"] == PI_100
+
+
+def test_chudnovsky_result_structure() -> None:
+    """Test that result has expected structure."""
+    result = chudnovsky.calculate()
+
+    assert isinstance(result, dict)
+    assert result["method"] == "Chudnovsky Algorithm"
+    assert isinstance(result["iterations"], int)
+    assert isinstance(result["time_seconds"], float)
+    assert len(result["pi"]) == result["digits"] + 2
+
+
+def test_chudnovsky_workers() -> None:
+    """Test the binary splitting across worker processes."""
+    result = chudnovsky.calculate(digits=2000, workers=2)
+
+    assert result["pi"] == chudnovsky.calculate(digits=2000)["pi"]
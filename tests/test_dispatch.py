@@ -0,0 +1,72 @@
+"""Tests for the target-digits mode."""
+
+from pathlib import Path
+
+import pytest
+
+from pivalue.benchmark import ALGORITHMS, run_all_algorithms, score_results
+from pivalue.dispatch import calibration, candidates, compute
+from pivalue.history import HistoryStore
+from pivalue.reference import ReferenceStore
+
+PI_50 = "3.14159265358979323846264338327950288419716939937510"
+
+
+@pytest.mark.parametrize("digits", [1, 7, 40])
+def test_plans_deliver_digits(tmp_path: Path, digits: int) -> None:
+    """Test that every convergence model asks for enough work."""
+    store = ReferenceStore(tmp_path / "pi.bin")
+    store.extend(100)
+    for name, module in ALGORITHMS.items():
+        model = module.plan(digits)
+        if model is None or model["seconds"] > 1:
+            continue
+        result = module.calculate(**model["params"])
+        assert store.matching_digits(result["pi"]) >= digits, name
+
+
+def test_compute(tmp_path: Path) -> None:
+    """Test that compute returns exactly the requested correct digits."""
+    history = HistoryStore(tmp_path / "history.sqlite")
+    result = compute(50, history=history)
+    assert result["pi"] == PI_50
+    assert result["algorithm"] in ALGORITHMS
+    assert not history.path.exists()
+
+    with pytest.raises(ValueError):
+        compute(0, history=history)
+
+
+def test_history_refines_choice(tmp_path: Path) -> None:
+    """Test that stored timings override the model ranking."""
+    history = HistoryStore(tmp_path / "history.sqlite")
+    assert candidates(10000, history)[0]["algorithm"] == "chudnovsky"
+
+    history.record(
+        [
+            {
+                "algorithm": "chudnovsky",
+                "params": {"digits": 10000},
+                "pi": "3.14",
+                "time_seconds": 100.0,
+                "correct_digits": 10000,
+            }
+        ]
+    )
+    assert calibration("chudnovsky", history) > 1000
+    ranking = candidates(10000, history)
+    assert ranking[0]["algorithm"] != "chudnovsky"
+    assert ranking[-1]["algorithm"] == "chudnovsky"
+
+
+def test_benchmark_history_calibrates(tmp_path: Path) -> None:
+    """Test that recorded benchmark runs are usable for calibration."""
+    store = ReferenceStore(tmp_path / "pi.bin")
+    store.extend(2000)
+    history = HistoryStore(tmp_path / "history.sqlite")
+    assert calibration("chudnovsky", history) is None
+
+    history.record(score_results(run_all_algorithms(), store))
+    assert calibration("chudnovsky", history) is not None
+    ranking = {entry["algorithm"]: entry for entry in candidates(10000, history)}
+    assert ranking["chudnovsky"]["calibration"] is not None
@@ -25,3 +25,11 @@ def test_euler_result_structure() -> None:
     assert result["method"] == "Euler Convergence"
     assert isinstance(result["iterations"], int)
     assert isinstance(result["time_seconds"], float)
+
+
+def test_euler_high_precision() -> None:
+    """Test Euler with a caller-supplied precision."""
+    result = euler.calculate(precision=60)
+
+    assert result["precision"] == 60
+    assert result["pi"] == "3.14159265358979323846264338327950288419716939937510582097494"
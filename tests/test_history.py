@@ -0,0 +1,95 @@
+"""Tests for the benchmark history store."""
+
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, List
+
+from pivalue.history import HistoryStore, mann_whitney_p
+from pivalue.hostinfo import host_fingerprint
+
+
+def _result(samples: List[float], pi: Any = "3.14") -> Dict[str, Any]:
+    return {
+        "algorithm": "machin",
+        "method": "Machin's Formula",
+        "params": {},
+        "pi": pi,
+        "status": "ok" if pi is not None else "timeout",
+        "time_seconds": sorted(samples)[len(samples) // 2] if samples else 1.0,
+        "timing": {"samples": samples},
+    }
+
+
+def test_mann_whitney_p() -> None:
+    """Test the one-sided slowdown test."""
+    fast = [1.0, 1.01, 0.99, 1.02, 0.98, 1.0]
+    slow = [1.5, 1.52, 1.49, 1.51, 1.48, 1.5]
+
+    assert mann_whitney_p(slow, fast) < 0.01
+    assert mann_whitney_p(fast, slow) > 0.99
+    assert 0.3 < mann_whitney_p(fast, fast) < 0.7
+
+
+def test_record_and_baseline(tmp_path: Path) -> None:
+    """Test that the latest successful run becomes the baseline."""
+    store = HistoryStore(tmp_path / "history.sqlite")
+    assert store.baseline("machin", {}) is None
+
+    store.record([_result([1.0, 2.0, 3.0])])
+    store.record([_result([4.0, 5.0, 6.0])])
+    store.record([_result([], pi=None)])
+
+    baseline = store.baseline("machin", {})
+    assert baseline is not None
+    assert baseline["samples"] == [4.0, 5.0, 6.0]
+    assert baseline["median"] == 5.0
+    assert store.baseline("machin", {"digits": 100}) is None
+
+
+def test_compare_flags_regressions(tmp_path: Path) -> None:
+    """Test regression, noise, failure and missing-baseline outcomes."""
+    store = HistoryStore(tmp_path / "history.sqlite")
+    assert store.compare([_result([1.0] * 5)])[0]["status"] == "no baseline"
+
+    store.record([_result([1.0, 1.01, 0.99, 1.02, 0.98])])
+
+    slower = store.compare([_result([1.5, 1.52, 1.49, 1.51, 1.48])])[0]
+    assert slower["status"] == "regression"
+    assert slower["ratio"] > 1.4
+
+    noise = store.compare([_result([1.01, 1.0, 0.99, 1.02, 1.0])])[0]
+    assert noise["status"] == "ok"
+
+    assert store.compare([_result([1.5, 1.6])])[0]["status"] == "insufficient samples"
+    assert store.compare([_result([], pi=None)])[0]["status"] == "failed"
+
+
+def test_regressions_are_not_recorded(tmp_path: Path) -> None:
+    """Test that a run failing the gate does not become the next baseline."""
+    store = HistoryStore(tmp_path / "history.sqlite")
+    store.record([_result([1.0, 1.01, 0.99, 1.02, 0.98])])
+
+    slower = [_result([1.5, 1.52, 1.49, 1.51, 1.48])]
+    assert store.record(slower, store.compare(slower)) == 0
+    assert store.compare(slower)[0]["status"] == "regression"
+
+
+def test_baseline_matches_execution_mode(tmp_path: Path) -> None:
+    """Test that concurrent and legacy runs are not baselines for serial runs."""
+    path = tmp_path / "history.sqlite"
+    with closing(sqlite3.connect(path)) as connection:
+        connection.executescript(
+            "CREATE TABLE runs (id INTEGER PRIMARY KEY, recorded_at TEXT NOT NULL, "
+            "algorithm TEXT NOT NULL, params TEXT NOT NULL, version TEXT NOT NULL, "
+            "python TEXT NOT NULL, host TEXT NOT NULL, platform TEXT NOT NULL, "
+            "status TEXT NOT NULL, median REAL, samples TEXT NOT NULL, correct_digits INTEGER);"
+            f"INSERT INTO runs VALUES (1, '', 'machin', '{{}}', '', '', '{host_fingerprint()}', "
+            "'', 'ok', 1.0, '[1.0]', 15);"
+        )
+    store = HistoryStore(path)
+    assert store.baseline("machin", {}) is None
+
+    store.record([dict(_result([1.0] * 5), mode="workers", jobs=4)])
+    assert store.baseline("machin", {}) is None
+    assert store.baseline("machin", {}, mode="workers", jobs=4) is not None
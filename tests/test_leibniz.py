@@ -1,6 +1,8 @@
 """Tests for the Leibniz algorithm."""
 
 import math
+
+import pytest
 from pivalue.algorithms import leibniz
 
 
@@ -36,3 +38,45 @@ def test_leibniz_result_structure() -> None:
     assert isinstance(result["iterations"], int)
     assert isinstance(result["time_seconds"], float)
     assert isinstance(result["pi"], float)
+
+
+def test_leibniz_python_backend() -> None:
+    """Test the pure-Python fallback with a small chunk size."""
+    result = leibniz.calculate(num_iterations=1000, backend="python", chunk_size=7)
+
+    assert result["backend"] == "python"
+    assert abs(result["pi"] - math.pi) < 0.01
+
+
+def test_leibniz_numpy_backend() -> None:
+    """Test that the NumPy backend agrees with the pure-Python fallback."""
+    pytest.importorskip("numpy")
+
+    numpy_result = leibniz.calculate(num_iterations=100000, backend="numpy")
+    python_result = leibniz.calculate(num_iterations=100000, backend="python")
+
+    assert numpy_result["backend"] == "numpy"
+    assert abs(numpy_result["pi"] - python_result["pi"]) < 1e-12
+
+
+def test_leibniz_unknown_backend() -> None:
+    """Test that an unknown backend is rejected."""
+    with pytest.raises(ValueError):
+        leibniz.calculate(backend="fortran")
+
+
+def test_leibniz_workers() -> None:
+    """Test that the result does not depend on how the range is split."""
+    single = leibniz.calculate(num_iterations=200000, chunk_size=4096)
+    parallel = leibniz.calculate(num_iterations=200000, chunk_size=4096, workers=2)
+
+    assert parallel["workers"] == 2
+    assert parallel["pi"] == single["pi"]
+
+
+def test_leibniz_block_partials_are_exact() -> None:
+    """Test that a block reduces to a few partials with the same exact sum."""
+    partials = leibniz._block_partials(0, 100000, 100, "python")
+
+    assert len(partials) < 10
+    assert math.fsum(partials) == math.fsum(leibniz._chunk_sums(0, 100000, 100, "python"))
@@ -26,3 +26,18 @@ def test_liu_hui_result_structure() -> None:
     assert isinstance(result["iterations"], int)
     assert isinstance(result["time_seconds"], float)
     assert isinstance(result["pi"], float)
+
+
+def test_liu_hui_iterations_scale() -> None:
+    """Test that the polygon perimeter is scaled for any iteration count."""
+    result = liu_hui.calculate(iterations=10)
+
+    assert abs(result["pi"] - math.pi) < 1e-6
+
+
+def test_liu_hui_digits() -> None:
+    """Test the fixed-point mode past double precision."""
+    result = liu_hui.calculate(digits=50)
+
+    assert result["iterations"] == liu_hui.iterations_for_digits(50)
+    assert result["pi"] == "3.14159265358979323846264338327950288419716939937510"
@@ -34,3 +34,41 @@ def test_machin_like_formula() -> None:
     pi = machin.machin_like_formula([1, 1], [5, 239], [4, -1])
 
     assert abs(pi - math.pi) < 1e-10
+
+
+def test_machin_fixed_point_formulas() -> None:
+    """Test every built-in formula with the fixed-point arctan engine."""
+    expected = "3.14159265358979323846264338327950288419716939937510"
+
+    for formula in machin.FORMULAS:
+        result = machin.calculate(digits=50, formula=formula)
+        assert result["pi"] == expected
+        assert result["formula"] == formula
+
+
+def test_machin_like_formula_digits_workers() -> None:
+    """Test the generalized formula past double precision in worker processes."""
+    pi = machin.machin_like_formula([1, 1], [2, 3], [1, 1], digits=40, workers=2)
+
+    assert pi == "3.1415926535897932384626433832795028841971"
+
+
+def test_machin_rank_formulas() -> None:
+    """Test that the formula ranking follows the available cores."""
+    single_core = machin.rank_formulas(digits=1000000, workers=1)
+    many_cores = machin.rank_formulas(digits=1000000, workers=64)
+
+    assert [name for name, _ in single_core][0] == "stormer"
+    assert [cost for _, cost in single_core] == sorted(cost for _, cost in single_core)
+    assert many_cores[0][1] < single_core[0][1]
+    assert machin.lehmer_measure(machin.FORMULAS["machin"]) > machin.lehmer_measure(
+        machin.FORMULAS["stormer"]
+    )
+
+
+def test_machin_auto_formula() -> None:
+    """Test that formula="auto" runs the cheapest formula."""
+    result = machin.calculate(digits=50, formula="auto", workers=1)
+
+    assert result["formula"] == machin.select_formula(50, workers=1)
+    assert result["pi"] == "3.14159265358979323846264338327950288419716939937510"
@@ -1,6 +1,9 @@
 """Tests for the Mandelbrot algorithm."""
 
 import math
+from pathlib import Path
+
+import pytest
 from pivalue.algorithms import mandelbrot
 
 
@@ -36,3 +39,39 @@ def test_mandelbrot_result_structure() -> None:
     assert isinstance(result["iterations"], int)
     assert isinstance(result["time_seconds"], float)
     assert result["time_seconds"] >= 0
+
+
+def test_mandelbrot_progress() -> None:
+    """Test that progress is reported at the requested interval."""
+    seen = []
+    result = mandelbrot.calculate(digits=4, progress=seen.append, progress_interval=10000)
+
+    assert seen == [10000, 20000, 30000]
+    assert result["iterations"] == 31414
+
+    with pytest.raises(ValueError):
+        mandelbrot.calculate(digits=4, progress=seen.append, progress_interval=0)
+
+
+def test_mandelbrot_checkpoint_resume(tmp_path: Path) -> None:
+    """Test that an interrupted run resumes from its checkpoint."""
+    checkpoint = tmp_path / "mandelbrot.json"
+
+    def interrupt(iteration: int) -> None:
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        mandelbrot.calculate(
+            digits=4,
+            progress=interrupt,
+            progress_interval=20000,
+            checkpoint=str(checkpoint),
+            checkpoint_interval=20000,
+        )
+    assert checkpoint.exists()
+
+    result = mandelbrot.calculate(digits=4, checkpoint=str(checkpoint))
+
+    assert result["resumed_from"] == 20000
+    assert result["iterations"] == 31414
+    assert not checkpoint.exists()
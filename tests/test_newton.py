@@ -0,0 +1,17 @@
+"""Tests for the Newton inverse square root."""
+
+from decimal import Decimal, localcontext
+
+import pytest
+
+from pivalue.newton import inverse_sqrt
+
+
+@pytest.mark.parametrize("precision", [10, 100, 2000])
+def test_inverse_sqrt(precision: int) -> None:
+    """Test 1/√n against Decimal.sqrt at low and high precision."""
+    with localcontext() as ctx:
+        ctx.prec = precision + 10
+        for n in (2, 10005, Decimal("0.5")):
+            expected = 1 / Decimal(n).sqrt()
+            assert abs(inverse_sqrt(n, precision) - expected) < expected.scaleb(-precision + 1)
@@ -0,0 +1,46 @@
+"""Tests for the radix conversion."""
+
+import io
+import random
+
+import pytest
+
+from pivalue import radix
+
+
+def test_to_decimal_matches_str() -> None:
+    """Test exact conversion of integers larger than the leaf size."""
+    rng = random.Random(1)
+    for bits in (0, 1, 100, radix.LEAF_BITS + 1, 5 * radix.LEAF_BITS + 3):
+        n = rng.getrandbits(bits) if bits else 0
+        assert radix.to_decimal(n) == n
+        assert radix.to_decimal(-n) == -n
+
+
+def test_format_fixed_point() -> None:
+    """Test integer part, zero padding and truncation."""
+    assert radix.format_fixed_point(31415, 4) == "3.1415"
+    assert radix.format_fixed_point(31415, 4, digits=2) == "3.14"
+    assert radix.format_fixed_point(5, 3) == "0.005"
+    assert radix.format_fixed_point(31415, 4, digits=0) == "3"
+
+
+def test_write_fixed_point_in_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that chunked output equals the plain conversion."""
+    monkeypatch.setattr(radix, "CHUNK_DIGITS", 7)
+    value = 22 * 10**200 // 7
+    expected = "3." + str(value)[1:]
+
+    output = io.StringIO()
+    written = radix.write_fixed_point(value, output, scale=200)
+
+    assert output.getvalue() == expected
+    assert written == len(expected)
+
+
+def test_format_fixed_point_invalid() -> None:
+    """Test that negative values and out-of-range digits are rejected."""
+    with pytest.raises(ValueError):
+        radix.format_fixed_point(-1, 2)
+    with pytest.raises(ValueError):
+        radix.format_fixed_point(1, 2, digits=3)
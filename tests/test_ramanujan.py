@@ -37,3 +37,13 @@ def test_ramanujan_result_structure() -> None:
     assert isinstance(result["iterations"], int)
     assert isinstance(result["time_seconds"], float)
     assert isinstance(result["precision"], int)
+
+
+def test_ramanujan_iterations_from_precision() -> None:
+    """Test that the term count is derived from the requested precision."""
+    result = ramanujan.calculate(precision=1000)
+
+    # About 8 digits per term
+    assert 120 <= result["iterations"] <= 130
+    assert result["pi"].startswith("3.14159265358979323846264338327950288419716939937510")
+    assert result["pi"].endswith("216420199")  # rounded 999th decimal
@@ -0,0 +1,73 @@
+"""Tests for the reference digit store."""
+
+from pathlib import Path
+
+import pytest
+
+from pivalue.benchmark import correct_digits
+from pivalue.reference import ReferenceStore, pack_digits, unpack_digits
+
+PI_50 = "3.14159265358979323846264338327950288419716939937510"
+
+
+def test_pack_roundtrip() -> None:
+    """Test that packing and unpacking restores the digits."""
+    for digits in (b"", b"7", b"14159", b"0123456789"):
+        packed = pack_digits(digits)
+        assert len(packed) == (len(digits) + 1) // 2
+        assert unpack_digits(packed, len(digits)) == digits
+
+    with pytest.raises(ValueError):
+        pack_digits(b"12a")
+
+
+def test_store_extend_in_place(tmp_path: Path) -> None:
+    """Test creating a store and extending it from an odd digit count."""
+    store = ReferenceStore(tmp_path / "pi.bin")
+    assert len(store) == 0
+
+    store.extend(11)
+    assert store.digits(0, 11) == PI_50[2:13]
+
+    store.extend(50)
+    assert len(store) == 50
+    assert store.digits(0, 50) == PI_50[2:]
+    assert store.digits(9, 4) == PI_50[11:15]
+
+    with pytest.raises(ValueError):
+        store.digits(45, 10)
+
+
+def test_matching_digits(tmp_path: Path) -> None:
+    """Test counting the correct decimal places of approximations."""
+    store = ReferenceStore(tmp_path / "pi.bin")
+    store.extend(50)
+
+    assert store.matching_digits(PI_50) == 50
+    assert store.matching_digits("3.1416") == 3
+    assert store.matching_digits("3.14159265358") == 11
+    assert store.matching_digits(3.14) == 2
+    assert store.matching_digits("2.99") == 0
+
+
+def test_correct_digits_is_read_only(tmp_path: Path) -> None:
+    """Test that the benchmark check never extends the store."""
+    store = ReferenceStore(tmp_path / "pi.bin")
+
+    assert correct_digits(PI_50, store) is None
+    assert not store.path.exists()
+
+    store.extend(20)
+    assert correct_digits(PI_50, store) is None
+    assert correct_digits("3.1416", store) == 3
+    assert correct_digits("2.99", store) == 0
+    assert len(store) == 20
+
+
+def test_invalid_store_file(tmp_path: Path) -> None:
+    """Test that a file without the store header is rejected."""
+    path = tmp_path / "pi.txt"
+    path.write_text(PI_50)
+
+    with pytest.raises(ValueError):
+        len(ReferenceStore(path))
@@ -0,0 +1,84 @@
+"""Tests for the lazy algorithm registry."""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from pivalue import registry
+from pivalue.registry import AlgorithmInfo, AlgorithmRegistry
+
+# Startup time the command line may add to a bare interpreter, in seconds
+IMPORT_BUDGET = 0.1
+
+# Interleaved runs of each interpreter; the fastest one counts
+IMPORT_RUNS = 5
+
+
+def _python(*args: str) -> str:
+    """Run a fresh interpreter that can import pivalue and return its stderr."""
+    env = dict(os.environ, PYTHONPATH=str(Path(registry.__file__).parents[1]))
+    completed = subprocess.run(
+        [sys.executable, *args], env=env, capture_output=True, text=True, check=True
+    )
+    return completed.stderr
+
+
+def _import_report(module: str) -> str:
+    """Import a module in a fresh interpreter and return its -X importtime log."""
+    return _python("-X", "importtime", "-c", f"import {module}")
+
+
+def test_cli_import_is_light() -> None:
+    """Test that importing the command line loads no algorithm or NumPy."""
+    loaded = {
+        line.rsplit("|", 1)[-1].strip() for line in _import_report("pivalue.cli").splitlines()
+    }
+    assert not {name for name in loaded if name.startswith("pivalue.algorithms.")}
+    assert not loaded & {"numpy", "multiprocessing", "sqlite3", "importlib.metadata"}
+
+
+def test_cli_import_budget() -> None:
+    """Test that importing the command line adds little to interpreter startup."""
+    baseline, cli = [], []
+    for _ in range(IMPORT_RUNS):
+        for code, timings in (("pass", baseline), ("import pivalue.cli", cli)):
+            start = time.perf_counter()
+            _python("-c", code)
+            timings.append(time.perf_counter() - start)
+    assert min(cli) - min(baseline) < IMPORT_BUDGET
+
+
+def test_lazy_loading(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that modules load on access and entry points extend the registry."""
+    monkeypatch.setattr(
+        registry,
+        "entry_point_algorithms",
+        lambda: {"plugin": AlgorithmInfo("plugin", "plugin", "pivalue.algorithms.machin")},
+    )
+    algorithms = AlgorithmRegistry(
+        [AlgorithmInfo("agm", "Gauss-Legendre (AGM)", "pivalue.algorithms.agm")]
+    )
+    assert algorithms._loaded == {}
+    assert "agm" in algorithms and not algorithms._discovered
+    assert str(algorithms["agm"].calculate(digits=10)["pi"]).startswith("3.14159")
+
+    assert list(algorithms) == ["agm", "plugin"]
+    assert algorithms.label("plugin") == "plugin"
+    assert algorithms["plugin"].__name__ == "pivalue.algorithms.machin"
+
+    algorithms.register("custom", "pivalue.algorithms.machin:calculate", label="Custom")
+    assert algorithms.label("custom") == "Custom"
+    assert callable(algorithms["custom"])
+    del algorithms["custom"]
+    assert "custom" not in algorithms
+
+    algorithms.register("broken", "no_such_pkg.engine")
+    assert algorithms.label("broken") == "broken"
+    with pytest.raises(ImportError):
+        algorithms["broken"]
+    with pytest.raises(KeyError):
+        algorithms.info("missing")
@@ -30,3 +30,44 @@ def test_relative_prime_result_structure() -> None:
     assert isinstance(result["pi"], float)
     assert isinstance(result["probability"], float)
     assert 0 < result["probability"] < 1
+
+
+def test_relative_prime_has_common_factors() -> None:
+    """Test the gcd-based common factor check."""
+    assert relative_prime.has_common_factors(12, 18)
+    assert not relative_prime.has_common_factors(35, 64)
+
+
+def test_relative_prime_seed() -> None:
+    """Test that a seed makes runs reproducible."""
+    first = relative_prime.calculate(num_pairs=5000, seed=42, batch_size=1000)
+    second = relative_prime.calculate(num_pairs=5000, seed=42, batch_size=1000)
+
+    assert first["pi"] == second["pi"]
+    assert first["seed"] == 42
+
+
+def test_relative_prime_large_range() -> None:
+    """Test sampling from a range far beyond trial-division territory."""
+    result = relative_prime.calculate(num_pairs=20000, max_range=10**18, seed=7)
+
+    assert abs(result["pi"] - math.pi) < 0.1
+
+
+def test_relative_prime_workers() -> None:
+    """Test that worker processes draw the same reproducible streams."""
+    single = relative_prime.calculate(num_pairs=20000, seed=11, batch_size=4000)
+    parallel = relative_prime.calculate(num_pairs=20000, seed=11, batch_size=4000, workers=2)
+
+    assert parallel["workers"] == 2
+    assert parallel["pi"] == single["pi"]
+
+
+def test_relative_prime_target_stderr() -> None:
+    """Test that sampling stops once the standard error is small enough."""
+    result = relative_prime.calculate(num_pairs=10**7, seed=3, batch_size=10000, target_stderr=0.01)
+
+    assert result["iterations"] < 10**7
+    assert result["stderr"] <= 0.01
+    low, high = result["confidence_interval"]
+    assert low < result["pi"] < high
@@ -0,0 +1,34 @@
+"""Tests for the rational series binary-splitting engine."""
+
+from decimal import Decimal, localcontext
+from pivalue.series import RationalSeries, evaluate, polyval
+
+# e = Σ 1/k!, with term ratio 1/k
+E_SERIES = RationalSeries(p=(1,), q=(0, 1), a=(1,))
+
+
+def test_polyval() -> None:
+    """Test polynomial evaluation, lowest degree first."""
+    assert polyval((5, -46, 108, -72), 0) == 5
+    assert polyval((5, -46, 108, -72), 2) == 5 - 92 + 432 - 576
+    assert polyval((1,), 10) == 1
+
+
+def test_evaluate_series() -> None:
+    """Test that a simple series is summed exactly."""
+    numerator, denominator = evaluate(E_SERIES, 40)
+
+    with localcontext() as ctx:
+        ctx.prec = 40
+        assert str(numerator / denominator) == "2.718281828459045235360287471352662497757"
+
+
+def test_evaluate_series_workers() -> None:
+    """Test that worker processes give the same exact fraction."""
+    numerator, denominator = evaluate(E_SERIES, 101)
+    parallel_numerator, parallel_denominator = evaluate(E_SERIES, 101, workers=3)
+
+    with localcontext() as ctx:
+        ctx.prec = 1000
+        assert numerator * parallel_denominator == parallel_numerator * denominator
+    assert isinstance(parallel_numerator, Decimal)
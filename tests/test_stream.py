@@ -0,0 +1,53 @@
+"""Tests for the streaming digit generators."""
+
+import io
+import itertools
+from typing import Iterator, List
+
+import pytest
+
+from pivalue import stream_digits
+from pivalue.stream import write_digits
+
+PI_50 = "3.14159265358979323846264338327950288419716939937510"
+
+
+def _first(digits: Iterator[int], count: int) -> List[int]:
+    return list(itertools.islice(digits, count))
+
+
+def test_spigot_decimal_digits() -> None:
+    """Test that the spigot yields the decimal digits of Pi."""
+    digits = _first(stream_digits(), 51)
+
+    assert "".join(map(str, digits)) == PI_50.replace(".", "")
+
+
+def test_spigot_hex_digits() -> None:
+    """Test that the spigot works in other bases."""
+    assert _first(stream_digits(base=16), 8) == [3, 2, 4, 3, 15, 6, 10, 8]
+
+
+def test_chudnovsky_matches_spigot() -> None:
+    """Test that the chunked producer agrees with the spigot across chunk boundaries."""
+    chunked = _first(stream_digits("chudnovsky", chunk_digits=10), 300)
+
+    assert chunked == _first(stream_digits(), 300)
+
+
+def test_write_digits() -> None:
+    """Test writing a limited number of digits."""
+    output = io.StringIO()
+
+    assert write_digits(stream_digits(), output, limit=50) == 50
+    assert output.getvalue() == PI_50
+
+
+def test_stream_invalid_arguments() -> None:
+    """Test that unsupported algorithms and bases are rejected."""
+    with pytest.raises(ValueError):
+        stream_digits("leibniz")
+    with pytest.raises(ValueError):
+        stream_digits(base=1)
+    with pytest.raises(ValueError):
+        stream_digits("chudnovsky", base=16)
@@ -0,0 +1,51 @@
+"""Tests for empirical complexity sweeps."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from pivalue.reference import ReferenceStore
+from pivalue.sweep import export_sweep, fit_power_law, parse_range, run_sweep
+
+
+def test_parse_range() -> None:
+    """Test logarithmic and linear grids and malformed specs."""
+    assert parse_range("1e3:1e7:log") == [1000, 10000, 100000, 1000000, 10000000]
+    assert parse_range("1:100:log:3") == [1, 10, 100]
+    assert parse_range("100:1000:lin:4") == [100, 400, 700, 1000]
+    assert parse_range("5:5") == [5]
+
+    for spec in ("1e3", "1:10:cubic", "10:1", "0:10", "1:10:log:0"):
+        with pytest.raises(ValueError):
+            parse_range(spec)
+
+
+def test_fit_power_law() -> None:
+    """Test that exact power laws are recovered and unusable points skipped."""
+    xs = [1, 10, 100, 1000]
+    fit = fit_power_law(xs, [3 * x**2 for x in xs])
+    assert fit is not None
+    assert fit["exponent"] == pytest.approx(2)
+    assert fit["coefficient"] == pytest.approx(3)
+    assert fit["r_squared"] == pytest.approx(1)
+
+    assert fit_power_law([1, 10], [0, 5]) is None
+
+
+def test_run_sweep(tmp_path: Path) -> None:
+    """Test that correct digits grow linearly with Ramanujan iterations."""
+    store = ReferenceStore(tmp_path / "pi.bin")
+    report = run_sweep(
+        "ramanujan", "num_iterations", [1, 2, 4, 8], fixed={"precision": 200}, store=store
+    )
+
+    digits = [point["correct_digits"] for point in report["points"]]
+    assert digits == sorted(digits) and digits[0] >= 6
+    assert report["digits_fit"]["exponent"] == pytest.approx(1, abs=0.2)
+
+    export_sweep(report, str(tmp_path / "sweep.json"))
+    exported = json.loads((tmp_path / "sweep.json").read_text())
+    assert exported["param"] == "num_iterations"
+    export_sweep(report, str(tmp_path / "sweep.csv"))
+    assert (tmp_path / "sweep.csv").read_text().splitlines()[0].startswith("value,")
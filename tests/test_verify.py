@@ -0,0 +1,64 @@
+"""Tests for the probabilistic verification of digit files."""
+
+from pathlib import Path
+
+import pytest
+
+from pivalue.reference import ReferenceStore
+from pivalue.verify import error_bound, verify_file
+
+PI_50 = "3.14159265358979323846264338327950288419716939937510"
+PI_HEX_64 = "3.243F6A8885A308D313198A2E03707344A4093822299F31D0082EFA98EC4E6C89"
+
+
+def test_verify_hex_file(tmp_path: Path) -> None:
+    """Test that a correct hexadecimal file passes and a corrupted tail fails."""
+    path = tmp_path / "pi_hex.txt"
+    path.write_text(PI_HEX_64 + "\n")
+
+    report = verify_file(str(path), samples=4, seed=1)
+    assert report["base"] == 16
+    assert report["digits"] == 64
+    assert report["passed"]
+    assert 64 - 16 + 1 in report["positions"]
+
+    path.write_text(PI_HEX_64[:-1] + "0")
+    assert not verify_file(str(path), samples=4, seed=1)["passed"]
+
+
+def test_verify_decimal_file(tmp_path: Path) -> None:
+    """Test that decimal files pass only if the reference covers them."""
+    store = ReferenceStore(tmp_path / "pi.bin")
+    store.extend(40)
+    path = tmp_path / "pi.txt"
+    path.write_text(PI_50)
+
+    report = verify_file(str(path), samples=8, seed=2, store=store)
+    assert report["base"] == 10
+    assert report["checked_digits"] == 40
+    assert report["status"] == "unverified"
+    assert not report["passed"]
+
+    store.extend(50)
+    report = verify_file(str(path), samples=8, seed=2, store=store)
+    assert report["passed"]
+    assert 50 - 16 + 1 in report["positions"]
+
+    path.write_text(PI_50[:30] + "0" * 22)
+    assert verify_file(str(path), samples=8, seed=2, store=store)["mismatches"]
+
+
+def test_verify_invalid_file(tmp_path: Path) -> None:
+    """Test that files without the leading '3.' are rejected."""
+    path = tmp_path / "pi.txt"
+    path.write_text("2.718281828")
+
+    with pytest.raises(ValueError):
+        verify_file(str(path))
+
+
+def test_error_bound() -> None:
+    """Test the bound shrinks with more samples."""
+    assert error_bound(0, 0.95) == 1.0
+    assert error_bound(100, 0.95) == pytest.approx(0.0295, abs=1e-4)
+    assert error_bound(1000, 0.95) < error_bound(100, 0.95)